@@ -1,9 +1,11 @@
+import logging
 from time import perf_counter
 
 from django.template import Context, Template
 
 from django_components import Component, registry, types
 from django_components.dependencies import CSS_DEPENDENCY_PLACEHOLDER, JS_DEPENDENCY_PLACEHOLDER
+from django_components.util.logger import logger
 from tests.django_test_setup import *  # NOQA
 from tests.testutils import BaseTestCase, create_and_process_template_response
 
@@ -116,6 +118,34 @@ class RenderBenchmarks(BaseTestCase):
 
         print(f"{self.timed_loop(lambda: template.render(Context({})))} ms per iteration")
 
+    def test_render_time_with_tracing(self):
+        template_str: types.django_html = """
+            {% load component_tags %}
+            {% component 'test_component' %}
+                {% slot "header" %}
+                    {% component 'inner_component' variable='foo' %}{% endcomponent %}
+                {% endslot %}
+            {% endcomponent %}
+        """
+        template = Template(template_str)
+
+        orig_level = logger.level
+        handler = logging.NullHandler()
+        logger.addHandler(handler)
+        try:
+            logger.setLevel(logging.DEBUG)
+            without_tracing = self.timed_loop(lambda: template.render(Context({})))
+            logger.setLevel(5)
+            with_tracing = self.timed_loop(lambda: template.render(Context({})))
+        finally:
+            logger.setLevel(orig_level)
+            logger.removeHandler(handler)
+
+        print("Small component tracing test")
+        print(f"Tracing enabled\t\t{with_tracing:.3f} ms per iteration")
+        print(f"Tracing disabled\t{without_tracing:.3f} ms per iteration")
+        print(f"Overhead of tracing {100 * (with_tracing - without_tracing) / without_tracing:.2f}%")
+
     def test_middleware_time_with_dependency_for_small_page(self):
         template_str: types.django_html = """
             {% load component_tags %}
@@ -0,0 +1,167 @@
+# NOTE: This file is more of a playground than a proper test
+#
+# Compares the previous `snapshot_context()`, which copied each Context layer on each call,
+# and shared the layers that were already copied, with the current one, which copies
+# the layers of a plain Context, and shares the layers of a snapshot as copy-on-write.
+#
+# Simulates a component rendered inside a `{% for %}` loop, where a snapshot
+# of the Context is taken for each iteration. The loop is either in a plain template
+# (plain Context), or in the template of another component (the Context is a snapshot).
+#
+# Run from the project root with:
+# ```sh
+# PYTHONPATH=src python -m benchmarks.context_snapshot
+# ```
+
+import copy
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from django.conf import settings
+from django.template import Context
+
+from django_components.util.context import _copy_block_context, snapshot_context
+
+settings.configure()
+
+
+# Previous implementation
+class PrevCopiedDict(dict):
+    pass
+
+
+def prev_snapshot_context(context: Context) -> Context:
+    context_copy = copy.copy(context)
+
+    dicts_with_copied_forloops: List[PrevCopiedDict] = []
+    for ctx_dict_index in reversed(range(len(context.dicts))):
+        ctx_dict = context.dicts[ctx_dict_index]
+
+        if isinstance(ctx_dict, PrevCopiedDict):
+            dicts_with_copied_forloops = context.dicts[: ctx_dict_index + 1] + dicts_with_copied_forloops
+            break
+
+        ctx_dict_copy = PrevCopiedDict(ctx_dict)
+        if "forloop" in ctx_dict:
+            ctx_dict_copy["forloop"] = ctx_dict["forloop"].copy()
+
+            curr_forloop = ctx_dict_copy["forloop"]
+            while curr_forloop is not None:
+                curr_forloop["parentloop"] = curr_forloop["parentloop"].copy()
+                if "parentloop" in curr_forloop["parentloop"]:
+                    curr_forloop = curr_forloop["parentloop"]
+                else:
+                    break
+
+        dicts_with_copied_forloops.insert(0, ctx_dict_copy)
+
+    context_copy.dicts = dicts_with_copied_forloops
+
+    render_ctx_copies: List[PrevCopiedDict] = []
+    for render_ctx_dict_index in reversed(range(len(context.render_context.dicts))):
+        render_ctx_dict = context.render_context.dicts[render_ctx_dict_index]
+
+        if isinstance(render_ctx_dict, PrevCopiedDict):
+            render_ctx_copies = context.render_context.dicts[: render_ctx_dict_index + 1] + render_ctx_copies
+            break
+
+        render_ctx_dict_copy = PrevCopiedDict(render_ctx_dict)
+        if "block_context" in render_ctx_dict:
+            render_ctx_dict_copy["block_context"] = _copy_block_context(render_ctx_dict["block_context"])
+
+        if "extends_context" in render_ctx_dict:
+            render_ctx_dict_copy["extends_context"] = render_ctx_dict["extends_context"].copy()
+
+        render_ctx_dict_copy["_djc_snapshot"] = True
+        render_ctx_copies.insert(0, render_ctx_dict_copy)
+
+    context_copy.render_context.dicts = render_ctx_copies
+    return context_copy
+
+
+def make_context(
+    snapshot_fn: Callable[[Context], Context], num_layers: int, keys_per_layer: int, in_component: bool
+) -> Context:
+    ctx = Context()
+    for layer_index in range(num_layers):
+        ctx.push({f"var_{layer_index}_{key_index}": key_index for key_index in range(keys_per_layer)})
+    # Inside a component's template, the Context is a snapshot
+    if in_component:
+        ctx = snapshot_fn(ctx)
+    return ctx
+
+
+def run_loop(snapshot_fn: Callable[[Context], Context], ctx: Context, num_rows: int) -> List[Context]:
+    # Same as what `ForNode` does - one layer for the loop, with forloop dict modified in place
+    snapshots = []
+    loop_dict: Dict[str, Any] = {"parentloop": {}}
+    with ctx.push(forloop=loop_dict):
+        for index in range(num_rows):
+            loop_dict["counter0"] = index
+            loop_dict["counter"] = index + 1
+            ctx["row"] = index
+            # Component's own data is pushed on top
+            with ctx.update({"component_data": index}):
+                snapshots.append(snapshot_fn(ctx))
+    return snapshots
+
+
+def measure_allocations(
+    snapshot_fn: Callable[[Context], Context], num_layers: int, keys_per_layer: int, num_rows: int, in_component: bool
+) -> Tuple[int, int, int]:
+    ctx = make_context(snapshot_fn, num_layers, keys_per_layer, in_component)
+    tracemalloc.start()
+    snapshots = run_loop(snapshot_fn, ctx, num_rows)
+    size, peak = tracemalloc.get_traced_memory()
+    stats = tracemalloc.take_snapshot().statistics("filename")
+    tracemalloc.stop()
+    num_blocks = sum(stat.count for stat in stats)
+    del snapshots
+    return num_blocks, size, peak
+
+
+def run_benchmark(num_layers: int, keys_per_layer: int = 20, num_rows: int = 500, num_iterations: int = 100) -> None:
+    for in_component in (False, True):
+        prev_blocks, prev_size, prev_peak = measure_allocations(
+            prev_snapshot_context, num_layers, keys_per_layer, num_rows, in_component
+        )
+        curr_blocks, curr_size, curr_peak = measure_allocations(
+            snapshot_context, num_layers, keys_per_layer, num_rows, in_component
+        )
+
+        prev_time = timeit.timeit(
+            lambda: run_loop(
+                prev_snapshot_context,
+                make_context(prev_snapshot_context, num_layers, keys_per_layer, in_component),
+                num_rows,
+            ),
+            number=num_iterations,
+        )
+        curr_time = timeit.timeit(
+            lambda: run_loop(
+                snapshot_context,
+                make_context(snapshot_context, num_layers, keys_per_layer, in_component),
+                num_rows,
+            ),
+            number=num_iterations,
+        )
+
+        print(f"\nlayers={num_layers}, keys per layer={keys_per_layer}, rows={num_rows}, in component={in_component}")
+        print(
+            f"Previous: {prev_blocks} allocated blocks, {prev_size / 1024:.1f} KiB ({prev_peak / 1024:.1f} KiB peak)"
+        )
+        print(
+            f"Current:  {curr_blocks} allocated blocks, {curr_size / 1024:.1f} KiB ({curr_peak / 1024:.1f} KiB peak)"
+        )
+        print(f"Previous: {prev_time:.6f} seconds")
+        print(f"Current:  {curr_time:.6f} seconds")
+        faster = "faster" if curr_time < prev_time else "slower"
+        print(f"Current is {(prev_time / curr_time):.2f}x {faster}")
+
+
+if __name__ == "__main__":
+    run_benchmark(num_layers=2)
+    run_benchmark(num_layers=5)
+    run_benchmark(num_layers=10)
+    run_benchmark(num_layers=5, keys_per_layer=200)
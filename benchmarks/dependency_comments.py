@@ -0,0 +1,93 @@
+# NOTE: This file is more of a playground than a proper test
+#
+# Compares inserting a `<!-- _RENDERED ... -->` comment for each rendered component instance,
+# as was done previously, with inserting a single comment for each component class
+# (and JS / CSS variables) within the same root render.
+#
+# Run from the project root with:
+# ```sh
+# PYTHONPATH=src python -m benchmarks.dependency_comments
+# ```
+
+import timeit
+from unittest.mock import patch
+
+from django_components import Component, registry, render_dependencies, types
+from django_components.dependencies import insert_component_dependencies_comment
+from tests.django_test_setup import setup_test_config
+
+setup_test_config({"autodiscover": False})
+
+NUM_INSTANCES = 10_000
+
+
+class Card(Component):
+    template: types.django_html = """
+        <div class="card">{{ index }}</div>
+    """
+    css: types.css = ".card { color: red; }"
+    js: types.js = 'console.log("card");'
+
+    def get_context_data(self, index):
+        return {"index": index}
+
+
+class Page(Component):
+    template: types.django_html = """
+        {% load component_tags %}
+        <html>
+            <head></head>
+            <body>
+                {% for index in indices %}
+                    {% component "card" index=index / %}
+                {% endfor %}
+            </body>
+        </html>
+    """
+
+    def get_context_data(self, num_instances):
+        return {"indices": range(num_instances)}
+
+
+# Previous implementation
+def insert_comment_per_instance(*args, announced=None, **kwargs):
+    return insert_component_dependencies_comment(*args, **kwargs)
+
+
+def run_benchmark(num_instances: int, num_iterations: int) -> None:
+    def render_page() -> str:
+        return Page.render(kwargs={"num_instances": num_instances}, render_dependencies=False)
+
+    with patch("django_components.component.insert_component_dependencies_comment", insert_comment_per_instance):
+        html_per_instance = render_page()
+        per_instance_render_time = timeit.timeit(render_page, number=num_iterations)
+    html_per_class = render_page()
+    per_class_render_time = timeit.timeit(render_page, number=num_iterations)
+
+    # Sanity check
+    assert html_per_instance.count("_RENDERED") == num_instances + 1
+    assert html_per_class.count("_RENDERED") == 2
+    assert render_dependencies(html_per_instance).count("<style>") == 1
+    assert render_dependencies(html_per_class).count("<style>") == 1
+
+    per_instance_deps_time = timeit.timeit(lambda: render_dependencies(html_per_instance), number=num_iterations)
+    per_class_deps_time = timeit.timeit(lambda: render_dependencies(html_per_class), number=num_iterations)
+
+    print(f"\nPage with {num_instances} instances of the same component ({num_iterations} iterations)")
+    print(f"HTML size, comment per instance: {len(html_per_instance)} characters")
+    print(f"HTML size, comment per class:    {len(html_per_class)} characters")
+
+    print("\nComponent.render(render_dependencies=False)")
+    print(f"Comment per instance: {per_instance_render_time:.6f} seconds")
+    print(f"Comment per class:    {per_class_render_time:.6f} seconds")
+    print(f"Comment per class is {(per_instance_render_time / per_class_render_time):.2f}x faster")
+
+    print("\nrender_dependencies()")
+    print(f"Comment per instance: {per_instance_deps_time:.6f} seconds")
+    print(f"Comment per class:    {per_class_deps_time:.6f} seconds")
+    print(f"Comment per class is {(per_instance_deps_time / per_class_deps_time):.2f}x faster")
+
+
+if __name__ == "__main__":
+    registry.register("card", Card)
+    run_benchmark(NUM_INSTANCES, num_iterations=5)
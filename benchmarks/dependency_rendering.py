@@ -0,0 +1,201 @@
+# NOTE: This file is more of a playground than a proper test
+#
+# Compares the previous implementation of `render_dependencies()`, which ran several regex passes
+# over the HTML and converted it between `bytes` and `str`, with the single-pass implementation.
+#
+# Run from the project root with:
+# ```sh
+# PYTHONPATH=src python -m benchmarks.dependency_rendering
+# ```
+
+import re
+import timeit
+import tracemalloc
+from typing import Callable, List, Optional, Tuple
+
+from django.template import Context
+from django.template.loader import get_template
+
+from django_components import Component, registry, render_dependencies, types
+from django_components.dependencies import (
+    CSS_PLACEHOLDER_NAME,
+    JS_PLACEHOLDER_NAME,
+    MAYBE_COMP_CSS_ID,
+    MAYBE_COMP_ID,
+    ComponentDependencies,
+    _parse_dependencies_comment,
+    _process_dep_declarations,
+)
+from tests.django_test_setup import setup_test_config
+
+setup_test_config({"autodiscover": False})
+
+# Previous implementation
+COMPONENT_COMMENT_REGEX = re.compile(rb"<!--\s+_RENDERED\s+(?P<data>[\w\-,/]+?)\s+-->")
+PLACEHOLDER_REGEX = re.compile(
+    r"{css_placeholder}|{js_placeholder}".format(
+        css_placeholder=f'<link name="{CSS_PLACEHOLDER_NAME}"{MAYBE_COMP_CSS_ID}{MAYBE_COMP_ID}/?>',
+        js_placeholder=f'<script name="{JS_PLACEHOLDER_NAME}"{MAYBE_COMP_CSS_ID}{MAYBE_COMP_ID}></script>',
+    ).encode()
+)
+head_or_body_end_tag_re = re.compile(r"<\/(?:head|body)\s*>", re.DOTALL)
+
+
+def _insert_js_css_to_default_locations(
+    html_content: str,
+    js_content: Optional[str],
+    css_content: Optional[str],
+) -> Optional[str]:
+    if css_content is None and js_content is None:
+        return None
+
+    first_end_head_tag_index = None
+    last_end_body_tag_index = None
+    for match in head_or_body_end_tag_re.finditer(html_content):
+        tag_name = match[0][2:6]
+        if tag_name == "head":
+            if css_content is not None and first_end_head_tag_index is None:
+                first_end_head_tag_index = match.start()
+        elif tag_name == "body":
+            if js_content is not None:
+                last_end_body_tag_index = match.start()
+
+    did_modify_html = False
+    index_offset = 0
+    updated_html = html_content
+    if css_content is not None and first_end_head_tag_index is not None:
+        updated_html = updated_html[:first_end_head_tag_index] + css_content + updated_html[first_end_head_tag_index:]
+        index_offset = len(css_content)
+        did_modify_html = True
+
+    if js_content is not None and last_end_body_tag_index is not None:
+        js_index = last_end_body_tag_index + index_offset
+        updated_html = updated_html[:js_index] + js_content + updated_html[js_index:]
+        did_modify_html = True
+
+    return updated_html if did_modify_html else None
+
+
+class BreadcrumbComponent(Component):
+    template: types.django_html = """
+        <nav class="breadcrumbs">
+            <ol>
+                {% for label, url in links %}
+                    <li><a href="{{ url }}">{{ label }}</a></li>
+                {% endfor %}
+            </ol>
+        </nav>
+    """
+
+    css: types.css = """
+        .breadcrumbs { display: flex; }
+    """
+
+    js: types.js = """
+        console.log("breadcrumbs");
+    """
+
+    def get_context_data(self, items):
+        return {"links": [(f"Page {index}", f"/page/{index}") for index in range(items)]}
+
+
+def multipass_render_dependencies(content: str) -> str:
+    content_ = content.encode()
+
+    all_parts: List[ComponentDependencies] = []
+
+    def on_comment_match(match: "re.Match[bytes]") -> bytes:
+        all_parts.append(_parse_dependencies_comment(match.group("data").decode()))
+        return b""
+
+    content_ = COMPONENT_COMMENT_REGEX.sub(on_comment_match, content_)
+    js_dependencies, css_dependencies = _process_dep_declarations(all_parts, "document")
+    js_dependencies_b = js_dependencies.encode()
+    css_dependencies_b = css_dependencies.encode()
+
+    did_find_js_placeholder = False
+    did_find_css_placeholder = False
+
+    def on_replace_match(match: "re.Match[bytes]") -> bytes:
+        nonlocal did_find_css_placeholder
+        nonlocal did_find_js_placeholder
+        if CSS_PLACEHOLDER_NAME.encode() in match[0]:
+            did_find_css_placeholder = True
+            return css_dependencies_b
+        did_find_js_placeholder = True
+        return js_dependencies_b
+
+    content_ = PLACEHOLDER_REGEX.sub(on_replace_match, content_)
+
+    if not did_find_js_placeholder or not did_find_css_placeholder:
+        maybe_transformed = _insert_js_css_to_default_locations(
+            content_.decode(),
+            css_content=None if did_find_css_placeholder else css_dependencies,
+            js_content=None if did_find_js_placeholder else js_dependencies,
+        )
+        if maybe_transformed is not None:
+            content_ = maybe_transformed.encode()
+
+    return content_.decode()
+
+
+def single_pass_render_dependencies(content: str) -> str:
+    return render_dependencies(content)
+
+
+def gen_page(num_copies: int, with_placeholders: bool) -> str:
+    """Render `mdn_complete_page.html`, and repeat its content to make the page larger."""
+    template = get_template("mdn_complete_page.html")
+    html = template.render(Context({}).flatten())
+    if not with_placeholders:
+        html = re.sub(r'<link name="CSS_PLACEHOLDER"[^>]*>|<script name="JS_PLACEHOLDER"[^>]*></script>', "", html)
+    return html * num_copies
+
+
+def measure_peak_memory(func: Callable[[str], str], html: str) -> int:
+    tracemalloc.start()
+    try:
+        func(html)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_benchmark(html: str, num_iterations: int) -> Tuple[float, float, int, int]:
+    # Sanity check
+    assert multipass_render_dependencies(html) == single_pass_render_dependencies(html)
+
+    multipass_time = timeit.timeit(lambda: multipass_render_dependencies(html), number=num_iterations)
+    single_pass_time = timeit.timeit(lambda: single_pass_render_dependencies(html), number=num_iterations)
+    multipass_peak = measure_peak_memory(multipass_render_dependencies, html)
+    single_pass_peak = measure_peak_memory(single_pass_render_dependencies, html)
+    return multipass_time, single_pass_time, multipass_peak, single_pass_peak
+
+
+def print_benchmark_results(
+    name: str,
+    html: str,
+    num_iterations: int,
+    results: Tuple[float, float, int, int],
+) -> None:
+    multipass_time, single_pass_time, multipass_peak, single_pass_peak = results
+    print(f"\n{name} ({len(html) / 1024 / 1024:.2f} MiB)")
+    print(f"Iterations: {num_iterations}")
+    print(f"Multi-pass:  {multipass_time:.6f} seconds, peak memory {multipass_peak / 1024 / 1024:.2f} MiB")
+    print(f"Single pass: {single_pass_time:.6f} seconds, peak memory {single_pass_peak / 1024 / 1024:.2f} MiB")
+    print(f"Single pass is {(multipass_time / single_pass_time):.2f}x faster")
+
+
+if __name__ == "__main__":
+    registry.register("breadcrumb_component", BreadcrumbComponent)
+
+    for with_placeholders in [True, False]:
+        for num_copies in [1, 16]:
+            num_iterations = 50 if num_copies == 1 else 5
+            html = gen_page(num_copies, with_placeholders)
+            results = run_benchmark(html, num_iterations)
+            name = f"mdn_complete_page.html x{num_copies}, " + (
+                "with placeholders" if with_placeholders else "inserted into <head> and <body>"
+            )
+            print_benchmark_results(name, html, num_iterations, results)
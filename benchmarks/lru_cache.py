@@ -0,0 +1,124 @@
+# NOTE: This file is more of a playground than a proper test
+#
+# Compares the previous linked-list-based `LRUCache` with the current `OrderedDict`-based one.
+#
+# Run from the project root with:
+# ```sh
+# PYTHONPATH=src python -m benchmarks.lru_cache
+# ```
+
+import random
+import timeit
+from collections.abc import Hashable
+from typing import Dict, Generic, List, Optional, Tuple, TypeVar, cast
+
+from django_components.util.cache import LRUCache
+
+T = TypeVar("T")
+
+
+# Previous implementation
+class CacheNode(Generic[T]):
+    def __init__(self, key: Hashable, value: T):
+        self.key = key
+        self.value = value
+        self.prev: Optional["CacheNode"] = None
+        self.next: Optional["CacheNode"] = None
+
+
+class LinkedListLRUCache(Generic[T]):
+    def __init__(self, maxsize: Optional[int] = None):
+        self.maxsize = maxsize
+        self.cache: Dict[Hashable, CacheNode[T]] = {}
+        self.head = CacheNode[T]("", cast(T, None))
+        self.tail = CacheNode[T]("", cast(T, None))
+        self.head.next = self.tail
+        self.tail.prev = self.head
+
+    def get(self, key: Hashable) -> Optional[T]:
+        if key in self.cache:
+            node = self.cache[key]
+            self._remove(node)
+            self._add_to_front(node)
+            return node.value
+        else:
+            return None
+
+    def set(self, key: Hashable, value: T) -> None:
+        if self.maxsize is not None and self.maxsize <= 0:
+            return
+
+        if key in self.cache:
+            node = self.cache[key]
+            node.value = value
+            self._remove(node)
+            self._add_to_front(node)
+        else:
+            if self.maxsize is not None and len(self.cache) >= self.maxsize:
+                lru_node = self.tail.prev
+                if lru_node is None:
+                    raise RuntimeError("LRUCache: Tail node is None")
+                self._remove(lru_node)
+                del self.cache[lru_node.key]
+
+            new_node = CacheNode[T](key, value)
+            self.cache[key] = new_node
+            self._add_to_front(new_node)
+
+    def _remove(self, node: CacheNode) -> None:
+        prev_node = node.prev
+        next_node = node.next
+        if prev_node is not None:
+            prev_node.next = next_node
+        if next_node is not None:
+            next_node.prev = prev_node
+
+    def _add_to_front(self, node: CacheNode) -> None:
+        node.next = self.head.next
+        node.prev = self.head
+        if self.head.next:
+            self.head.next.prev = node
+            self.head.next = node
+
+
+def gen_keys(num_keys: int, num_distinct: int) -> List[Tuple[str, str, str]]:
+    """
+    Keys similar to those used by `cached_template()`. Keys are picked with a skewed
+    distribution, so that some templates are used much more often than others.
+    """
+    rand = random.Random(0)
+    distinct = [("django.template.base.Template", f"<div>{{{{ var_{i} }}}}</div>", "") for i in range(num_distinct)]
+    return [distinct[min(int(rand.expovariate(5 / num_distinct)), num_distinct - 1)] for _ in range(num_keys)]
+
+
+def run_workload(cache, keys: List[Tuple[str, str, str]]) -> None:
+    # Same access pattern as `cached_template()` - get, and set on miss
+    for key in keys:
+        if cache.get(key) is None:
+            cache.set(key, key)
+
+
+def run_benchmark(maxsize: int, num_distinct: int, num_keys: int = 100_000, num_iterations: int = 5):
+    keys = gen_keys(num_keys, num_distinct)
+
+    linked_list_time = timeit.timeit(lambda: run_workload(LinkedListLRUCache(maxsize), keys), number=num_iterations)
+    ordered_dict_time = timeit.timeit(lambda: run_workload(LRUCache(maxsize), keys), number=num_iterations)
+
+    cache = LRUCache[Tuple[str, str, str]](maxsize)
+    run_workload(cache, keys)
+    stats = cache.stats()
+
+    print(f"\nmaxsize={maxsize}, distinct keys={num_distinct}, lookups={num_keys}")
+    print(f"Hits: {stats.hits}, misses: {stats.misses}, evictions: {stats.evictions}")
+    print(f"Linked list:  {linked_list_time:.6f} seconds")
+    print(f"OrderedDict:  {ordered_dict_time:.6f} seconds")
+    faster = "faster" if ordered_dict_time < linked_list_time else "slower"
+    print(f"OrderedDict is {(linked_list_time / ordered_dict_time):.2f}x {faster}")
+
+
+if __name__ == "__main__":
+    # Everything fits in the cache
+    run_benchmark(maxsize=128, num_distinct=100)
+    # Cache is too small, many evictions
+    run_benchmark(maxsize=128, num_distinct=1_000)
+    run_benchmark(maxsize=1_000, num_distinct=10_000)
@@ -0,0 +1,138 @@
+# NOTE: This file is more of a playground than a proper test
+#
+# Compares the previous regex-based search for `<template djc-render-id="..."></template>` placeholders
+# with the `str.find()`-based search in `_find_placeholders()`.
+#
+# Run from the project root with:
+# ```sh
+# PYTHONPATH=src python -m benchmarks.placeholder_scanning
+# ```
+
+import re
+import timeit
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.template import Context, Template
+
+from django_components import Component, registry, types
+from django_components.perfutil import component as perfutil_component
+from tests.django_test_setup import setup_test_config
+
+setup_test_config({"autodiscover": False})
+
+# Previous implementation
+nested_comp_pattern = re.compile(r'<template [^>]*?djc-render-id="\w{6}"[^>]*?></template>')
+render_id_pattern = re.compile(r'djc-render-id="(?P<render_id>\w{6})"')
+
+
+def regex_find_placeholders(content: str) -> List[Tuple[int, int, str]]:
+    placeholders: List[Tuple[int, int, str]] = []
+    for match in nested_comp_pattern.finditer(content):
+        render_id_match = render_id_pattern.search(match[0])
+        if render_id_match is None:
+            raise ValueError(f"No placeholder ID found in {match[0]}")
+        placeholders.append((match.start(), match.end(), render_id_match.group("render_id")))
+    return placeholders
+
+
+find_placeholders = perfutil_component._find_placeholders
+
+
+def gen_html(num_placeholders: int) -> str:
+    """HTML of a component that renders `num_placeholders` child components."""
+    parts = []
+    for index in range(num_placeholders):
+        parts.append(f'<div class="row"><span>Row {index}</span>')
+        parts.append(f'<template djc-render-id="{index:06x}" data-djc-id-{index:06x}=""></template></div>')
+    return "<main>" + "".join(parts) + "</main>"
+
+
+def run_scan_benchmark(num_placeholders: int, num_iterations: int = 50) -> Tuple[float, float]:
+    html = gen_html(num_placeholders)
+    # Sanity check
+    assert regex_find_placeholders(html) == find_placeholders(html)
+
+    regex_time = timeit.timeit(lambda: regex_find_placeholders(html), number=num_iterations)
+    find_time = timeit.timeit(lambda: find_placeholders(html), number=num_iterations)
+    return regex_time, find_time
+
+
+class Item(Component):
+    template: types.django_html = """
+        <div class="item">
+            <span>{{ index }}</span>
+        </div>
+    """
+
+    def get_context_data(self, index: int):
+        return {"index": index}
+
+
+class Nested(Component):
+    template: types.django_html = """
+        {% load component_tags %}
+        <div class="level">
+            {% if depth %}
+                {% component "nested" depth=depth|add:"-1" / %}
+            {% endif %}
+        </div>
+    """
+
+    def get_context_data(self, depth: int):
+        return {"depth": depth}
+
+
+def gen_render(template_str: str, context_data: Optional[Dict] = None) -> Callable[[], str]:
+    template = Template(template_str)
+    return lambda: template.render(Context(context_data or {}))
+
+
+def run_render_benchmark(render: Callable[[], str], num_iterations: int = 3) -> Tuple[float, float]:
+    perfutil_component._find_placeholders = regex_find_placeholders
+    try:
+        regex_time = timeit.timeit(render, number=num_iterations)
+    finally:
+        perfutil_component._find_placeholders = find_placeholders
+
+    find_time = timeit.timeit(render, number=num_iterations)
+    return regex_time, find_time
+
+
+def print_benchmark_results(name: str, regex_time: float, find_time: float, num_iterations: int) -> None:
+    print(f"\n{name}")
+    print(f"Iterations: {num_iterations}")
+    print(f"Regex scan: {regex_time:.6f} seconds")
+    print(f"Find scan:  {find_time:.6f} seconds")
+    print(f"Find scan is {(regex_time / find_time):.2f}x {'faster' if find_time < regex_time else 'slower'}")
+
+
+if __name__ == "__main__":
+    registry.register("item", Item)
+    registry.register("nested", Nested)
+
+    for num_components in [1_000, 10_000]:
+        num_iterations = 50
+        regex_time, find_time = run_scan_benchmark(num_components, num_iterations)
+        print_benchmark_results(f"Scan HTML with {num_components} placeholders", regex_time, find_time, num_iterations)
+
+    for num_components in [1_000, 10_000]:
+        num_iterations = 3
+        render = gen_render(
+            """
+            {% load component_tags %}
+            {% for index in indices %}
+                {% component "item" index=index / %}
+            {% endfor %}
+            """,
+            {"indices": range(num_components)},
+        )
+        regex_time, find_time = run_render_benchmark(render, num_iterations)
+        print_benchmark_results(f"Render {num_components} sibling components", regex_time, find_time, num_iterations)
+
+    # NOTE: With deeply nested components, the render time is dominated by copying of the ever-growing
+    #       Context, so 10k nested components take too long to be practical here.
+    for depth in [100, 1_000]:
+        num_iterations = 3
+        render = gen_render(f'{{% load component_tags %}}{{% component "nested" depth={depth} / %}}')
+        regex_time, find_time = run_render_benchmark(render, num_iterations)
+        print_benchmark_results(f"Render {depth} nested components", regex_time, find_time, num_iterations)
@@ -0,0 +1,121 @@
+# NOTE: This file is more of a playground than a proper test
+#
+# Compares the previous implementation of `get_script_url()`, which called Django's `reverse()`
+# for each URL, with the current one, which resolves the URLs once and then uses string formatting.
+#
+# Run from the project root with:
+# ```sh
+# PYTHONPATH=src python -m benchmarks.script_urls
+# ```
+
+import timeit
+from typing import List, Optional, Type
+from unittest.mock import patch
+
+from django.urls import reverse
+
+from django_components import Component, render_dependencies
+from django_components.dependencies import (
+    CACHE_ENDPOINT_NAME,
+    CONTENT_HASH_PARAM,
+    ScriptType,
+    _gen_content_hash,
+    get_script_content,
+    get_script_url,
+)
+from tests.django_test_setup import setup_test_config
+
+setup_test_config({"autodiscover": False})
+
+NUM_COMPONENTS = 200
+
+
+# Previous implementation
+def reverse_get_script_url(
+    script_type: ScriptType,
+    comp_cls: Type[Component],
+    input_hash: Optional[str],
+) -> str:
+    url = reverse(
+        CACHE_ENDPOINT_NAME,
+        kwargs={
+            "comp_cls_hash": comp_cls._class_hash,
+            "script_type": script_type,
+            **({"input_hash": input_hash} if input_hash is not None else {}),
+        },
+    )
+
+    content = get_script_content(script_type, comp_cls, input_hash)
+    if content is not None:
+        url += f"?{CONTENT_HASH_PARAM}={_gen_content_hash(content)}"
+    return url
+
+
+def gen_components(num_components: int) -> List[Type[Component]]:
+    def get_context_data(self, index):
+        return {"index": index}
+
+    # Each component instance has its own JS variables, so the URLs
+    # of the variables are generated on each call to `render_dependencies()`.
+    def get_js_data(self, index):
+        return {"index": index}
+
+    components: List[Type[Component]] = []
+    for index in range(num_components):
+        # NOTE: Component's hash is derived from its name, so each class must have a different name
+        comp_cls = type(
+            f"PageComponent{index}",
+            (Component,),
+            {
+                "template": '<div class="item">{{ index }}</div>',
+                "css": f".item-{index} {{ color: red; }}",
+                "js": f'console.log("item {index}");',
+                "get_context_data": get_context_data,
+                "get_js_data": get_js_data,
+            },
+        )
+        components.append(comp_cls)
+    return components
+
+
+def gen_page(components: List[Type[Component]]) -> str:
+    return "".join(
+        comp_cls.render(kwargs={"index": index}, render_dependencies=False)
+        for index, comp_cls in enumerate(components)
+    )
+
+
+def run_benchmark(components: List[Type[Component]], html: str, num_iterations: int) -> None:
+    input_hashes = [f"{index:06x}" for index in range(len(components))]
+
+    def call_get_script_url(func) -> None:
+        for comp_cls, input_hash in zip(components, input_hashes):
+            func("js", comp_cls, None)
+            func("css", comp_cls, None)
+            func("js", comp_cls, input_hash)
+
+    # Sanity check
+    for comp_cls, input_hash in zip(components, input_hashes):
+        assert reverse_get_script_url("js", comp_cls, input_hash) == get_script_url("js", comp_cls, input_hash)
+
+    reverse_time = timeit.timeit(lambda: call_get_script_url(reverse_get_script_url), number=num_iterations)
+    template_time = timeit.timeit(lambda: call_get_script_url(get_script_url), number=num_iterations)
+    print(f"\nget_script_url() x {len(components) * 3} ({num_iterations} iterations)")
+    print(f"reverse():         {reverse_time:.6f} seconds")
+    print(f"String formatting: {template_time:.6f} seconds")
+    print(f"String formatting is {(reverse_time / template_time):.2f}x faster")
+
+    with patch("django_components.dependencies.get_script_url", reverse_get_script_url):
+        assert render_dependencies(html, type="fragment")
+        reverse_time = timeit.timeit(lambda: render_dependencies(html, type="fragment"), number=num_iterations)
+    template_time = timeit.timeit(lambda: render_dependencies(html, type="fragment"), number=num_iterations)
+    print(f"\nrender_dependencies() of a fragment with {len(components)} components ({num_iterations} iterations)")
+    print(f"reverse():         {reverse_time:.6f} seconds")
+    print(f"String formatting: {template_time:.6f} seconds")
+    print(f"String formatting is {(reverse_time / template_time):.2f}x faster")
+
+
+if __name__ == "__main__":
+    components = gen_components(NUM_COMPONENTS)
+    html = gen_page(components)
+    run_benchmark(components, html, num_iterations=50)
@@ -0,0 +1,41 @@
+# NOTE: This file is more of a playground than a proper test
+#
+# Measures how long it takes `parse_tag()` to parse tags of various shapes and lengths.
+#
+# Run from the project root with:
+# ```sh
+# PYTHONPATH=src python -m benchmarks.tag_parser
+# ```
+
+import timeit
+
+from django_components.util.tag_parser import parse_tag
+from tests.django_test_setup import setup_test_config
+
+setup_test_config({"autodiscover": False})
+
+TAGS = {
+    "short": "component 'my_comp' key=val",
+    "kwargs": (
+        "component 'table' rows=rows headers=headers page=page|default:1 per_page=20 "
+        'title=_("Orders") sortable=True attrs:class="table table-striped" attrs:@click.stop="select"'
+    ),
+    "html_attrs": 'html_attrs attrs defaults={"class": "btn", "type": "button", "data-id": item.id} class=extra_class',
+    "nested": (
+        "component 'chart' data={'labels': [1, 2, 3], 'series': [{'name': 'A', 'values': values|slice:':3'}]} "
+        "options={**defaults, 'legend': {'position': 'bottom', 'align': 'start'}} ...attrs"
+    ),
+    "long_string": "component 'card' text=\"" + "Lorem ipsum dolor sit amet, consectetur adipiscing. " * 20 + '"',
+}
+
+
+def run_benchmark(number: int) -> None:
+    for name, tag in TAGS.items():
+        parse_time = timeit.timeit(lambda: parse_tag(tag, None), number=number)
+
+        print(f"\nTag '{name}' ({len(tag)} characters, {number} iterations)")
+        print(f"parse_tag(): {parse_time:.6f} seconds")
+
+
+if __name__ == "__main__":
+    run_benchmark(number=2_000)
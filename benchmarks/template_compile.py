@@ -0,0 +1,97 @@
+# NOTE: This file is more of a playground than a proper test
+#
+# Measures how long it takes to compile the templates of the sample project (`sampleproject/`),
+# with `debug=True` (tokens hold their positions in the source, like with Django's `DebugLexer`)
+# and with `debug=False` (like Django's `Lexer`, which is used in production).
+#
+# Also measures how long it takes to load the compiled templates from `COMPONENTS.template_cache_dir`
+# (e.g. in a new worker process), instead of compiling them.
+#
+# Run from the project root with:
+# ```sh
+# PYTHONPATH=src python -m benchmarks.template_compile
+# ```
+
+import ast
+import tempfile
+import timeit
+from pathlib import Path
+from typing import List, Tuple
+
+from django.template import Engine, Template
+from django.template.base import DebugLexer, Lexer
+from django.test import override_settings
+
+from django_components.util.template_parser import parse_template
+from tests.django_test_setup import setup_test_config
+
+setup_test_config({"autodiscover": False})
+
+SAMPLE_PROJECT_DIR = Path(__file__).resolve().parent.parent / "sampleproject"
+
+
+# Collect the `.html` templates, and the inlined `Component.template` strings
+def get_sample_templates() -> List[Tuple[str, str]]:
+    templates: List[Tuple[str, str]] = []
+    for path in sorted(SAMPLE_PROJECT_DIR.rglob("*.html")):
+        templates.append((str(path.relative_to(SAMPLE_PROJECT_DIR)), path.read_text()))
+
+    for path in sorted(SAMPLE_PROJECT_DIR.rglob("*.py")):
+        for node in ast.walk(ast.parse(path.read_text())):
+            if not isinstance(node, (ast.Assign, ast.AnnAssign)) or not isinstance(node.value, ast.Constant):
+                continue
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            is_template = any(isinstance(target, ast.Name) and target.id == "template" for target in targets)
+            if is_template and isinstance(node.value.value, str):
+                templates.append((f"{path.relative_to(SAMPLE_PROJECT_DIR)}:{node.lineno}", node.value.value))
+    return templates
+
+
+def run_benchmark(number: int) -> None:
+    templates = get_sample_templates()
+    default_engine = Engine.get_default()
+    engines = {
+        debug: Engine(debug=debug, libraries=default_engine.libraries, builtins=default_engine.builtins)
+        for debug in (True, False)
+    }
+
+    def compile_templates(debug: bool) -> None:
+        for _, source in templates:
+            Template(source, engine=engines[debug])
+
+    def lex_templates(debug: bool) -> None:
+        for _, source in templates:
+            parse_template(source, debug=debug)
+
+    def django_lex_templates(debug: bool) -> None:
+        lexer_cls = DebugLexer if debug else Lexer
+        for _, source in templates:
+            lexer_cls(source).tokenize()
+
+    print(f"Templates of the sample project ({number} iterations):")
+    for name, _ in templates:
+        print(f"- {name}")
+
+    cache_dir = tempfile.TemporaryDirectory()
+    cache_settings = override_settings(COMPONENTS={"template_cache_dir": cache_dir.name})
+
+    for debug in (True, False):
+        compile_time = timeit.timeit(lambda: compile_templates(debug), number=number)
+        with cache_settings:
+            # Store the compiled templates on the disk first
+            compile_templates(debug)
+            load_time = timeit.timeit(lambda: compile_templates(debug), number=number)
+        lex_time = timeit.timeit(lambda: lex_templates(debug), number=number)
+        django_lex_time = timeit.timeit(lambda: django_lex_templates(debug), number=number)
+
+        print(f"\ndebug={debug}")
+        print(f"Template compile:          {compile_time:.6f} seconds")
+        print(f"Template load (from disk): {load_time:.6f} seconds")
+        print(f"Lexing (parse_template):   {lex_time:.6f} seconds")
+        print(f"Lexing (Django's {'DebugLexer' if debug else 'Lexer'}): {django_lex_time:.6f} seconds")
+
+    cache_dir.cleanup()
+
+
+if __name__ == "__main__":
+    run_benchmark(number=2_000)
@@ -20,23 +20,35 @@ def django_debug_lexer(template: str) -> List[Token]:
     return list(lexer.tokenize())
 
 
-def run_benchmark(template: str, num_iterations: int = 5000) -> Tuple[float, float]:
-    """Run performance comparison between Django and custom lexer."""
-    # django_time = timeit.timeit(lambda: django_lexer(template), number=num_iterations)
+def run_benchmark(template: str, num_iterations: int = 5000) -> Tuple[float, float, float, float]:
+    """Run performance comparison between Django and custom lexer, with and without positions."""
+    django_time = timeit.timeit(lambda: django_lexer(template), number=num_iterations)
     django_debug_time = timeit.timeit(lambda: django_debug_lexer(template), number=num_iterations)
-    custom_time = timeit.timeit(lambda: parse_template(template), number=num_iterations)
-    # return django_time, django_debug_time
-    return django_debug_time, custom_time
-
-
-def print_benchmark_results(template: str, django_time: float, custom_time: float, num_iterations: int) -> None:
+    custom_time = timeit.timeit(lambda: parse_template(template, debug=False), number=num_iterations)
+    custom_debug_time = timeit.timeit(lambda: parse_template(template, debug=True), number=num_iterations)
+    return django_time, django_debug_time, custom_time, custom_debug_time
+
+
+def print_benchmark_results(
+    template: str,
+    django_time: float,
+    django_debug_time: float,
+    custom_time: float,
+    custom_debug_time: float,
+    num_iterations: int,
+) -> None:
     """Print formatted benchmark results."""
     print(f"\nTemplate: {template}")
     print(f"Iterations: {num_iterations}")
     print(f"Django Lexer: {django_time:.6f} seconds")
     print(f"Custom Lexer: {custom_time:.6f} seconds")
-    print(f"Difference: {abs(django_time - custom_time):.6f} seconds")
     print(f"Custom lexer is {(django_time / custom_time):.2f}x {'faster' if custom_time < django_time else 'slower'}")
+    print(f"Django DebugLexer: {django_debug_time:.6f} seconds")
+    print(f"Custom Lexer (debug): {custom_debug_time:.6f} seconds")
+    print(
+        f"Custom lexer (debug) is {(django_debug_time / custom_debug_time):.2f}x "
+        f"{'faster' if custom_debug_time < django_debug_time else 'slower'}"
+    )
 
 
 if __name__ == "__main__":
@@ -190,6 +202,7 @@ if __name__ == "__main__":
         """,
     ]
 
+    num_iterations = 5000
     for template in test_cases:
-        django_time, custom_time = run_benchmark(template)
-        print_benchmark_results(template, django_time, custom_time, 200)
+        times = run_benchmark(template, num_iterations)
+        print_benchmark_results(template, *times, num_iterations=num_iterations)
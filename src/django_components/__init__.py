@@ -6,7 +6,7 @@
 # isort: off
 from django_components.app_settings import ContextBehavior, ComponentsSettings
 from django_components.autodiscovery import autodiscover, import_libraries
-from django_components.component import Component, ComponentVars, ComponentView
+from django_components.component import Component, ComponentCache, ComponentVars, ComponentView
 from django_components.component_media import ComponentMediaInput, ComponentMediaInputPath
 from django_components.component_registry import (
     AlreadyRegistered,
@@ -45,6 +45,7 @@ __all__ = [
     "ContextBehavior",
     "ComponentsSettings",
     "Component",
+    "ComponentCache",
     "ComponentFileEntry",
     "ComponentFormatter",
     "ComponentMediaInput",
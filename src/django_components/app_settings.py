@@ -30,6 +30,7 @@ T = TypeVar("T")
 
 
 ContextBehaviorType = Literal["django", "isolated"]
+CacheCompressionType = Literal["br", "gzip"]
 
 
 class ContextBehavior(str, Enum):
@@ -217,8 +218,9 @@ class ComponentsSettings(NamedTuple):
     Name of the [Django cache](https://docs.djangoproject.com/en/5.1/topics/cache/)
     to be used for storing component's JS and CSS files.
 
-    If `None`, a [`LocMemCache`](https://docs.djangoproject.com/en/5.1/topics/cache/#local-memory-caching)
-    is used with default settings.
+    The scripts are also kept in memory of each process, in front of this cache
+    (see [`cache_local_max_size`](../settings#django_components.app_settings.ComponentsSettings.cache_local_max_size)).
+    If `None`, the scripts are kept in memory of each process, in a cache without a size limit.
 
     Defaults to `None`.
 
@@ -231,6 +233,58 @@ class ComponentsSettings(NamedTuple):
     ```
     """
 
+    cache_compression: Optional[Sequence[CacheCompressionType]] = None
+    """
+    Store also compressed copies of component's JS and CSS files in the
+    [`cache`](../settings#django_components.app_settings.ComponentsSettings.cache),
+    so they can be sent compressed to browsers that support it.
+
+    Supported values are `"gzip"` and `"br"` (Brotli). Brotli requires the
+    [`brotli`](https://pypi.org/project/Brotli/) package to be installed.
+
+    If a browser accepts several of the encodings, the first one from this list is used.
+
+    Defaults to `[]` (disabled).
+
+    ```python
+    COMPONENTS = ComponentsSettings(
+        cache_compression=["br", "gzip"],
+    )
+    ```
+
+    Read more about [caching](../../guides/setup/caching).
+    """
+
+    cache_local_max_size: Optional[int] = None
+    """
+    Maximum size, in bytes, of component's JS and CSS files that are kept in memory of each process.
+
+    Defaults to `33554432` (32 MiB).
+
+    The in-memory cache sits in front of the
+    [`cache`](../settings#django_components.app_settings.ComponentsSettings.cache).
+    When it's full, the least recently used scripts are removed from it, and are fetched
+    from [`cache`](../settings#django_components.app_settings.ComponentsSettings.cache) again when needed.
+
+    ```python
+    COMPONENTS = ComponentsSettings(
+        cache_local_max_size=64 * 1024 * 1024,
+    )
+    ```
+
+    To find out if the in-memory cache is large enough, check its usage statistics.
+    The `hit_ratio` should be close to `1.0`, and the number of `evictions` should not keep growing:
+
+    ```python
+    from django_components.cache import get_component_media_cache
+
+    print(get_component_media_cache().stats().local)
+    # CacheStats(hits=15200, misses=130, evictions=0, size=1843200, maxsize=33554432)
+    ```
+
+    Read more about [caching](../../guides/setup/caching).
+    """
+
     context_behavior: Optional[ContextBehaviorType] = None
     """
     Configure whether, inside a component template, you can use variables from the outside
@@ -559,6 +613,39 @@ class ComponentsSettings(NamedTuple):
         ```
     """
 
+    template_cache_dir: Optional[Union[str, PathLike]] = None
+    """
+    Directory where django-components stores the compiled templates, so they can be
+    shared across processes and server restarts.
+
+    Defaults to `None` (disabled).
+
+    Before a [Django template](https://docs.djangoproject.com/en/5.1/ref/templates/api/#django.template.Template)
+    can be rendered, its source has to be parsed into a list of nodes. The parsed templates
+    are kept in memory (see
+    [`template_cache_size`](../settings#django_components.app_settings.ComponentsSettings.template_cache_size)),
+    but this cache is local to each process. So with e.g. multiple gunicorn workers,
+    each worker has to parse each template again on its first use.
+
+    When `template_cache_dir` is set, the parsed nodes are pickled and written to this directory
+    using Django's [`FileBasedCache`](https://docs.djangoproject.com/en/5.1/topics/cache/#filesystem-caching).
+    Other workers, or the server after a restart, load the nodes instead of parsing the template again.
+
+    ```python
+    COMPONENTS = ComponentsSettings(
+        template_cache_dir=BASE_DIR / ".cache" / "components",
+    )
+    ```
+
+    The entries are keyed by the template source, the versions of Django and django-components,
+    and the template engine's configuration. So the directory can be shared between deployments.
+
+    !!! note
+
+        Templates that contain nodes that cannot be pickled, e.g. custom template tags
+        that hold lambdas, are not stored, and are parsed by each process as usual.
+    """
+
     template_cache_size: Optional[int] = None
     """
     Configure the maximum amount of Django templates to be cached.
@@ -582,6 +669,16 @@ class ComponentsSettings(NamedTuple):
     )
     ```
 
+    To find out if the cache is large enough, check its usage statistics. If the number of `evictions`
+    keeps growing, the cache is too small:
+
+    ```python
+    from django_components.cache import get_template_cache
+
+    print(get_template_cache().stats())
+    # CacheStats(hits=1520, misses=130, evictions=2, size=128, maxsize=128)
+    ```
+
     To remove the cache limit altogether and cache everything, set `template_cache_size` to `None`.
 
     ```python
@@ -637,6 +734,8 @@ class Dynamic(Generic[T]):
 defaults = ComponentsSettings(
     autodiscover=True,
     cache=None,
+    cache_compression=[],  # E.g. ["br", "gzip"]
+    cache_local_max_size=32 * 1024 * 1024,  # 32 MiB
     context_behavior=ContextBehavior.DJANGO.value,  # "django" | "isolated"
     # Root-level "components" dirs, e.g. `/path/to/proj/components/`
     dirs=Dynamic(lambda: [Path(settings.BASE_DIR) / "components"]),  # type: ignore[arg-type]
@@ -665,6 +764,7 @@ defaults = ComponentsSettings(
         ".py", ".pyc",
     ],
     tag_formatter="django_components.component_formatter",
+    template_cache_dir=None,
     template_cache_size=128,
 )
 # --endsnippet:defaults--
@@ -685,6 +785,14 @@ class InternalSettings:
     def CACHE(self) -> Optional[str]:
         return default(self._settings.cache, defaults.cache)
 
+    @property
+    def CACHE_COMPRESSION(self) -> Sequence[CacheCompressionType]:
+        return default(self._settings.cache_compression, cast(List[CacheCompressionType], defaults.cache_compression))
+
+    @property
+    def CACHE_LOCAL_MAX_SIZE(self) -> int:
+        return default(self._settings.cache_local_max_size, cast(int, defaults.cache_local_max_size))
+
     @property
     def DIRS(self) -> Sequence[Union[str, PathLike, Tuple[str, str], Tuple[str, PathLike]]]:
         # For DIRS we use a getter, because default values uses Django settings,
@@ -726,6 +834,10 @@ class InternalSettings:
 
         return default(val, cast(bool, defaults.reload_on_file_change))
 
+    @property
+    def TEMPLATE_CACHE_DIR(self) -> Optional[Union[str, PathLike]]:
+        return default(self._settings.template_cache_dir, defaults.template_cache_dir)
+
     @property
     def TEMPLATE_CACHE_SIZE(self) -> int:
         return default(self._settings.template_cache_size, cast(int, defaults.template_cache_size))
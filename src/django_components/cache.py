@@ -1,23 +1,27 @@
-from typing import Optional
+import sys
+from os.path import abspath
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Union
 
 from django.core.cache import BaseCache, caches
+from django.core.cache.backends.filebased import FileBasedCache
 from django.core.cache.backends.locmem import LocMemCache
 
 from django_components.app_settings import app_settings
-from django_components.util.cache import LRUCache
+from django_components.util.cache import CacheStats, LRUCache
 
-# This stores the parsed Templates. This is strictly local for now, as it stores instances.
+# This stores the parsed Templates. This is strictly local, as it stores instances.
 # NOTE: Lazily initialized so it can be configured based on user-defined settings.
-#
-# TODO: Once we handle whole template parsing ourselves, this could store just
-#       the parsed template AST (+metadata) instead of Template instances. In that case
-#       we could open this up to be stored non-locally and shared across processes.
-#       This would also allow us to remove our custom `LRUCache` implementation.
 template_cache: Optional[LRUCache] = None
 
+# This stores the pickled nodelists of the parsed Templates on the disk, so they can be
+# shared across processes. Only used if `COMPONENTS.template_cache_dir` is set.
+# NOTE: Lazily initialized so it can be configured based on user-defined settings.
+template_nodelist_cache: Optional[FileBasedCache] = None
+
 # This stores the inlined component JS and CSS files (e.g. `Component.js` and `Component.css`).
 # We also store here the generated JS and CSS scripts that inject JS / CSS variables into the page.
-component_media_cache: Optional[BaseCache] = None
+# NOTE: Lazily initialized so it can be configured based on user-defined settings.
+component_media_cache: Optional["ComponentMediaCache"] = None
 
 
 def get_template_cache() -> LRUCache:
@@ -28,19 +32,150 @@ def get_template_cache() -> LRUCache:
     return template_cache
 
 
-def get_component_media_cache() -> BaseCache:
+def get_template_nodelist_cache() -> Optional[FileBasedCache]:
+    global template_nodelist_cache
+    cache_dir = app_settings.TEMPLATE_CACHE_DIR
+    if cache_dir is None:
+        return None
+
+    # Re-create the cache if the directory changed (e.g. in tests)
+    cache_dir = abspath(cache_dir)
+    if template_nodelist_cache is None or template_nodelist_cache._dir != cache_dir:
+        template_nodelist_cache = FileBasedCache(
+            cache_dir,
+            {
+                "TIMEOUT": None,  # No timeout
+                "OPTIONS": {"MAX_ENTRIES": 10_000},
+            },
+        )
+
+    return template_nodelist_cache
+
+
+class ComponentMediaCacheStats(NamedTuple):
+    """Usage statistics of `ComponentMediaCache`, as returned by `ComponentMediaCache.stats()`."""
+
+    local: CacheStats
+    """
+    Statistics of the in-process cache. Its `size` and `maxsize` are in bytes.
+
+    The in-process cache is large enough if its `hit_ratio` is close to `1.0`,
+    and its `evictions` don't keep growing.
+    """
+    remote_hits: int
+    """Number of scripts that were not in the in-process cache, and were found in the remote cache."""
+    remote_misses: int
+    """Number of scripts that were found in neither of the caches."""
+
+
+class ComponentMediaCache:
+    """
+    Two-tier cache for component's JS and CSS.
+
+    1. The in-process cache holds the most recently used scripts as bytes, ready to be sent
+       in HTTP responses. Its size is limited in bytes, see
+       [`COMPONENTS.cache_local_max_size`](../settings#django_components.app_settings.ComponentsSettings.cache_local_max_size).
+    2. The remote cache is the Django cache set in
+       [`COMPONENTS.cache`](../settings#django_components.app_settings.ComponentsSettings.cache)
+       (e.g. Redis or file-based), which is shared across processes.
+
+    Scripts are written to both caches. Scripts that are not in the in-process cache
+    are fetched from the remote cache.
+
+    If `COMPONENTS.cache` is not set, the remote cache is an unbounded `LocMemCache`
+    of the process. Scripts like JS / CSS variables can't be generated again once they are
+    lost, so they must not be lost when they are removed from the size-limited in-process cache.
+    """  # noqa: E501
+
+    def __init__(self, max_size: Optional[int], remote: Optional[BaseCache] = None):
+        self.local: "LRUCache[bytes]" = LRUCache(maxsize=max_size, getsize=len)
+        self.remote = remote
+        self._remote_hits = 0
+        self._remote_misses = 0
+
+    def has_local(self, key: str) -> bool:
+        """Check if the key is in the in-process cache, without reaching the remote cache."""
+        return self.local.has(key)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, bytes]:
+        """
+        Get the entries from the in-process cache. Entries that are not there are fetched
+        from the remote cache with a single `get_many()` call.
+
+        Keys that were not found are omitted from the result.
+        """
+        found: Dict[str, bytes] = {}
+        missing_keys: List[str] = []
+        for key in keys:
+            entry = self.local.get(key)
+            if entry is None:
+                missing_keys.append(key)
+            else:
+                found[key] = entry
+
+        if missing_keys and self.remote is not None:
+            fetched: Dict[str, Union[str, bytes]] = self.remote.get_many(missing_keys)
+            for key, remote_entry in fetched.items():
+                entry = remote_entry.encode() if isinstance(remote_entry, str) else remote_entry
+                self.local.set(key, entry)
+                found[key] = entry
+            self._remote_hits += len(fetched)
+            self._remote_misses += len(missing_keys) - len(fetched)
+        else:
+            self._remote_misses += len(missing_keys)
+
+        return found
+
+    def set_many(self, entries: Mapping[str, Union[str, bytes]]) -> None:
+        """
+        Store the entries in both caches. The remote cache is written with a single `set_many()` call.
+
+        NOTE: Strings are stored in the remote cache as they are, so they can be read by other code.
+        """
+        if self.remote is not None:
+            self.remote.set_many(entries)
+
+        for key, entry in entries.items():
+            self.local.set(key, entry.encode() if isinstance(entry, str) else entry)
+
+    def clear(self) -> None:
+        """Clear both caches."""
+        self.local.clear()
+        if self.remote is not None:
+            self.remote.clear()
+        self._remote_hits = 0
+        self._remote_misses = 0
+
+    def stats(self) -> ComponentMediaCacheStats:
+        """
+        Get the usage statistics of the cache.
+
+        NOTE: When the cache is used from multiple threads, the numbers are approximate.
+        """
+        return ComponentMediaCacheStats(
+            local=self.local.stats(),
+            remote_hits=self._remote_hits,
+            remote_misses=self._remote_misses,
+        )
+
+
+def get_component_media_cache() -> ComponentMediaCache:
     global component_media_cache
     if component_media_cache is None:
         if app_settings.CACHE is not None:
-            component_media_cache = caches[app_settings.CACHE]
+            remote: BaseCache = caches[app_settings.CACHE]
         else:
-            component_media_cache = LocMemCache(
+            remote = LocMemCache(
                 "django-components-media",
                 {
                     "TIMEOUT": None,  # No timeout
-                    "MAX_ENTRIES": None,  # No max size
-                    "CULL_FREQUENCY": 3,
+                    # NOTE: Django's caches don't accept `None` for no max size
+                    "OPTIONS": {"MAX_ENTRIES": sys.maxsize},
                 },
             )
+        component_media_cache = ComponentMediaCache(max_size=app_settings.CACHE_LOCAL_MAX_SIZE, remote=remote)
 
     return component_media_cache
@@ -1,21 +1,26 @@
+import json
 import types
 from collections import deque
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
+from hashlib import md5
 from typing import (
     Any,
+    Awaitable,
     Callable,
     ClassVar,
     Deque,
     Dict,
     Generator,
     Generic,
+    Iterator,
     List,
     Literal,
     Mapping,
     NamedTuple,
     Optional,
     Protocol,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -23,6 +28,8 @@ from typing import (
     cast,
 )
 
+from asgiref.sync import iscoroutinefunction
+from django.core.cache import BaseCache, caches
 from django.core.exceptions import ImproperlyConfigured
 from django.forms.widgets import Media as MediaCls
 from django.http import HttpRequest, HttpResponse
@@ -36,25 +43,40 @@ from django.views import View
 
 from django_components.app_settings import ContextBehavior, app_settings
 from django_components.component_media import ComponentMediaInput, ComponentMediaMeta
-from django_components.component_registry import ComponentRegistry
+from django_components.component_registry import ComponentRegistry, NotRegistered, all_registries
 from django_components.component_registry import registry as registry_
 from django_components.context import _COMPONENT_CONTEXT_KEY, make_isolated_context_copy
 from django_components.dependencies import (
+    ComponentDependencies,
     RenderType,
-    cache_component_css,
-    cache_component_css_vars,
-    cache_component_js,
-    cache_component_js_vars,
+    cache_component_media,
     comp_hash_mapping,
     insert_component_dependencies_comment,
+    pop_recorded_dependencies,
+    record_component_dependencies,
 )
-from django_components.dependencies import render_dependencies as _render_dependencies
+from django_components.dependencies import render_dependencies_stream as _render_dependencies_stream
 from django_components.dependencies import (
+    render_recorded_dependencies,
+    restore_cached_component_html,
     set_component_attrs_for_js_and_css,
 )
 from django_components.node import BaseNode
-from django_components.perfutil.component import ComponentRenderer, component_context_cache, component_post_render
+from django_components.perfutil.component import (
+    ComponentRenderer,
+    component_post_render,
+    component_post_render_async,
+    component_post_render_stream,
+)
 from django_components.perfutil.provide import register_provide_reference, unregister_provide_reference
+from django_components.perfutil.render_session import (
+    RenderSession,
+    activate_render_session,
+    get_render_session,
+    render_session,
+    render_session_var,
+)
+from django_components.profiler import profile_phase
 from django_components.provide import get_injected_context_var
 from django_components.slots import (
     Slot,
@@ -73,7 +95,7 @@ from django_components.util.component_highlight import apply_component_highlight
 from django_components.util.context import snapshot_context
 from django_components.util.django_monkeypatch import is_template_cls_patched
 from django_components.util.exception import component_error_message
-from django_components.util.logger import trace_component_msg
+from django_components.util.logger import is_trace_enabled, trace_component_msg
 from django_components.util.misc import gen_id, get_import_path, hash_comp_cls
 from django_components.util.template_tag import TagAttr
 from django_components.util.validation import validate_typed_dict, validate_typed_tuple
@@ -220,6 +242,138 @@ class ComponentView(View, metaclass=ComponentViewMeta):
         self.component = component
 
 
+class ComponentCache:
+    """
+    Configure caching of the component's rendered output.
+
+    By default, caching is disabled. To enable it, subclass `ComponentCache` and set
+    [`enabled`](../api#django_components.ComponentCache.enabled) to `True`:
+
+    ```py
+    from django_components import Component, ComponentCache
+
+    class Footer(Component):
+        template_file = "footer.html"
+
+        class Cache(ComponentCache):
+            enabled = True
+            ttl = 60 * 5
+    ```
+
+    When the component is rendered with the same inputs, the HTML is taken from the cache,
+    and the component (including its nested components) is not rendered at all.
+
+    The cached HTML includes the HTML of all nested components and the info on their JS and CSS.
+    So cached components still insert their JS and CSS into the page, and they still receive
+    the `data-djc-id-*` attributes.
+
+    The cache entry depends on the component class, the component's code (see
+    [`version`](../api#django_components.ComponentCache.version)), and the output of
+    [`hash()`](../api#django_components.ComponentCache.hash).
+
+    The instance of the `Cache` class has access to the component instance via `self.component`.
+    """
+
+    enabled: bool = False
+    """Whether the component's output should be cached. Defaults to `False`."""
+
+    ttl: Optional[int] = None
+    """
+    How long (in seconds) the rendered HTML should be cached.
+
+    If `None` (default), the entry is cached forever. Same as Django's cache `timeout`.
+    """
+
+    cache_name: str = "default"
+    """
+    Name of the [Django cache](https://docs.djangoproject.com/en/5.1/topics/cache/)
+    (as defined in the `CACHES` setting) where the rendered HTML is stored. Defaults to `"default"`.
+    """
+
+    version: Optional[str] = None
+    """
+    Version of the component's code, included in the cache key. Change it to discard
+    the HTML that was cached with the previous version.
+
+    The cache key already includes the component's `template`, `js` and `css`. So the cache
+    entries are discarded when these change, e.g. after a deploy, even when they are stored
+    in a shared cache like Redis.
+
+    Set `version` (or a lower `ttl`) when the HTML depends also on other code, e.g. on
+    the Python code of the component, on the templates of the nested components,
+    or on a template returned from `get_template()` or `get_template_name()`.
+    """
+
+    def __init__(self, component: "Component") -> None:
+        self.component = component
+
+    def hash(self, args: Any, kwargs: Any, slots: Any) -> Optional[str]:
+        """
+        Generate a string that identifies the component's inputs. Components rendered
+        with the same inputs share the same cache entry.
+
+        Return `None` to skip the cache for this render.
+
+        By default, the hash is made of the args, kwargs and slots serialized as JSON. So components
+        are cached only if all inputs are JSON-serializable primitives (strings, numbers, booleans,
+        `None`, and lists and dicts of those), and all slots were given as strings. Otherwise, e.g. when
+        an input is a model instance, or a slot is a function (e.g. a `{% fill %}` tag), the component
+        is not cached, because we can't know whether two such inputs render the same HTML.
+
+        The hash does NOT include the outer context. With the default `"django"`
+        [`context_behavior`](../settings#django_components.app_settings.ComponentsSettings.context_behavior),
+        the component's template can use the variables from the outer context. If it does, make
+        the hash depend on those variables too. Otherwise, the HTML rendered with the first value
+        is served for all values.
+
+        Override this method to cache components with slots, or to make the cache entry depend
+        on other data, e.g. the logged in user:
+
+        ```py
+        class Cache(ComponentCache):
+            enabled = True
+
+            def hash(self, args, kwargs, slots):
+                request = self.component.input.context.get("request")
+                return f"{request.user.pk}:{kwargs['page']}"
+        ```
+        """
+        slots_hash = {}
+        for slot_name, slot_content in slots.items():
+            if not isinstance(slot_content, str):
+                return None
+            slots_hash[slot_name] = slot_content
+
+        try:
+            return json.dumps([args, kwargs, slots_hash], sort_keys=True)
+        except (TypeError, ValueError):
+            # Inputs are not JSON-serializable
+            return None
+
+    def get_cache(self) -> BaseCache:
+        """Get the Django cache backend where the rendered HTML is stored."""
+        return caches[self.cache_name]
+
+    def get_cache_key(self, args: Any, kwargs: Any, slots: Any) -> Optional[str]:
+        """
+        Get the key under which the component's HTML is stored in the cache,
+        or `None` if the component should not be cached.
+        """
+        input_hash = self.hash(args, kwargs, slots)
+        if input_hash is None:
+            return None
+        input_hash = md5(input_hash.encode()).hexdigest()
+        return f"components:cache:{self.component.__class__._class_hash}:{self._get_code_hash()}:{input_hash}"
+
+    # The cached HTML must be discarded when the component's code changes, e.g. after a deploy.
+    # Otherwise, a shared cache would serve the old HTML forever.
+    def _get_code_hash(self) -> str:
+        component = self.component
+        template = component.template.source if isinstance(component.template, Template) else component.template
+        code = json.dumps([template, component.js, component.css, self.version])
+        return md5(code.encode()).hexdigest()[0:8]
+
+
 # Internal data that are made available within the component's template
 @dataclass
 class ComponentContext:
@@ -237,6 +391,13 @@ class ComponentContext:
     # shares this dictionary for storing callbacks that are called from within `component_post_render`.
     # This is so that we can pass them all in when the root component is passed to `component_post_render`.
     post_render_callbacks: Dict[str, Callable[[str], str]]
+    # Render ID of the root component under which the JS and CSS dependencies are recorded
+    # in the `RenderSession`. If `None`, the dependencies are inserted into the HTML as comments.
+    # See `record_component_dependencies()`.
+    dependencies_root_id: Optional[str]
+    # Dependencies for which we've already inserted the `<!-- _RENDERED ... -->` comment.
+    # Shared by the root component and all the nested components, same as `post_render_callbacks`.
+    announced_dependencies: Set[ComponentDependencies]
 
 
 class Component(
@@ -547,6 +708,7 @@ class Component(
     response_class = HttpResponse
     """This allows to configure what class is used to generate response from `render_to_response`"""
     View = ComponentView
+    Cache = ComponentCache
 
     # #####################################
     # PUBLIC API - HOOKS
@@ -598,6 +760,9 @@ class Component(
         # See https://stackoverflow.com/a/76706399/9788634
         self.render_to_response = types.MethodType(self.__class__.render_to_response.__func__, self)  # type: ignore
         self.render = types.MethodType(self.__class__.render.__func__, self)  # type: ignore
+        self.render_to_stream = types.MethodType(self.__class__.render_to_stream.__func__, self)  # type: ignore
+        self.arender = types.MethodType(self.__class__.arender.__func__, self)  # type: ignore
+        self.arender_to_response = types.MethodType(self.__class__.arender_to_response.__func__, self)  # type: ignore
         self.as_view = types.MethodType(self.__class__.as_view.__func__, self)  # type: ignore
 
         self.registered_name: Optional[str] = registered_name
@@ -955,6 +1120,144 @@ class Component(
 
         return comp._render(context, args, kwargs, slots, escape_slots_content, type, render_dependencies, request)
 
+    @classmethod
+    def render_to_stream(
+        cls,
+        context: Optional[Union[Dict[str, Any], Context]] = None,
+        args: Optional[ArgsType] = None,
+        kwargs: Optional[KwargsType] = None,
+        slots: Optional[SlotsType] = None,
+        escape_slots_content: bool = True,
+        type: RenderType = "document",
+        render_dependencies: bool = True,
+        request: Optional[HttpRequest] = None,
+    ) -> Iterator[str]:
+        """
+        Render the component into an iterator of HTML chunks.
+
+        Accepts the same inputs as [`Component.render()`](../api#django_components.Component.render).
+
+        The component itself is rendered right away. But the nested components are rendered only
+        as the iterator is consumed. The HTML is yielded in chunks as soon as we know the chunks
+        will not change anymore. So the browser can start processing the page while the rest of the page
+        is still being rendered.
+
+        The HTML of components that define
+        [`Component.on_render_after()`](../api#django_components.Component.on_render_after)
+        is sent only once the whole component was rendered, as the hook may modify the HTML.
+
+        If `render_dependencies` is `True`, the JS and CSS dependencies are sent in the last chunk.
+
+        Example:
+        ```py
+        from django.http import StreamingHttpResponse
+
+        def my_view(request):
+            chunks = MyPage.render_to_stream(
+                kwargs={"rows": rows},
+                request=request,
+            )
+            return StreamingHttpResponse(chunks)
+        ```
+        """
+        # This method may be called as class method or as instance method.
+        # If called as class method, create a new instance.
+        if isinstance(cls, Component):
+            comp: Component = cls
+        else:
+            comp = cls()
+
+        return comp._render_stream(
+            context, args, kwargs, slots, escape_slots_content, type, render_dependencies, request
+        )
+
+    @classmethod
+    async def arender(
+        cls,
+        context: Optional[Union[Dict[str, Any], Context]] = None,
+        args: Optional[ArgsType] = None,
+        kwargs: Optional[KwargsType] = None,
+        slots: Optional[SlotsType] = None,
+        escape_slots_content: bool = True,
+        type: RenderType = "document",
+        render_dependencies: bool = True,
+        request: Optional[HttpRequest] = None,
+    ) -> str:
+        """
+        Async version of [`Component.render()`](../api#django_components.Component.render).
+
+        Accepts the same inputs as [`Component.render()`](../api#django_components.Component.render).
+
+        Components may define `get_context_data()` as an `async def` function, e.g. to fetch data
+        from an API. With `arender()`, the data is awaited without blocking the event loop.
+        The data of sibling components (components that share the same parent) is loaded concurrently.
+
+        Example:
+        ```py
+        class UserCard(Component):
+            template = "<div>{{ user.name }}</div>"
+
+            async def get_context_data(self, user_id: int):
+                user = await fetch_user(user_id)
+                return {"user": user}
+
+        async def my_view(request):
+            html = await MyPage.arender(request=request)
+            return HttpResponse(html)
+        ```
+
+        NOTE: Components with async `get_context_data()` can be rendered also with
+        [`Component.render()`](../api#django_components.Component.render), but then the data is loaded
+        in a separate event loop, and `render()` must NOT be called from within a running event loop.
+        """
+        # This method may be called as class method or as instance method.
+        # If called as class method, create a new instance.
+        if isinstance(cls, Component):
+            comp: Component = cls
+        else:
+            comp = cls()
+
+        return await comp._arender(
+            context, args, kwargs, slots, escape_slots_content, type, render_dependencies, request
+        )
+
+    @classmethod
+    async def arender_to_response(
+        cls,
+        context: Optional[Union[Dict[str, Any], Context]] = None,
+        slots: Optional[SlotsType] = None,
+        escape_slots_content: bool = True,
+        args: Optional[ArgsType] = None,
+        kwargs: Optional[KwargsType] = None,
+        type: RenderType = "document",
+        request: Optional[HttpRequest] = None,
+        *response_args: Any,
+        **response_kwargs: Any,
+    ) -> HttpResponse:
+        """
+        Async version of [`Component.render_to_response()`](../api#django_components.Component.render_to_response).
+
+        The component is rendered with [`Component.arender()`](../api#django_components.Component.arender),
+        and the content is wrapped in the response class.
+
+        Example:
+        ```py
+        async def my_view(request):
+            return await MyPage.arender_to_response(request=request)
+        ```
+        """
+        content = await cls.arender(
+            args=args,
+            kwargs=kwargs,
+            context=context,
+            slots=slots,
+            escape_slots_content=escape_slots_content,
+            type=type,
+            render_dependencies=True,
+            request=request,
+        )
+        return cls.response_class(content, *response_args, **response_kwargs)
+
     # This is the internal entrypoint for the render function
     def _render(
         self,
@@ -970,13 +1273,19 @@ class Component(
         # Modify the error to display full component path (incl. slots)
         with component_error_message([self.name]):
             try:
-                return self._render_impl(
-                    context, args, kwargs, slots, escape_slots_content, type, render_dependencies, request
-                )
+                # The render-time state is released once the root component is rendered, even on error
+                with render_session():
+                    return cast(
+                        str,
+                        self._render_impl(
+                            context, args, kwargs, slots, escape_slots_content, type, render_dependencies, request
+                        ),
+                    )
             except Exception as err:
                 raise err from None
 
-    def _render_impl(
+    # This is the internal entrypoint for the async render function
+    async def _arender(
         self,
         context: Optional[Union[Dict[str, Any], Context]] = None,
         args: Optional[ArgsType] = None,
@@ -987,6 +1296,102 @@ class Component(
         render_dependencies: bool = True,
         request: Optional[HttpRequest] = None,
     ) -> str:
+        # Modify the error to display full component path (incl. slots)
+        with component_error_message([self.name]):
+            try:
+                with render_session():
+                    return await cast(
+                        Awaitable[str],
+                        self._render_impl(
+                            context,
+                            args,
+                            kwargs,
+                            slots,
+                            escape_slots_content,
+                            type,
+                            render_dependencies,
+                            request,
+                            output_mode="async",
+                        ),
+                    )
+            except Exception as err:
+                raise err from None
+
+    # This is the internal entrypoint for the streaming render function
+    def _render_stream(
+        self,
+        context: Optional[Union[Dict[str, Any], Context]] = None,
+        args: Optional[ArgsType] = None,
+        kwargs: Optional[KwargsType] = None,
+        slots: Optional[SlotsType] = None,
+        escape_slots_content: bool = True,
+        type: RenderType = "document",
+        render_dependencies: bool = True,
+        request: Optional[HttpRequest] = None,
+    ) -> Iterator[str]:
+        # The nested components are rendered only as the chunks are consumed, after we've returned
+        # from this function. So instead of `render_session()`, we make the session active
+        # only while the next chunk is being rendered, and release it once all chunks are consumed.
+        session = render_session_var.get()
+        owns_session = session is None
+        if session is None:
+            session = RenderSession()
+
+        # Modify the error to display full component path (incl. slots)
+        with component_error_message([self.name]):
+            try:
+                with activate_render_session(session):
+                    chunks = cast(
+                        Iterator[str],
+                        self._render_impl(
+                            context,
+                            args,
+                            kwargs,
+                            slots,
+                            escape_slots_content,
+                            type,
+                            render_dependencies,
+                            request,
+                            output_mode="stream",
+                        ),
+                    )
+            except Exception as err:
+                if owns_session:
+                    session.release(failed=True)
+                raise err from None
+
+        # We need to format the errors also while iterating.
+        def iter_chunks() -> Generator[str, None, None]:
+            failed = True
+            with component_error_message([self.name]):
+                try:
+                    while True:
+                        with activate_render_session(session):
+                            chunk = next(chunks, None)
+                        if chunk is None:
+                            break
+                        yield chunk
+                    failed = False
+                except Exception as err:
+                    raise err from None
+                finally:
+                    if owns_session:
+                        session.release(failed=failed)
+
+        return iter_chunks()
+
+    def _render_impl(
+        self,
+        context: Optional[Union[Dict[str, Any], Context]] = None,
+        args: Optional[ArgsType] = None,
+        kwargs: Optional[KwargsType] = None,
+        slots: Optional[SlotsType] = None,
+        escape_slots_content: bool = True,
+        type: RenderType = "document",
+        render_dependencies: bool = True,
+        request: Optional[HttpRequest] = None,
+        output_mode: Literal["string", "stream", "async"] = "string",
+    ) -> Union[str, Iterator[str], Awaitable[str]]:
         # NOTE: We must run validation before we normalize the slots, because the normalization
         #       wraps them in functions.
         self._validate_inputs(args or (), kwargs or {}, slots or {})
@@ -994,7 +1399,8 @@ class Component(
         # Allow to provide no args/kwargs/slots/context
         args = cast(ArgsType, args or ())
         kwargs = cast(KwargsType, kwargs or {})
-        slots_untyped = self._normalize_slot_fills(slots or {}, escape_slots_content)
+        raw_slots: Mapping[SlotName, SlotContent] = slots or {}
+        slots_untyped = self._normalize_slot_fills(raw_slots, escape_slots_content)
         slots = cast(SlotsType, slots_untyped)
         context = context or (RequestContext(request) if request else Context())
 
@@ -1004,9 +1410,12 @@ class Component(
         if not isinstance(context, Context):
             context = RequestContext(request, context) if request else Context(context)
 
-        # Required for compatibility with Django's {% extends %} tag
-        # See https://github.com/django-components/django-components/pull/859
-        context.render_context.push({BLOCK_CONTEXT_KEY: context.render_context.get(BLOCK_CONTEXT_KEY, BlockContext())})
+        # If `get_context_data()` is async, the component is prepared only once the data is loaded.
+        # By then, the parent template will have moved on, and the Context will have changed.
+        # So we work with a copy of the Context as it is at the time of the render call.
+        is_async = iscoroutinefunction(self.get_context_data)
+        if is_async:
+            context = snapshot_context(context)
 
         # By adding the current input to the stack, we temporarily allow users
         # to access the provided context, slots, etc. Also required so users can
@@ -1029,27 +1438,69 @@ class Component(
             is_filled=None,
         )
 
+        session = get_render_session()
+
         # We pass down the components the info about the component's parent.
         # This is used for correctly resolving slot fills, correct rendering order,
         # or CSS scoping.
         if context.get(_COMPONENT_CONTEXT_KEY, None):
             parent_id = cast(str, context[_COMPONENT_CONTEXT_KEY])
-            parent_comp_ctx = component_context_cache[parent_id]
+            parent_comp_ctx = session.component_context_cache[parent_id]
             component_path = [*parent_comp_ctx.component_path, self.name]
             post_render_callbacks = parent_comp_ctx.post_render_callbacks
+            dependencies_root_id = parent_comp_ctx.dependencies_root_id
+            announced_dependencies = parent_comp_ctx.announced_dependencies
         else:
             parent_id = None
             component_path = [self.name]
             post_render_callbacks = {}
+            # The JS and CSS dependencies are recorded outside of the HTML only if the HTML
+            # doesn't leave this render, because the root component inserts the JS and CSS itself.
+            # NOTE: When streaming, the JS and CSS is inserted while the components are still being
+            #       rendered, so there we keep the comments.
+            dependencies_root_id = render_id if render_dependencies and output_mode != "stream" else None
+            announced_dependencies = set()
+
+        # Check if the component's HTML was already cached. If so, we skip the rendering
+        # of this component and its nested components. See `Component.Cache`.
+        cache_key: Optional[str] = None
+        if self.Cache.enabled:
+            component_cache = self.Cache(self)
+            with self._with_metadata(metadata):
+                cache_key = component_cache.get_cache_key(args, kwargs, raw_slots)
+
+            cached_entry = component_cache.get_cache().get(cache_key) if cache_key is not None else None
+            if cached_entry is not None:
+                return self._render_from_cache(
+                    cached_entry=cached_entry,
+                    output_mode=output_mode,
+                    render_id=render_id,
+                    parent_id=parent_id,
+                    component_path=component_path,
+                    post_render_callbacks=post_render_callbacks,
+                    type=type,
+                    render_dependencies=render_dependencies,
+                )
 
-        trace_component_msg(
-            "COMP_PREP_START",
-            component_name=self.name,
-            component_id=render_id,
-            slot_name=None,
-            component_path=component_path,
-            extra=f"Received {len(args)} args, {len(kwargs)} kwargs, {len(slots)} slots, Available slots: {slots}",
-        )
+        # The cached HTML must contain the dependency comments of this component and its nested components,
+        # so that the JS and CSS can be inserted also when the HTML is taken from the cache.
+        if cache_key is not None:
+            dependencies_root_id = None
+            announced_dependencies = set()
+
+        # Required for compatibility with Django's {% extends %} tag
+        # See https://github.com/django-components/django-components/pull/859
+        context.render_context.push({BLOCK_CONTEXT_KEY: context.render_context.get(BLOCK_CONTEXT_KEY, BlockContext())})
+
+        if __debug__ and is_trace_enabled():
+            trace_component_msg(
+                "COMP_PREP_START",
+                component_name=self.name,
+                component_id=render_id,
+                slot_name=None,
+                component_path=component_path,
+                extra=f"Received {len(args)} args, {len(kwargs)} kwargs, {len(slots)} slots, Available slots: {slots}",
+            )
 
         # Register the component to provide
         register_provide_reference(context, render_id)
@@ -1072,89 +1523,159 @@ class Component(
             outer_context=snapshot_context(self.outer_context) if self.outer_context is not None else None,
             registry=self.registry,
             post_render_callbacks=post_render_callbacks,
+            dependencies_root_id=dependencies_root_id,
+            announced_dependencies=announced_dependencies,
         )
 
         # Instead of passing the ComponentContext directly through the Context, the entry on the Context
-        # contains only a key to retrieve the ComponentContext from `component_context_cache`.
+        # contains only a key to retrieve the ComponentContext from `RenderSession.component_context_cache`.
         #
         # This way, the flow is easier to debug. Because otherwise, if you try to print out
         # or inspect the Context object, your screen is filled with the deeply nested ComponentContext objects.
-        component_context_cache[render_id] = component_ctx
+        session.component_context_cache[render_id] = component_ctx
 
         # Allow to access component input and metadata like component ID from within these hook
         with self._with_metadata(metadata):
-            context_data = self.get_context_data(*args, **kwargs)
+            # NOTE: Async `get_context_data()` only creates a coroutine here, so it's profiled once it's awaited
+            data_phase = (
+                nullcontext()
+                if is_async
+                else profile_phase(self.__class__, self.name, render_id, component_path, "get_context_data")
+            )
+            with data_phase:
+                context_data = self.get_context_data(*args, **kwargs)
             # TODO - enable JS and CSS vars - EXPOSE AND DOCUMENT AND MAKE NON-NULL
             js_data = self.get_js_data(*args, **kwargs) if hasattr(self, "get_js_data") else {}  # type: ignore
             css_data = self.get_css_data(*args, **kwargs) if hasattr(self, "get_css_data") else {}  # type: ignore
-        self._validate_outputs(data=context_data)
-
-        # Process Component's JS and CSS
-        cache_component_js(self.__class__)
-        js_input_hash = cache_component_js_vars(self.__class__, js_data) if js_data else None
-
-        cache_component_css(self.__class__)
-        css_input_hash = cache_component_css_vars(self.__class__, css_data) if css_data else None
-
-        with _prepare_template(self, context, context_data, metadata) as template:
-            component_ctx.template_name = template.name
-
-            # For users, we expose boolean variables that they may check
-            # to see if given slot was filled, e.g.:
-            # `{% if variable > 8 and component_vars.is_filled.header %}`
-            is_filled = SlotIsFilled(slots_untyped)
-            metadata.is_filled = is_filled
-
-            with context.update(
-                {
-                    # Private context fields
-                    _COMPONENT_CONTEXT_KEY: render_id,
-                    # NOTE: Public API for variables accessible from within a component's template
-                    # See https://github.com/django-components/django-components/issues/280#issuecomment-2081180940
-                    "component_vars": ComponentVars(
-                        is_filled=is_filled,
-                    ),
-                }
-            ):
-                # Make a "snapshot" of the context as it was at the time of the render call.
-                #
-                # Previously, we recursively called `Template.render()` as this point, but due to recursion
-                # this was limiting the number of nested components to only about 60 levels deep.
-                #
-                # Now, we make a flat copy, so that the context copy is static and doesn't change even if
-                # we leave the `with context.update` blocks.
-                #
-                # This makes it possible to render nested components with a queue, avoiding recursion limits.
-                context_snapshot = snapshot_context(context)
-
-        # Cleanup
-        context.render_context.pop()
-
-        # Instead of rendering component at the time we come across the `{% component %}` tag
-        # in the template, we defer rendering in order to scalably handle deeply nested components.
-        #
-        # See `_gen_component_renderer()` for more details.
-        deferred_render = self._gen_component_renderer(
-            render_id=render_id,
-            template=template,
-            context=context_snapshot,
-            metadata=metadata,
-            component_path=component_path,
-            css_input_hash=css_input_hash,
-            js_input_hash=js_input_hash,
-            css_scope_id=None,  # TODO - Implement CSS scoping
-        )
+
+        # These are set once we know the component's data, see `prepare_renderer()`
+        template: Optional[Template] = None
+        context_snapshot: Optional[Context] = None
+
+        def prepare_renderer(context_data: Any) -> ComponentRenderer:
+            nonlocal template, context_snapshot
+
+            self._validate_outputs(data=context_data)
+
+            # Process Component's JS and CSS
+            js_input_hash, css_input_hash = cache_component_media(self.__class__, js_data, css_data)
+
+            with _prepare_template(self, context, context_data, metadata) as template:
+                component_ctx.template_name = template.name
+
+                # For users, we expose boolean variables that they may check
+                # to see if given slot was filled, e.g.:
+                # `{% if variable > 8 and component_vars.is_filled.header %}`
+                is_filled = SlotIsFilled(slots_untyped)
+                metadata.is_filled = is_filled
+
+                with context.update(
+                    {
+                        # Private context fields
+                        _COMPONENT_CONTEXT_KEY: render_id,
+                        # NOTE: Public API for variables accessible from within a component's template
+                        # See https://github.com/django-components/django-components/issues/280#issuecomment-2081180940
+                        "component_vars": ComponentVars(
+                            is_filled=is_filled,
+                        ),
+                    }
+                ):
+                    # Make a "snapshot" of the context as it was at the time of the render call.
+                    #
+                    # Previously, we recursively called `Template.render()` as this point, but due to recursion
+                    # this was limiting the number of nested components to only about 60 levels deep.
+                    #
+                    # Now, we make a flat copy, so that the context copy is static and doesn't change even if
+                    # we leave the `with context.update` blocks.
+                    #
+                    # This makes it possible to render nested components with a queue, avoiding recursion limits.
+                    context_snapshot = snapshot_context(context)
+
+            # Cleanup
+            context.render_context.pop()
+
+            # Instead of rendering component at the time we come across the `{% component %}` tag
+            # in the template, we defer rendering in order to scalably handle deeply nested components.
+            #
+            # See `_gen_component_renderer()` for more details.
+            return self._gen_component_renderer(
+                render_id=render_id,
+                template=template,
+                context=context_snapshot,
+                metadata=metadata,
+                component_path=component_path,
+                css_input_hash=css_input_hash,
+                js_input_hash=js_input_hash,
+                css_scope_id=None,  # TODO - Implement CSS scoping
+                dependencies_root_id=dependencies_root_id,
+                announced_dependencies=announced_dependencies,
+            )
+
+        deferred_render: ComponentRenderer
+        if not is_async:
+            deferred_render = prepare_renderer(context_data)
+        else:
+            # Case: `get_context_data()` is async - We can't prepare the component until the data is loaded.
+            # So instead, we register a loader that awaits the data and prepares the component.
+            # The loaders are awaited in `component_post_render()`, when we get to rendering this component.
+            # At that point, the data of all sibling components is loaded concurrently.
+            data_awaitable = cast(Awaitable[Any], context_data)
+            prepared_render: Optional[ComponentRenderer] = None
+
+            async def load_data() -> None:
+                nonlocal prepared_render
+                # NOTE: [1:] because the root component will be yet again added to the error's
+                # `components` list in `_render` so we remove the first element from the path.
+                with component_error_message(component_path[1:]):
+                    with self._with_metadata(metadata):
+                        with profile_phase(self.__class__, self.name, render_id, component_path, "get_context_data"):
+                            loaded_data = await data_awaitable
+                    prepared_render = prepare_renderer(loaded_data)
+
+            def render_loaded(root_attributes: Optional[List[str]] = None) -> Tuple[str, Dict[str, List[str]]]:
+                if prepared_render is None:
+                    raise RuntimeError(f"{self.name}: Component was rendered before its data was loaded")
+                return prepared_render(root_attributes)
+
+            deferred_render = render_loaded
+            session.component_data_loaders[render_id] = load_data
+
+        # If the component's HTML should be cached, we need to know which HTML attributes were set
+        # on the component's root elements by the parent. These are removed before the HTML is cached,
+        # because the next time the component may be rendered inside a different parent.
+        if cache_key is not None:
+            parent_root_attributes: List[str] = []
+            uncached_render = deferred_render
+
+            def render_and_track_attrs(
+                root_attributes: Optional[List[str]] = None,
+            ) -> Tuple[str, Dict[str, List[str]]]:
+                parent_root_attributes.extend(root_attributes or [])
+                return uncached_render(root_attributes)
+
+            deferred_render = render_and_track_attrs
 
         # Remove component from caches
         def on_component_rendered(html: str) -> str:
             with self._with_metadata(metadata):
                 # Allow to optionally override/modify the rendered content
-                new_output = self.on_render_after(context_snapshot, template, html)
+                with profile_phase(self.__class__, self.name, render_id, component_path, "on_render_after"):
+                    new_output = self.on_render_after(
+                        cast(Context, context_snapshot),
+                        cast(Template, template),
+                        html,
+                    )
                 html = new_output if new_output is not None else html
 
-            del component_context_cache[render_id]  # type: ignore[arg-type]
+            del session.component_context_cache[render_id]  # type: ignore[arg-type]
             unregister_provide_reference(render_id)  # type: ignore[arg-type]
 
+            if cache_key is not None:
+                cached_html = html
+                for attr in parent_root_attributes:
+                    cached_html = cached_html.replace(f' {attr}=""', "")
+                component_cache.get_cache().set(cache_key, (render_id, cached_html), timeout=component_cache.ttl)
+
             if app_settings.DEBUG_HIGHLIGHT_COMPONENTS:
                 html = apply_component_highlight("component", html, f"{self.name} ({render_id})")
 
@@ -1162,28 +1683,156 @@ class Component(
 
         post_render_callbacks[render_id] = on_component_rendered
 
+        if __debug__ and is_trace_enabled():
+            trace_component_msg(
+                "COMP_PREP_END",
+                component_name=self.name,
+                component_id=render_id,
+                slot_name=None,
+                component_path=component_path,
+            )
+
+        # If the component's HTML is not modified after it's rendered, then the HTML
+        # can be passed on (or streamed) before the nested components are rendered.
+        #
+        # NOTE: If the component's output is to be cached, we need the whole HTML in `on_component_rendered()`.
+        is_output_final = (
+            self.__class__.on_render_after is Component.on_render_after
+            and not app_settings.DEBUG_HIGHLIGHT_COMPONENTS
+            and cache_key is None
+        )
+
+        return self._post_render(
+            output_mode=output_mode,
+            renderer=deferred_render,
+            render_id=render_id,
+            parent_id=parent_id,
+            post_render_callbacks=post_render_callbacks,
+            type=type,
+            render_dependencies=render_dependencies,
+            is_output_final=is_output_final,
+        )
+
+    # Render the component from HTML taken from `Component.Cache`.
+    #
+    # The cached HTML already contains the HTML of all nested components, so the component
+    # is passed to the post-render queue with a renderer that only updates the render IDs,
+    # and applies the HTML attributes set by the parent.
+    def _render_from_cache(
+        self,
+        cached_entry: Tuple[str, str],
+        output_mode: Literal["string", "stream", "async"],
+        render_id: str,
+        parent_id: Optional[str],
+        component_path: List[str],
+        post_render_callbacks: Dict[str, Callable[[str], str]],
+        type: RenderType,
+        render_dependencies: bool,
+    ) -> Union[str, Iterator[str], Awaitable[str]]:
+        cached_render_id, cached_html = cached_entry
+
+        if __debug__ and is_trace_enabled():
+            trace_component_msg(
+                "COMP_CACHE_HIT",
+                component_name=self.name,
+                component_id=render_id,
+                slot_name=None,
+                component_path=component_path,
+            )
+
+        def renderer(root_attributes: Optional[List[str]] = None) -> Tuple[str, Dict[str, List[str]]]:
+            # The component itself gets the current render ID, nested components get new IDs.
+            new_ids = {cached_render_id: render_id}
+
+            def get_new_id(old_id: str) -> str:
+                if old_id not in new_ids:
+                    new_ids[old_id] = gen_id()
+                return new_ids[old_id]
+
+            html = restore_cached_component_html(cached_html, get_new_id)
+            if root_attributes:
+                html, _ = set_component_attrs_for_js_and_css(
+                    html_content=html,
+                    component_id=None,
+                    css_input_hash=None,
+                    css_scope_id=None,
+                    root_attributes=root_attributes,
+                )
+            return html, {}
+
+        def on_component_rendered(html: str) -> str:
+            if app_settings.DEBUG_HIGHLIGHT_COMPONENTS:
+                html = apply_component_highlight("component", html, f"{self.name} ({render_id})")
+            return html
+
+        post_render_callbacks[render_id] = on_component_rendered
+
+        return self._post_render(
+            output_mode=output_mode,
+            renderer=renderer,
+            render_id=render_id,
+            parent_id=parent_id,
+            post_render_callbacks=post_render_callbacks,
+            type=type,
+            render_dependencies=render_dependencies,
+            is_output_final=not app_settings.DEBUG_HIGHLIGHT_COMPONENTS,
+        )
+
+    # Pass the component's renderer to the post-render queue.
+    # If this is the root component, then this is also where the whole component tree is rendered.
+    def _post_render(
+        self,
+        output_mode: Literal["string", "stream", "async"],
+        renderer: ComponentRenderer,
+        render_id: str,
+        parent_id: Optional[str],
+        post_render_callbacks: Dict[str, Callable[[str], str]],
+        type: RenderType,
+        render_dependencies: bool,
+        is_output_final: bool,
+    ) -> Union[str, Iterator[str], Awaitable[str]]:
         # After the component and all its children are rendered, we resolve
         # all inserted HTML comments into <script> and <link> tags (if render_dependencies=True)
         def on_html_rendered(html: str) -> str:
             if render_dependencies:
-                html = _render_dependencies(html, type)
+                html = render_recorded_dependencies(html, type, pop_recorded_dependencies(render_id))
             return html
 
-        trace_component_msg(
-            "COMP_PREP_END",
-            component_name=self.name,
-            component_id=render_id,
-            slot_name=None,
-            component_path=component_path,
-        )
+        if output_mode == "stream":
+
+            def on_stream_rendered(chunks: Iterator[str]) -> Iterator[str]:
+                if render_dependencies:
+                    return _render_dependencies_stream(chunks, type)
+                return chunks
+
+            return component_post_render_stream(
+                renderer=renderer,
+                render_id=render_id,
+                component_name=self.name,
+                parent_id=parent_id,
+                on_component_rendered_callbacks=post_render_callbacks,
+                on_html_rendered=on_stream_rendered,
+                is_output_final=is_output_final,
+            )
+        elif output_mode == "async":
+            return component_post_render_async(
+                renderer=renderer,
+                render_id=render_id,
+                component_name=self.name,
+                parent_id=parent_id,
+                on_component_rendered_callbacks=post_render_callbacks,
+                on_html_rendered=on_html_rendered,
+                is_output_final=is_output_final,
+            )
 
         return component_post_render(
-            renderer=deferred_render,
+            renderer=renderer,
             render_id=render_id,
             component_name=self.name,
             parent_id=parent_id,
             on_component_rendered_callbacks=post_render_callbacks,
             on_html_rendered=on_html_rendered,
+            is_output_final=is_output_final,
         )
 
     # Creates a renderer function that will be called only once, when the component is to be rendered.
@@ -1215,19 +1864,22 @@ class Component(
         css_input_hash: Optional[str],
         js_input_hash: Optional[str],
         css_scope_id: Optional[str],
+        dependencies_root_id: Optional[str],
+        announced_dependencies: Set[ComponentDependencies],
     ) -> ComponentRenderer:
         component = self
         component_name = self.name
         component_cls = self.__class__
 
         def renderer(root_attributes: Optional[List[str]] = None) -> Tuple[str, Dict[str, List[str]]]:
-            trace_component_msg(
-                "COMP_RENDER_START",
-                component_name=component_name,
-                component_id=render_id,
-                slot_name=None,
-                component_path=component_path,
-            )
+            if __debug__ and is_trace_enabled():
+                trace_component_msg(
+                    "COMP_RENDER_START",
+                    component_name=component_name,
+                    component_id=render_id,
+                    slot_name=None,
+                    component_path=component_path,
+                )
 
             # Allow to access component input and metadata like component ID from within `on_render` hook
             with component._with_metadata(metadata):
@@ -1236,33 +1888,46 @@ class Component(
                 # Emit signal that the template is about to be rendered
                 template_rendered.send(sender=template, template=template, context=context)
                 # Get the component's HTML
-                html_content = template.render(context)
+                with profile_phase(component_cls, component_name, render_id, component_path, "render_template"):
+                    html_content = template.render(context)
 
             # Add necessary HTML attributes to work with JS and CSS variables
-            updated_html, child_components = set_component_attrs_for_js_and_css(
-                html_content=html_content,
-                component_id=render_id,
-                css_input_hash=css_input_hash,
-                css_scope_id=css_scope_id,
-                root_attributes=root_attributes,
-            )
+            with profile_phase(component_cls, component_name, render_id, component_path, "set_html_attributes"):
+                updated_html, child_components = set_component_attrs_for_js_and_css(
+                    html_content=html_content,
+                    component_id=render_id,
+                    css_input_hash=css_input_hash,
+                    css_scope_id=css_scope_id,
+                    root_attributes=root_attributes,
+                )
 
-            # Prepend an HTML comment to instructs how and what JS and CSS scripts are associated with it.
-            updated_html = insert_component_dependencies_comment(
-                updated_html,
-                component_cls=component_cls,
-                component_id=render_id,
-                js_input_hash=js_input_hash,
-                css_input_hash=css_input_hash,
-            )
+            # Record what JS and CSS scripts are associated with the component. If the HTML leaves the render,
+            # prepend an HTML comment to instructs how and what JS and CSS scripts are associated with it.
+            if dependencies_root_id is not None:
+                record_component_dependencies(
+                    dependencies_root_id,
+                    component_cls=component_cls,
+                    js_input_hash=js_input_hash,
+                    css_input_hash=css_input_hash,
+                )
+            else:
+                updated_html = insert_component_dependencies_comment(
+                    updated_html,
+                    component_cls=component_cls,
+                    component_id=render_id,
+                    js_input_hash=js_input_hash,
+                    css_input_hash=css_input_hash,
+                    announced=announced_dependencies,
+                )
 
-            trace_component_msg(
-                "COMP_RENDER_END",
-                component_name=component_name,
-                component_id=render_id,
-                slot_name=None,
-                component_path=component_path,
-            )
+            if __debug__ and is_trace_enabled():
+                trace_component_msg(
+                    "COMP_RENDER_END",
+                    component_name=component_name,
+                    component_id=render_id,
+                    slot_name=None,
+                    component_path=component_path,
+                )
 
             return updated_html, child_components
 
@@ -1563,6 +2228,25 @@ class ComponentNode(BaseNode):
         start_tag: str,
         end_tag: str,
     ) -> "ComponentNode":
+        cached_subcls = cls._get_subclass(registry, name, start_tag, end_tag)
+
+        # Call `BaseNode.parse()` as if with the context of subcls.
+        node: ComponentNode = super(cls, cached_subcls).parse(  # type: ignore[attr-defined]
+            parser,
+            token,
+            registry=registry,
+            name=name,
+        )
+        return node
+
+    @classmethod
+    def _get_subclass(
+        cls,
+        registry: ComponentRegistry,  # noqa F811
+        name: str,
+        start_tag: str,
+        end_tag: str,
+    ) -> Type["ComponentNode"]:
         # Set the component-specific start and end tags by subclassing the BaseNode
         subcls_name = cls.__name__ + "_" + name
 
@@ -1583,14 +2267,15 @@ class ComponentNode(BaseNode):
                 f"Detected two Components using the same start tag '{start_tag}' but with different end tags"
             )
 
-        # Call `BaseNode.parse()` as if with the context of subcls.
-        node: ComponentNode = super(cls, cached_subcls).parse(  # type: ignore[attr-defined]
-            parser,
-            token,
-            registry=cached_registry,
-            name=name,
-        )
-        return node
+        return cached_subcls
+
+    # The class of this node is created dynamically, and the registry holds the component classes.
+    # So when the node is pickled (see `COMPONENTS.template_cache_dir`), we store only the tags
+    # and the component's name, and we find the registry and the node class again when it's unpickled.
+    def __reduce__(self) -> Tuple[Any, ...]:
+        state = self.__dict__.copy()
+        del state["registry"]
+        return (_unpickle_component_node, (self.tag, self.end_tag, self.name), state)
 
     def render(self, context: Context, *args: Any, **kwargs: Any) -> str:
         # Do not render nested `{% component %}` tags in other `{% component %}` tags
@@ -1625,6 +2310,20 @@ class ComponentNode(BaseNode):
         return output
 
 
+def _unpickle_component_node(start_tag: str, end_tag: str, name: str) -> ComponentNode:
+    # The same start tag can't be used by multiple registries, see `ComponentNode._get_subclass()`
+    for node_registry in all_registries:
+        if start_tag in node_registry._tags:
+            break
+    else:
+        raise NotRegistered(f"No registry has a component registered with the tag '{start_tag}'")
+
+    subcls = ComponentNode._get_subclass(node_registry, name, start_tag, end_tag)
+    node = subcls.__new__(subcls)
+    node.registry = node_registry
+    return node
+
+
 @contextmanager
 def _maybe_bind_template(context: Context, template: Template) -> Generator[None, Any, None]:
     if context.template is None:
@@ -1,16 +1,23 @@
 """All code related to management of component dependencies (JS and CSS scripts)"""
 
 import base64
+import codecs
+import gzip
 import json
 import re
 import sys
 from hashlib import md5
 from typing import (
     TYPE_CHECKING,
+    AsyncGenerator,
+    AsyncIterable,
     Callable,
     Dict,
+    Generator,
+    Iterable,
     List,
     Literal,
+    NamedTuple,
     Optional,
     Sequence,
     Set,
@@ -20,21 +27,35 @@ from typing import (
     Union,
     cast,
 )
-from weakref import WeakValueDictionary
+from urllib.parse import quote
+from weakref import WeakKeyDictionary, WeakValueDictionary
 
-from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.core.exceptions import ImproperlyConfigured
 from django.forms import Media
-from django.http import HttpRequest, HttpResponse, HttpResponseNotAllowed, HttpResponseNotFound, StreamingHttpResponse
+from django.http import (
+    FileResponse,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseNotAllowed,
+    HttpResponseNotFound,
+    StreamingHttpResponse,
+)
 from django.http.response import HttpResponseBase
 from django.template import Context, TemplateSyntaxError
 from django.templatetags.static import static
-from django.urls import path, reverse
+from django.urls import URLResolver, get_resolver, get_script_prefix, get_urlconf, path, reverse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
 from django.utils.decorators import sync_and_async_middleware
+from django.utils.http import RFC3986_SUBDELIMS, quote_etag
 from django.utils.safestring import SafeString, mark_safe
 from djc_core_html_parser import set_html_attributes
 
+from django_components.app_settings import CacheCompressionType, app_settings
 from django_components.cache import get_component_media_cache
 from django_components.node import BaseNode
+from django_components.perfutil.render_session import get_render_session
+from django_components.util.cache import LRUCache
 from django_components.util.misc import is_nonempty_str
 
 if TYPE_CHECKING:
@@ -92,14 +113,27 @@ def _gen_cache_key(
         return f"__components:{comp_cls_hash}:{script_type}"
 
 
+# Generate keys like `__components:bundle:1a2b3c4d:js`
+def _gen_bundle_cache_key(bundle_hash: str, script_type: ScriptType) -> str:
+    return f"__components:bundle:{bundle_hash}:{script_type}"
+
+
+# Compressed copies of the scripts are stored under keys like
+# `__components:MyButton_a78y37:js:df7c6d10:gzip`
+def _gen_encoded_cache_key(cache_key: str, encoding: CacheCompressionType) -> str:
+    return f"{cache_key}:{encoding}"
+
+
 def _is_script_in_cache(
     comp_cls: Type["Component"],
     script_type: ScriptType,
     input_hash: Optional[str],
 ) -> bool:
+    # NOTE: We check only the in-process cache, so that we don't reach the (possibly remote)
+    # `component_media_cache` on each render. If the script is not in the in-process cache,
+    # we set it again. Setting the same script twice is harmless.
     cache_key = _gen_cache_key(comp_cls._class_hash, script_type, input_hash)
-    cache = get_component_media_cache()
-    return cache.has_key(cache_key)
+    return get_component_media_cache().has_local(cache_key)
 
 
 def _cache_script(
@@ -107,10 +141,11 @@ def _cache_script(
     script: str,
     script_type: ScriptType,
     input_hash: Optional[str],
+    scripts: Dict[str, str],
 ) -> None:
     """
-    Given a component and it's inlined JS or CSS, store the JS/CSS in a cache,
-    so it can be retrieved via URL endpoint.
+    Given a component and it's inlined JS or CSS, add the JS/CSS to `scripts`,
+    so it can be stored in a cache, and retrieved via URL endpoint.
     """
 
     # E.g. `__components:MyButton:js:df7c6d10`
@@ -121,11 +156,137 @@ def _cache_script(
 
     # NOTE: By setting the script in the cache, we will be able to retrieve it
     # via the endpoint, e.g. when we make a request to `/components/cache/MyComp_ab0c2d.js`.
-    cache = get_component_media_cache()
-    cache.set(cache_key, script.strip())
+    scripts[cache_key] = script.strip()
+
+
+def _set_scripts_in_cache(scripts: Dict[str, str]) -> None:
+    """
+    Store the scripts in the media cache. If the media cache is backed by a remote cache,
+    the scripts are stored there with a single `set_many()` call.
+    """
+    entries: Dict[str, Union[str, bytes]] = {}
+    for cache_key, script in scripts.items():
+        entries[cache_key] = script
+        content_hashes.set(cache_key, _gen_content_hash(script))
+        # Compress the script only once, instead of on every request
+        for encoding in app_settings.CACHE_COMPRESSION:
+            entries[_gen_encoded_cache_key(cache_key, encoding)] = _compress_script(script, encoding)
+
+    get_component_media_cache().set_many(entries)
+
+
+def _compress_script(script: str, encoding: CacheCompressionType) -> bytes:
+    if encoding == "gzip":
+        # NOTE: Set `mtime` so that the output is the same for the same input
+        return gzip.compress(script.encode(), mtime=0)
+    elif encoding == "br":
+        try:
+            import brotli
+        except ImportError:
+            raise ImproperlyConfigured(
+                "COMPONENTS.cache_compression is set to use Brotli ('br'), "
+                "but the 'brotli' package is not installed."
+            ) from None
+        return brotli.compress(script.encode())
+    else:
+        raise ValueError(f"Unexpected encoding '{encoding}'")
+
+
+# Hash of the script's content. This is used in the script's URL and as its ETag,
+# so that the browsers and CDNs can cache the scripts until their content changes.
+def _gen_content_hash(script: Union[str, bytes]) -> str:
+    return md5(script.encode() if isinstance(script, str) else script).hexdigest()[0:8]
+
+
+# When a fragment is loaded, the JS and CSS of its components is fetched in a single request
+# per script type, as a bundle of the components' scripts.
+#
+# The bundle's hash is derived from the sorted URLs of the scripts. These contain the hashes
+# of the components, input hashes, and the hashes of the scripts' content. So the same set of scripts
+# always maps to the same bundle, regardless of the order in which the components were rendered.
+# And when any of the scripts changes, so does the bundle's hash. Hence the bundles never change,
+# and can be cached "forever".
+#
+# The bundle's URL lists also the bundled scripts (see `get_bundle_url()`). So if the bundle
+# is not in the cache, e.g. when the request reaches a process that didn't render the page,
+# the bundle is generated again, see `cached_bundle_view()`.
+def cache_bundle(
+    script_type: ScriptType,
+    scripts: Sequence[Tuple[Type["Component"], Optional[str], str]],
+) -> str:
+    """
+    Given a list of `(component_class, input_hash, url)` for the scripts to bundle,
+    store the bundle in the cache, and return the bundle's hash.
+    """
+    bundle_hash = _gen_bundle_hash(scripts)
+    cache_key = _gen_bundle_cache_key(bundle_hash, script_type)
+    if get_component_media_cache().has_local(cache_key):
+        return bundle_hash
+
+    bundle = _gen_bundle(script_type, scripts)
+    if bundle is None:
+        raise RuntimeError(f"Could not find {script_type.upper()} for all components of bundle '{bundle_hash}'")
+
+    _set_scripts_in_cache({cache_key: bundle})
+    return bundle_hash
 
 
-def cache_component_js(comp_cls: Type["Component"]) -> None:
+def _gen_bundle_hash(scripts: Sequence[Tuple[Type["Component"], Optional[str], str]]) -> str:
+    return _gen_content_hash("\n".join(sorted(url for _, _, url in scripts)))
+
+
+# Returns `None` if any of the scripts is missing
+def _gen_bundle(
+    script_type: ScriptType,
+    scripts: Sequence[Tuple[Type["Component"], Optional[str], str]],
+) -> Optional[str]:
+    scripts = sorted(scripts, key=lambda script: script[2])
+
+    # Fetch all the bundled scripts at once
+    get_component_media_cache().get_many(
+        [_gen_cache_key(comp_cls._class_hash, script_type, input_hash) for comp_cls, input_hash, _ in scripts]
+    )
+
+    contents: List[str] = []
+    for comp_cls, input_hash, _ in scripts:
+        content = get_script_content(script_type, comp_cls, input_hash)
+        if content is None:
+            return None
+        contents.append(content)
+
+    # NOTE: Separate the JS scripts with a semicolon, so one script's last statement
+    # is not joined with the next script's first statement.
+    separator = "\n;\n" if script_type == "js" else "\n"
+    return separator.join(contents)
+
+
+def cache_component_media(
+    comp_cls: Type["Component"],
+    js_vars: Optional[Dict],
+    css_vars: Optional[Dict],
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Cache the component's JS and CSS, and the scripts with its JS and CSS variables.
+
+    The scripts that are not cached yet are all stored with a single `set_many()` call.
+
+    Returns the input hashes of the JS and CSS variables.
+    """
+    scripts: Dict[str, str] = {}
+
+    cache_component_js(comp_cls, scripts)
+    js_input_hash = cache_component_js_vars(comp_cls, js_vars, scripts) if js_vars else None
+
+    cache_component_css(comp_cls, scripts)
+    css_input_hash = cache_component_css_vars(comp_cls, css_vars, scripts) if css_vars else None
+
+    if scripts:
+        _set_scripts_in_cache(scripts)
+
+    return js_input_hash, css_input_hash
+
+
+def cache_component_js(comp_cls: Type["Component"], scripts: Dict[str, str]) -> None:
     """
     Cache the content from `Component.js`. This is the common JS that's shared
     among all instances of the same component. So even if the component is rendered multiple
@@ -139,6 +300,7 @@ def cache_component_js(comp_cls: Type["Component"]) -> None:
         script=comp_cls.js,
         script_type="js",
         input_hash=None,
+        scripts=scripts,
     )
 
 
@@ -156,7 +318,7 @@ def cache_component_js(comp_cls: Type["Component"]) -> None:
 #    with `Components.manager.registerComponentData`.
 # 3. Actually run a component's JS instance with `Components.manager.callComponent`,
 #    specifying the components HTML elements with `component_id`, and JS vars with `input_hash`.
-def cache_component_js_vars(comp_cls: Type["Component"], js_vars: Dict) -> Optional[str]:
+def cache_component_js_vars(comp_cls: Type["Component"], js_vars: Dict, scripts: Dict[str, str]) -> Optional[str]:
     if not is_nonempty_str(comp_cls.js):
         return None
 
@@ -171,6 +333,7 @@ def cache_component_js_vars(comp_cls: Type["Component"], js_vars: Dict) -> Optio
             script="",  # TODO - enable JS and CSS vars
             script_type="js",
             input_hash=input_hash,
+            scripts=scripts,
         )
 
     return input_hash
@@ -185,7 +348,7 @@ def wrap_component_js(comp_cls: Type["Component"], content: str) -> str:
     return f"<script>{content}</script>"
 
 
-def cache_component_css(comp_cls: Type["Component"]) -> None:
+def cache_component_css(comp_cls: Type["Component"], scripts: Dict[str, str]) -> None:
     """
     Cache the content from `Component.css`. This is the common CSS that's shared
     among all instances of the same component. So even if the component is rendered multiple
@@ -199,6 +362,7 @@ def cache_component_css(comp_cls: Type["Component"]) -> None:
         script=comp_cls.css,
         script_type="css",
         input_hash=None,
+        scripts=scripts,
     )
 
 
@@ -206,7 +370,7 @@ def cache_component_css(comp_cls: Type["Component"]) -> None:
 # the CSS vars under the CSS selector `[data-djc-css-a1b2c3]`. We define the stylesheet
 # with variables separately from `Component.css`, because different instances may return different
 # data from `get_css_data()`, which will live in different stylesheets.
-def cache_component_css_vars(comp_cls: Type["Component"], css_vars: Dict) -> Optional[str]:
+def cache_component_css_vars(comp_cls: Type["Component"], css_vars: Dict, scripts: Dict[str, str]) -> Optional[str]:
     if not is_nonempty_str(comp_cls.css):
         return None
 
@@ -221,6 +385,7 @@ def cache_component_css_vars(comp_cls: Type["Component"], css_vars: Dict) -> Opt
             script="",  # TODO - enable JS and CSS vars
             script_type="css",
             input_hash=input_hash,
+            scripts=scripts,
         )
 
     return input_hash
@@ -327,12 +492,23 @@ def insert_component_dependencies_comment(
     component_id: str,
     js_input_hash: Optional[str],
     css_input_hash: Optional[str],
+    announced: Optional[Set["ComponentDependencies"]] = None,
 ) -> SafeString:
     """
     Given some textual content, prepend it with a short string that
     will be used by the ComponentDependencyMiddleware to collect all
     declared JS / CSS scripts.
+
+    If `announced` is given, the comment is prepended only if the same component class
+    with the same JS / CSS variables is not in `announced` yet. Use this to insert
+    a single comment for a component that is rendered many times within the same HTML.
     """
+    if announced is not None:
+        deps = (component_cls._class_hash, js_input_hash, css_input_hash)
+        if deps in announced:
+            return mark_safe(content)
+        announced.add(deps)
+
     data = f"{component_cls._class_hash},{component_id},{js_input_hash or ''},{css_input_hash or ''}"
 
     # NOTE: It's important that we put the comment BEFORE the content, so we can
@@ -341,6 +517,80 @@ def insert_component_dependencies_comment(
     return output
 
 
+# Dependencies of a rendered component, as `(comp_cls_hash, js_input_hash, css_input_hash)`.
+# This is the same data as in the `<!-- _RENDERED ... -->` comments, minus the component ID.
+ComponentDependencies = Tuple[str, Optional[str], Optional[str]]
+
+
+# If the HTML rendered by the component doesn't leave the render, e.g. when the root component
+# is rendered with `Component.render(render_dependencies=True)`, then we don't need to store
+# the info about the JS and CSS in the HTML. Instead, we record it in the `RenderSession`,
+# and the root component passes it to `render_dependencies()` once the whole tree is rendered.
+#
+# This way, the HTML doesn't grow with each rendered component, and `render_dependencies()`
+# doesn't have to find, parse, and strip all the comments.
+def record_component_dependencies(
+    root_id: str,
+    component_cls: Type["Component"],
+    js_input_hash: Optional[str],
+    css_input_hash: Optional[str],
+) -> None:
+    """
+    Same as `insert_component_dependencies_comment()`, but the JS and CSS dependencies
+    are recorded in the current `RenderSession`, under the render ID of the root component.
+
+    Each combination of component class and JS / CSS variables is recorded only once.
+    """
+    recorded = get_render_session().component_dependencies.setdefault(root_id, {})
+    recorded[(component_cls._class_hash, js_input_hash, css_input_hash)] = None
+
+
+def pop_recorded_dependencies(root_id: str) -> List[ComponentDependencies]:
+    """Remove and return the JS and CSS dependencies recorded for the root component."""
+    recorded = get_render_session().component_dependencies.pop(root_id, None)
+    return list(recorded) if recorded else []
+
+
+# E.g. `data-djc-id-a1b2c3` or `<!-- _RENDERED table_10bac31,a1b2c3`
+COMPONENT_ID_REGEX = re.compile(
+    r"(?P<prefix>data-djc-id-|<!--\s+_RENDERED\s+(?P<comp_cls_hash>[\w\-\./]+?),)(?P<id>\w{6})"
+)
+
+
+def restore_cached_component_html(content: str, get_new_id: Callable[[str], str]) -> str:
+    """
+    Given the HTML of a component that was taken from `Component.Cache`, prepare
+    the HTML so it can be inserted into the page as if it was freshly rendered:
+
+    1. The component and all its nested components get new render IDs, so that multiple
+       copies of the same cached HTML don't share the same `data-djc-id-*` attributes.
+       `get_new_id` receives the old ID and returns the new one.
+    2. The JS and CSS of all the components is (re-)cached, so that the JS and CSS
+       can be inserted into the page even if the media cache was cleared in the meantime.
+    """
+    comp_cls_hashes: Set[str] = set()
+
+    def on_replace_match(match: "re.Match[str]") -> str:
+        if match.group("comp_cls_hash"):
+            comp_cls_hashes.add(match.group("comp_cls_hash"))
+        return match.group("prefix") + get_new_id(match.group("id"))
+
+    content = COMPONENT_ID_REGEX.sub(on_replace_match, content)
+
+    scripts: Dict[str, str] = {}
+    for comp_cls_hash in comp_cls_hashes:
+        comp_cls = comp_hash_mapping.get(comp_cls_hash)
+        if comp_cls is None:
+            continue
+        cache_component_js(comp_cls, scripts)
+        cache_component_css(comp_cls, scripts)
+
+    if scripts:
+        _set_scripts_in_cache(scripts)
+
+    return content
+
+
 #########################################################
 # 3. Given a FINAL HTML composed of MANY components,
 #    process all the HTML dependency comments (created in
@@ -355,34 +605,50 @@ TContent = TypeVar("TContent", bound=Union[bytes, str])
 
 
 CSS_PLACEHOLDER_NAME = "CSS_PLACEHOLDER"
-CSS_PLACEHOLDER_NAME_B = CSS_PLACEHOLDER_NAME.encode()
 JS_PLACEHOLDER_NAME = "JS_PLACEHOLDER"
-JS_PLACEHOLDER_NAME_B = JS_PLACEHOLDER_NAME.encode()
 
 CSS_DEPENDENCY_PLACEHOLDER = f'<link name="{CSS_PLACEHOLDER_NAME}">'
 JS_DEPENDENCY_PLACEHOLDER = f'<script name="{JS_PLACEHOLDER_NAME}"></script>'
 COMPONENT_DEPS_COMMENT = "<!-- _RENDERED {data} -->"
 
 # E.g. `<!-- _RENDERED table,123,a92ef298,bd002c3 -->`
-COMPONENT_COMMENT_REGEX = re.compile(rb"<!--\s+_RENDERED\s+(?P<data>[\w\-,/]+?)\s+-->")
+# NOTE: Without the leading `<`, so it can be combined into `DEPENDENCIES_SCAN_REGEX`
+COMPONENT_COMMENT_PATTERN = r"!--\s+_RENDERED\s+(?P<data>[\w\-,/]+?)\s+-->"
 # E.g. `table,123,a92ef298,bd002c3`
 # - comp_cls_hash - Cache key of the component class that was rendered
 # - id - Component render ID
 # - js - Cache key for the JS data from `get_js_data()`
 # - css - Cache key for the CSS data from `get_css_data()`
 SCRIPT_NAME_REGEX = re.compile(
-    rb"^(?P<comp_cls_hash>[\w\-\./]+?),(?P<id>[\w]+?),(?P<js>[0-9a-f]*?),(?P<css>[0-9a-f]*?)$"
+    r"^(?P<comp_cls_hash>[\w\-\./]+?),(?P<id>[\w]+?),(?P<js>[0-9a-f]*?),(?P<css>[0-9a-f]*?)$"
 )
 # E.g. `data-djc-id-a1b2c3`
 MAYBE_COMP_ID = r'(?: data-djc-id-\w{6}="")?'
 # E.g. `data-djc-css-99914b`
 MAYBE_COMP_CSS_ID = r'(?: data-djc-css-\w{6}="")?'
 
-PLACEHOLDER_REGEX = re.compile(
-    r"{css_placeholder}|{js_placeholder}".format(
-        css_placeholder=f'<link name="{CSS_PLACEHOLDER_NAME}"{MAYBE_COMP_CSS_ID}{MAYBE_COMP_ID}/?>',
-        js_placeholder=f'<script name="{JS_PLACEHOLDER_NAME}"{MAYBE_COMP_CSS_ID}{MAYBE_COMP_ID}></script>',
-    ).encode()
+# All the parts of the HTML that `render_dependencies()` needs to find. These are found
+# in a single pass over the HTML:
+# - `<!-- _RENDERED ... -->` comments, which are removed
+# - `{% component_css_dependencies %}` and `{% component_js_dependencies %}` placeholders,
+#   which are replaced with the CSS and JS
+# - `</head>` and `</body>` tags, before which the CSS and JS are inserted if there are no placeholders
+#
+# NOTE: All alternatives share the leading `<`, so that the regex engine can quickly skip
+#       to the next `<` in the HTML. Otherwise, the regex engine would try to match
+#       all the alternatives at each position, which is an order of magnitude slower.
+DEPENDENCIES_SCAN_REGEX = re.compile(
+    "<(?:{alternatives})".format(
+        alternatives="|".join(
+            [
+                f"(?P<comment>{COMPONENT_COMMENT_PATTERN})",
+                f'(?P<css>link name="{CSS_PLACEHOLDER_NAME}"{MAYBE_COMP_CSS_ID}{MAYBE_COMP_ID}/?>)',
+                f'(?P<js>script name="{JS_PLACEHOLDER_NAME}"{MAYBE_COMP_CSS_ID}{MAYBE_COMP_ID}></script>)',
+                r"(?P<head>/head\s*>)",
+                r"(?P<body>/body\s*>)",
+            ]
+        )
+    )
 )
 
 
@@ -425,66 +691,97 @@ def render_dependencies(content: TContent, type: RenderType = "document") -> TCo
         return HttpResponse(processed_html)
     ```
     """
+    return render_recorded_dependencies(content, type, [])
+
+
+def render_recorded_dependencies(
+    content: TContent,
+    type: RenderType,
+    recorded_deps: List[ComponentDependencies],
+) -> TContent:
+    """
+    Same as `render_dependencies()`, but includes also the dependencies that were recorded
+    outside of the HTML with `record_component_dependencies()`.
+
+    The recorded dependencies come before those found in the HTML.
+    """
     if type not in ("document", "fragment"):
         raise ValueError(f"Invalid type '{type}'")
 
     is_safestring = isinstance(content, SafeString)
+    html = content.decode() if isinstance(content, bytes) else cast(str, content)
+
+    # Find all the comments, placeholders and `</head>` / `</body>` tags in a single pass.
+    # The output is then assembled from the slices of the original HTML, so that
+    # we don't create intermediate copies of the (possibly large) HTML.
+    deps: List[ComponentDependencies] = [*recorded_deps]
+    # Parts of the HTML to be replaced, as `(start, end, replacement_kind)`
+    replaced_spans: List[Tuple[int, int, Literal["", "css", "js"]]] = []
+    did_find_css_placeholder = False
+    did_find_js_placeholder = False
+    first_end_head_tag_index: Optional[int] = None
+    last_end_body_tag_index: Optional[int] = None
+
+    for match in DEPENDENCIES_SCAN_REGEX.finditer(html):
+        if match["comment"] is not None:
+            deps.append(_parse_dependencies_comment(match["data"]))
+            replaced_spans.append((match.start(), match.end(), ""))
+        elif match["css"] is not None:
+            did_find_css_placeholder = True
+            replaced_spans.append((match.start(), match.end(), "css"))
+        elif match["js"] is not None:
+            did_find_js_placeholder = True
+            replaced_spans.append((match.start(), match.end(), "js"))
+        # We target the first `</head>`, but the last `</body>`
+        elif match["head"] is not None:
+            if first_end_head_tag_index is None:
+                first_end_head_tag_index = match.start()
+        else:
+            last_end_body_tag_index = match.start()
 
-    if isinstance(content, str):
-        content_ = content.encode()
-    else:
-        content_ = cast(bytes, content)
-
-    content_, js_dependencies, css_dependencies = _process_dep_declarations(content_, type)
+    js_dependencies, css_dependencies = _process_dep_declarations(deps, type)
 
     # Replace the placeholders with the actual content
     # If type == `document`, we insert the JS and CSS directly into the HTML,
     #                        where the placeholders were.
     # If type == `fragment`, we let the client-side manager load the JS and CSS,
     #                        and remove the placeholders.
-    did_find_js_placeholder = False
-    did_find_css_placeholder = False
-    css_replacement = css_dependencies if type == "document" else b""
-    js_replacement = js_dependencies if type == "document" else b""
-
-    def on_replace_match(match: "re.Match[bytes]") -> bytes:
-        nonlocal did_find_css_placeholder
-        nonlocal did_find_js_placeholder
-
-        if CSS_PLACEHOLDER_NAME_B in match[0]:
-            replacement = css_replacement
-            did_find_css_placeholder = True
-        elif JS_PLACEHOLDER_NAME_B in match[0]:
-            replacement = js_replacement
-            did_find_js_placeholder = True
-        else:
-            raise RuntimeError(
-                "Unexpected error: Regex for component dependencies processing"
-                f" matched unknown string '{match[0].decode()}'"
-            )
-        return replacement
-
-    content_ = PLACEHOLDER_REGEX.sub(on_replace_match, content_)
+    replacements = {
+        "": "",
+        "css": css_dependencies if type == "document" else "",
+        "js": js_dependencies if type == "document" else "",
+    }
 
     # By default, if user didn't specify any `{% component_dependencies %}`,
     # then try to insert the JS scripts at the end of <body> and CSS sheets at the end
     # of <head>
-    if type == "document" and (not did_find_js_placeholder or not did_find_css_placeholder):
-        maybe_transformed = _insert_js_css_to_default_locations(
-            content_.decode(),
-            css_content=None if did_find_css_placeholder else css_dependencies.decode(),
-            js_content=None if did_find_js_placeholder else js_dependencies.decode(),
-        )
-
-        if maybe_transformed is not None:
-            content_ = maybe_transformed.encode()
+    if type == "document":
+        needs_sort = False
+        if not did_find_css_placeholder and first_end_head_tag_index is not None:
+            replaced_spans.append((first_end_head_tag_index, first_end_head_tag_index, "css"))
+            needs_sort = True
+        if not did_find_js_placeholder and last_end_body_tag_index is not None:
+            replaced_spans.append((last_end_body_tag_index, last_end_body_tag_index, "js"))
+            needs_sort = True
+        if needs_sort:
+            replaced_spans.sort(key=lambda span: span[0])
+
+    output_parts: List[str] = []
+    prev_end = 0
+    for span_start, span_end, replacement_kind in replaced_spans:
+        output_parts.append(html[prev_end:span_start])
+        output_parts.append(replacements[replacement_kind])
+        prev_end = span_end
+    output_parts.append(html[prev_end:])
 
     # In case of a fragment, we only append the JS (actually JSON) to trigger the call of dependency-manager
     if type == "fragment":
-        content_ += js_dependencies
+        output_parts.append(js_dependencies)
+
+    output_html = "".join(output_parts)
 
     # Return the same type as we were given
-    output = content_.decode() if isinstance(content, str) else content_
+    output = output_html.encode() if isinstance(content, bytes) else output_html
     output = mark_safe(output) if is_safestring else output
     return cast(TContent, output)
 
@@ -493,11 +790,202 @@ def render_dependencies(content: TContent, type: RenderType = "document") -> TCo
 _render_dependencies = render_dependencies
 
 
+class DependenciesStreamProcessor:
+    """
+    Insert the JS and CSS dependencies into HTML that's received in chunks.
+
+    Because the chunks are sent out as soon as they are processed, we cannot go back to insert
+    the JS and CSS into `<head>` or `{% component_css_dependencies %}`. Instead:
+
+    - The dependency comments and the `{% component_css_dependencies %}` placeholders are removed
+      from the chunks.
+    - The JS and CSS of the components rendered so far are inserted in place
+      of the `{% component_js_dependencies %}` placeholder, or before `</body>`,
+      whichever comes first.
+    - Components rendered after that point have their JS and CSS loaded by the client-side
+      dependency manager. These are sent in a trailing chunk.
+
+    Dependency comments, placeholders, and `</body>` may be split across chunks.
+    In such case the start of the tag is held back until the next chunk.
+
+    ```py
+    processor = DependenciesStreamProcessor("document")
+    for chunk in chunks:
+        yield processor.feed(chunk)
+    yield processor.finish()
+    ```
+    """
+
+    def __init__(self, type: RenderType = "document") -> None:
+        if type not in ("document", "fragment"):
+            raise ValueError(f"Invalid type '{type}'")
+
+        self.type = type
+        # End of the previous chunk that may be the start of an incomplete tag
+        self._pending = ""
+        # Data from `<!-- _RENDERED ... -->` comments whose JS and CSS were not yet inserted
+        self._deps: List[ComponentDependencies] = []
+        self._did_insert_dependencies = False
+
+    def feed(self, chunk: str) -> str:
+        """Process next chunk of HTML. Returns the HTML that can be sent out."""
+        content = self._pending + chunk
+        split_index = _find_incomplete_tag_start(content)
+        self._pending = content[split_index:]
+        return self._process(content[:split_index])
+
+    def finish(self) -> str:
+        """Process the held back HTML, and the JS and CSS of components that were not yet inserted."""
+        output = self._process(self._pending)
+        self._pending = ""
+
+        if not self._did_insert_dependencies or self._deps:
+            output += self._render_dependencies()
+        return output
+
+    def _process(self, content: str) -> str:
+        output_parts: List[str] = []
+        prev_end = 0
+        for match in DEPENDENCIES_SCAN_REGEX.finditer(content):
+            if match["head"] is not None:
+                continue
+            # Insert the JS and CSS before `</body>`, unless already inserted
+            if match["body"] is not None:
+                if self._did_insert_dependencies:
+                    continue
+                match_start = match_end = match.start()
+                replacement = self._render_dependencies()
+            elif match["comment"] is not None:
+                self._deps.append(_parse_dependencies_comment(match["data"]))
+                match_start, match_end = match.span()
+                replacement = ""
+            elif match["js"] is not None:
+                match_start, match_end = match.span()
+                replacement = self._render_dependencies()
+            else:
+                match_start, match_end = match.span()
+                replacement = ""
+
+            output_parts.append(content[prev_end:match_start])
+            output_parts.append(replacement)
+            prev_end = match_end
+
+        if not output_parts:
+            return content
+        output_parts.append(content[prev_end:])
+        return "".join(output_parts)
+
+    def _render_dependencies(self) -> str:
+        deps = self._deps
+        self._deps = []
+
+        # The JS and CSS is inserted directly into the HTML only the first time. The JS and CSS
+        # of components rendered afterwards is loaded by the dependency manager, same as for fragments.
+        type: RenderType = "fragment" if self._did_insert_dependencies else self.type
+        self._did_insert_dependencies = True
+
+        js_dependencies, css_dependencies = _process_dep_declarations(deps, type)
+
+        # In case of a fragment, we only insert the JS (actually JSON) to trigger the call of dependency-manager
+        if type == "document":
+            return css_dependencies + js_dependencies
+        return js_dependencies
+
+
+def _find_incomplete_tag_start(content: str) -> int:
+    """
+    Find where the content may end with an incomplete dependency comment, placeholder or `</body>` tag.
+    Returns the length of the content if it doesn't.
+    """
+    # Tags that were cut off before their closing `>`
+    index = content.rfind("<")
+    if index == -1 or ">" in content[index:]:
+        index = len(content)
+
+    # The JS placeholder includes `>` in the middle, e.g. `<script name="JS_PLACEHOLDER"></script>`
+    js_placeholder_index = content.rfind(JS_PLACEHOLDER_START, max(0, index - _MAX_JS_PLACEHOLDER_LEN), index)
+    if js_placeholder_index != -1 and "</script>" not in content[js_placeholder_index:]:
+        index = js_placeholder_index
+    return index
+
+
+JS_PLACEHOLDER_START = f'<script name="{JS_PLACEHOLDER_NAME}"'
+# Length of the JS placeholder with both the optional attributes
+_MAX_JS_PLACEHOLDER_LEN = (
+    len(JS_DEPENDENCY_PLACEHOLDER) + len(' data-djc-css-a1b2c3=""') + len(' data-djc-id-a1b2c3=""')
+)
+
+
+def render_dependencies_stream(chunks: Iterable[str], type: RenderType = "document") -> Generator[str, None, None]:
+    """
+    Same as [`render_dependencies()`](../api#django_components.render_dependencies), but for content
+    that is rendered in chunks, e.g. with
+    [`Component.render_to_stream()`](../api#django_components.Component.render_to_stream).
+
+    Because the chunks are sent out as soon as they are rendered, we cannot go back to insert
+    the JS and CSS into `<head>` or `{% component_css_dependencies %}`. Instead:
+
+    - The JS and CSS of the components rendered so far are inserted in place
+      of `{% component_js_dependencies %}`, or before `</body>`, whichever comes first.
+    - The JS and CSS of components rendered after that point are sent in a trailing chunk,
+      and loaded by the client-side dependency manager.
+    - The dependency comments and the `{% component_css_dependencies %}` placeholders
+      are removed from the chunks.
+    """
+    processor = DependenciesStreamProcessor(type)
+
+    for chunk in chunks:
+        output = processor.feed(chunk)
+        if output:
+            yield output
+
+    output = processor.finish()
+    if output:
+        yield output
+
+
+async def render_dependencies_astream(
+    chunks: AsyncIterable[str],
+    type: RenderType = "document",
+) -> AsyncGenerator[str, None]:
+    """Same as `render_dependencies_stream()`, but for async iterators."""
+    processor = DependenciesStreamProcessor(type)
+
+    # Inserting the JS / CSS dependencies may read from the cache. So we do so in a thread,
+    # so we don't block the event loop.
+    async for chunk in chunks:
+        output = await sync_to_async(processor.feed)(chunk)
+        if output:
+            yield output
+
+    output = await sync_to_async(processor.finish)()
+    if output:
+        yield output
+
+
+def _parse_dependencies_comment(data: str) -> ComponentDependencies:
+    """
+    Parse the data of a `<!-- _RENDERED ... -->` comment, e.g. `table_10bac31,123,a92ef298,bd002c3`,
+    into `(comp_cls_hash, js_input_hash, css_input_hash)`.
+    """
+    part_match = SCRIPT_NAME_REGEX.match(data)
+    if not part_match:
+        raise RuntimeError("Malformed dependencies data")
+
+    return (
+        part_match.group("comp_cls_hash"),
+        part_match.group("js") or None,
+        part_match.group("css") or None,
+    )
+
+
 # Overview of this function:
-# 1. We extract all HTML comments like `<!-- _RENDERED table_10bac31,1234-->`.
+# 1. We receive the data of all rendered components, either from HTML comments
+#    like `<!-- _RENDERED table_10bac31,1234-->`, or recorded in the `RenderSession`.
 # 2. We look up the corresponding component classes
 # 3. For each component class we get the component's inlined JS and CSS,
-#    and the JS and CSS from `Media.js/css`
+#    and the JS and CSS from `Media.js/css`. These are computed only once per class,
+#    see `get_dependency_manifest()`.
 # 4. We add our client-side JS logic into the mix (`django_components/django_components.min.js`)
 #    - For fragments, we would skip this step.
 # 5. For all the above JS and CSS, we figure out which JS / CSS needs to be inserted directly
@@ -514,56 +1002,28 @@ _render_dependencies = render_dependencies
 #      will be fetched and executed only once.
 # 6. And lastly, we generate a JS script that will load / mark as loaded the JS and CSS
 #    as categorized in previous step.
-def _process_dep_declarations(content: bytes, type: RenderType) -> Tuple[bytes, bytes, bytes]:
+def _process_dep_declarations(all_deps: List[ComponentDependencies], type: RenderType) -> Tuple[str, str]:
     """
-    Process a textual content that may include metadata on rendered components.
-    The metadata has format like this
-
-    `<!-- _RENDERED component_name,component_id,js_hash,css_hash;... -->`
-
-    E.g.
+    Process the metadata on rendered components, as `(comp_cls_hash, js_input_hash, css_input_hash)`,
+    e.g. as extracted from comments like
 
     `<!-- _RENDERED table_10bac31,123,a92ef298,bd002c3 -->`
-    """
-    # Extract all matched instances of `<!-- _RENDERED ... -->` while also removing them from the text
-    all_parts: List[bytes] = list()
-
-    def on_replace_match(match: "re.Match[bytes]") -> bytes:
-        all_parts.append(match.group("data"))
-        return b""
-
-    content = COMPONENT_COMMENT_REGEX.sub(on_replace_match, content)
 
+    Returns a tuple of JS and CSS that should be inserted into the HTML.
+    """
     # NOTE: Python's set does NOT preserve order
     seen_comp_hashes: Set[str] = set()
     comp_hashes: List[str] = []
     # Used for passing Python vars to JS/CSS
     inputs_data: List[Tuple[str, ScriptType, Optional[str]]] = []
-    comp_data: List[Tuple[str, ScriptType, Optional[str]]] = []
-
-    # Process individual parts. Each part is like a CSV row of `name,id,js,css`.
-    # E.g. something like this:
-    # `table_10bac31,1234,a92ef298,a92ef298`
-    for part in all_parts:
-        part_match = SCRIPT_NAME_REGEX.match(part)
-
-        if not part_match:
-            raise RuntimeError("Malformed dependencies data")
-
-        comp_cls_hash: str = part_match.group("comp_cls_hash").decode("utf-8")
-        js_input_hash: Optional[str] = part_match.group("js").decode("utf-8") or None
-        css_input_hash: Optional[str] = part_match.group("css").decode("utf-8") or None
 
+    for comp_cls_hash, js_input_hash, css_input_hash in all_deps:
         if comp_cls_hash in seen_comp_hashes:
             continue
 
         comp_hashes.append(comp_cls_hash)
         seen_comp_hashes.add(comp_cls_hash)
 
-        # Schedule to load the `<script>` / `<link>` tags for the JS / CSS from `Component.js/css`.
-        comp_data.append((comp_cls_hash, "js", None))
-        comp_data.append((comp_cls_hash, "css", None))
-
         # Schedule to load the `<script>` / `<link>` tags for the JS / CSS variables.
         # Skip if no variables are defined.
         if js_input_hash is not None:
@@ -571,60 +1031,99 @@ def _process_dep_declarations(content: bytes, type: RenderType) -> Tuple[bytes,
         if css_input_hash is not None:
             inputs_data.append((comp_cls_hash, "css", css_input_hash))
 
+    # Fetch all the scripts that we may need with a single `get_many()` call, instead of reaching
+    # the (possibly remote) cache for each script. Afterwards, the scripts are read from the in-process cache.
+    script_cache_keys: List[str] = []
+    for comp_cls_hash in comp_hashes:
+        comp_cls = comp_hash_mapping[comp_cls_hash]
+        if is_nonempty_str(comp_cls.js):
+            script_cache_keys.append(_gen_cache_key(comp_cls_hash, "js", None))
+        if is_nonempty_str(comp_cls.css):
+            script_cache_keys.append(_gen_cache_key(comp_cls_hash, "css", None))
+    for comp_cls_hash, script_type, input_hash in inputs_data:
+        script_cache_keys.append(_gen_cache_key(comp_cls_hash, script_type, input_hash))
+    get_component_media_cache().get_many(script_cache_keys)
+
     (
-        to_load_input_js_urls,
-        to_load_input_css_urls,
+        to_load_input_js_scripts,
+        to_load_input_css_scripts,
         inlined_input_js_tags,
         inlined_input_css_tags,
         loaded_input_js_urls,
         loaded_input_css_urls,
     ) = _prepare_tags_and_urls(inputs_data, type)
 
-    (
-        to_load_component_js_urls,
-        to_load_component_css_urls,
-        inlined_component_js_tags,
-        inlined_component_css_tags,
-        loaded_component_js_urls,
-        loaded_component_css_urls,
-    ) = _prepare_tags_and_urls(comp_data, type)
-
-    def get_component_media(comp_cls_hash: str) -> Media:
-        comp_cls = comp_hash_mapping[comp_cls_hash]
-        # NOTE: We instantiate the component classes so the `Media` are processed into `media`
-        comp = comp_cls()
-        return comp.media
-
-    all_medias = [
-        # JS / CSS files from Component.Media.js/css.
-        *[get_component_media(comp_cls_hash) for comp_cls_hash in comp_hashes],
-        # All the inlined scripts that we plan to fetch / load
-        Media(
-            js=[*to_load_component_js_urls, *to_load_input_js_urls],
-            css={"all": [*to_load_component_css_urls, *to_load_input_css_urls]},
-        ),
-    ]
-
-    # Once we have ALL JS and CSS URLs that we want to fetch, we can convert them to
-    # <script> and <link> tags. Note that this is done by the user-provided Media classes.
-    # fmt: off
-    to_load_css_tags = [
-        tag
-        for media in all_medias if media is not None
-        for tag in media.render_css()
-    ]
-    to_load_js_tags = [
-        tag
-        for media in all_medias if media is not None
-        for tag in media.render_js()
-    ]
-    # fmt: on
-
-    # Postprocess all <script> and <link> tags to 1) dedupe, and 2) extract URLs.
+    # JS / CSS of the components themselves doesn't change between renders, so we get it
+    # from the precomputed manifests.
+    manifests = [get_dependency_manifest(comp_hash_mapping[comp_cls_hash]) for comp_cls_hash in comp_hashes]
+
+    # Collect all <script> and <link> tags that we plan to fetch / load, keyed by their URLs.
     # For the deduplication, if multiple components link to the same JS/CSS, but they
     # render the <script> or <link> tag differently, we go with the first tag that we come across.
-    to_load_css_tags, to_load_css_urls = _postprocess_media_tags("css", to_load_css_tags)
-    to_load_js_tags, to_load_js_urls = _postprocess_media_tags("js", to_load_js_tags)
+    to_load_js_tags_by_url: Dict[str, str] = {}
+    to_load_css_tags_by_url: Dict[str, str] = {}
+    # JS / CSS files from Component.Media.js/css.
+    for manifest in manifests:
+        for url, tag in manifest.media_js:
+            to_load_js_tags_by_url.setdefault(url, tag)
+        for url, tag in manifest.media_css:
+            to_load_css_tags_by_url.setdefault(url, tag)
+
+    # When NOT a document (AKA is a fragment), then the inlined scripts are NOT inserted into
+    # the HTML, and instead we fetch and load them all via our JS dependency manager.
+    # If there's more than one script of the same type, we fetch them all at once, as a bundle.
+    to_load_js_bundles: List[Tuple[str, List[str]]] = []
+    to_load_css_bundles: List[Tuple[str, List[str]]] = []
+    if type == "fragment":
+        to_load_js_scripts: List[CachedScript] = []
+        to_load_css_scripts: List[CachedScript] = []
+        for comp_cls_hash, manifest in zip(comp_hashes, manifests):
+            comp_cls = comp_hash_mapping[comp_cls_hash]
+            if manifest.js is not None:
+                to_load_js_scripts.append((comp_cls, None, manifest.js.url))
+            if manifest.css is not None:
+                to_load_css_scripts.append((comp_cls, None, manifest.css.url))
+        to_load_js_scripts.extend(to_load_input_js_scripts)
+        to_load_css_scripts.extend(to_load_input_css_scripts)
+
+        script_groups: List[Tuple[ScriptType, List[CachedScript], Dict[str, str], List[Tuple[str, List[str]]]]] = [
+            ("js", to_load_js_scripts, to_load_js_tags_by_url, to_load_js_bundles),
+            ("css", to_load_css_scripts, to_load_css_tags_by_url, to_load_css_bundles),
+        ]
+        for script_type, scripts, tags_by_url, bundles in script_groups:
+            if len(scripts) == 1:
+                url = scripts[0][2]
+                tags_by_url.setdefault(url, _render_url_tag(script_type, url))
+            elif scripts:
+                bundle_hash = cache_bundle(script_type, scripts)
+                bundle_url = get_bundle_url(
+                    script_type,
+                    bundle_hash,
+                    [(comp_cls, input_hash) for comp_cls, input_hash, _ in scripts],
+                )
+                bundle_tag = _render_url_tag(script_type, bundle_url)
+                bundles.append((bundle_tag, [url for _, _, url in scripts]))
+
+    to_load_js_urls = list(to_load_js_tags_by_url.keys())
+    to_load_css_urls = list(to_load_css_tags_by_url.keys())
+    to_load_js_tags = list(to_load_js_tags_by_url.values())
+    to_load_css_tags = list(to_load_css_tags_by_url.values())
+
+    # When `type="document"`, we insert the actual <script> and <style> tags into the HTML.
+    # But even in that case we still need to call `Components.manager.markScriptLoaded`,
+    # so the client knows NOT to fetch them again.
+    inlined_component_js_tags: List[str] = []
+    inlined_component_css_tags: List[str] = []
+    loaded_component_js_urls: List[str] = []
+    loaded_component_css_urls: List[str] = []
+    if type == "document":
+        for manifest in manifests:
+            if manifest.js is not None:
+                inlined_component_js_tags.append(manifest.js.inlined_tag)
+                loaded_component_js_urls.append(manifest.js.url)
+            if manifest.css is not None:
+                inlined_component_css_tags.append(manifest.css.inlined_tag)
+                loaded_component_css_urls.append(manifest.css.url)
 
     loaded_css_urls = sorted(
         [
@@ -650,6 +1149,8 @@ def _process_dep_declarations(content: bytes, type: RenderType) -> Tuple[bytes,
     exec_script = _gen_exec_script(
         to_load_js_tags=to_load_js_tags if type == "fragment" else [],
         to_load_css_tags=to_load_css_tags if type == "fragment" else [],
+        to_load_js_bundles=to_load_js_bundles,
+        to_load_css_bundles=to_load_css_bundles,
         loaded_js_urls=loaded_js_urls,
         loaded_css_urls=loaded_css_urls,
     )
@@ -694,7 +1195,7 @@ def _process_dep_declarations(content: bytes, type: RenderType) -> Tuple[bytes,
         ]
     )
 
-    return (content, final_script_tags.encode("utf-8"), final_css_tags.encode("utf-8"))
+    return (final_script_tags, final_css_tags)
 
 
 href_pattern = re.compile(r'href="([^"]+)"')
@@ -743,12 +1244,95 @@ def _postprocess_media_tags(
     return tags, urls
 
 
+class InlinedScript(NamedTuple):
+    url: str
+    """URL from which the script can be fetched, e.g. `/components/cache/table_10bac31.js`"""
+    url_tag: str
+    """`<script>` or `<link>` tag that fetches the script from `url`"""
+    inlined_tag: str
+    """`<script>` or `<style>` tag with the script's content"""
+
+
+class DependencyManifest(NamedTuple):
+    """
+    JS and CSS dependencies of a component class, as inserted by `render_dependencies()`.
+
+    These don't change between renders, so they are computed only once per class.
+    """
+
+    js: Optional[InlinedScript]
+    """JS from `Component.js`, or `None` if not set"""
+    css: Optional[InlinedScript]
+    """CSS from `Component.css`, or `None` if not set"""
+    media_js: Tuple[Tuple[str, str], ...]
+    """Pairs of `(url, tag)` for the JS from `Component.Media.js`"""
+    media_css: Tuple[Tuple[str, str], ...]
+    """Pairs of `(url, tag)` for the CSS from `Component.Media.css`"""
+
+
+# NOTE: Manifests are held per component class, so when a component class is redefined,
+# the new class gets a new manifest, and the old one is garbage collected together with the old class.
+#
+# The URLs depend on the script prefix (e.g. when Django is served from a subpath), which is set
+# per request. So for each class, we keep a manifest per script prefix.
+if sys.version_info < (3, 9):
+    dependency_manifests: WeakKeyDictionary = WeakKeyDictionary()
+else:
+    dependency_manifests: WeakKeyDictionary[Type["Component"], Dict[str, DependencyManifest]] = WeakKeyDictionary()
+
+
+def get_dependency_manifest(comp_cls: Type["Component"]) -> DependencyManifest:
+    manifests = dependency_manifests.get(comp_cls)
+    if manifests is None:
+        manifests = dependency_manifests.setdefault(comp_cls, {})
+
+    script_prefix = get_script_prefix()
+    manifest = manifests.get(script_prefix)
+    if manifest is None:
+        manifest = manifests.setdefault(script_prefix, _gen_dependency_manifest(comp_cls))
+    return manifest
+
+
+def _gen_dependency_manifest(comp_cls: Type["Component"]) -> DependencyManifest:
+    def gen_inlined_script(script_type: ScriptType) -> InlinedScript:
+        url = get_script_url(script_type, comp_cls, None)
+        return InlinedScript(
+            url=url,
+            url_tag=_render_url_tag(script_type, url),
+            inlined_tag=get_script_tag(script_type, comp_cls, None),
+        )
+
+    # NOTE: `Component.media` is resolved on the class, so there's no need to instantiate the component.
+    media = comp_cls.media
+    media_js_tags, media_js_urls = _postprocess_media_tags("js", list(media.render_js()) if media else [])
+    media_css_tags, media_css_urls = _postprocess_media_tags("css", list(media.render_css()) if media else [])
+
+    return DependencyManifest(
+        js=gen_inlined_script("js") if is_nonempty_str(comp_cls.js) else None,
+        css=gen_inlined_script("css") if is_nonempty_str(comp_cls.css) else None,
+        media_js=tuple(zip(media_js_urls, media_js_tags)),
+        media_css=tuple(zip(media_css_urls, media_css_tags)),
+    )
+
+
+# Render the `<script src="...">` or `<link href="...">` tag for the JS / CSS that we serve ourselves
+def _render_url_tag(script_type: ScriptType, url: str) -> str:
+    if script_type == "js":
+        return "".join(Media(js=[url]).render_js())
+    else:
+        return "".join(Media(css={"all": [url]}).render_css())
+
+
+# Scripts served from our cache, as `(component_class, input_hash, url)`
+CachedScript = Tuple[Type["Component"], Optional[str], str]
+
+
 def _prepare_tags_and_urls(
     data: List[Tuple[str, ScriptType, Optional[str]]],
     type: RenderType,
-) -> Tuple[List[str], List[str], List[str], List[str], List[str], List[str]]:
-    to_load_js_urls: List[str] = []
-    to_load_css_urls: List[str] = []
+) -> Tuple[List[CachedScript], List[CachedScript], List[str], List[str], List[str], List[str]]:
+    to_load_js_scripts: List[CachedScript] = []
+    to_load_css_scripts: List[CachedScript] = []
     inlined_js_tags: List[str] = []
     inlined_css_tags: List[str] = []
     loaded_js_urls: List[str] = []
@@ -784,14 +1368,14 @@ def _prepare_tags_and_urls(
         # the HTML, and instead we fetch and load them all via our JS dependency manager.
         else:
             if script_type == "js" and is_nonempty_str(comp_cls.js):
-                to_load_js_urls.append(get_script_url("js", comp_cls, input_hash))
+                to_load_js_scripts.append((comp_cls, input_hash, get_script_url("js", comp_cls, input_hash)))
 
             if script_type == "css" and is_nonempty_str(comp_cls.css):
-                to_load_css_urls.append(get_script_url("css", comp_cls, input_hash))
+                to_load_css_scripts.append((comp_cls, input_hash, get_script_url("css", comp_cls, input_hash)))
 
     return (
-        to_load_js_urls,
-        to_load_css_urls,
+        to_load_js_scripts,
+        to_load_css_scripts,
         inlined_js_tags,
         inlined_css_tags,
         loaded_js_urls,
@@ -804,11 +1388,24 @@ def get_script_content(
     comp_cls: Type["Component"],
     input_hash: Optional[str],
 ) -> Optional[str]:
-    cache = get_component_media_cache()
     cache_key = _gen_cache_key(comp_cls._class_hash, script_type, input_hash)
-    script = cache.get(cache_key)
+    script = get_component_media_cache().get(cache_key)
+    if script is not None:
+        return script.decode()
+
+    # Component's own JS / CSS is always known, so if it was evicted from the cache, we cache it again.
+    # JS / CSS variables can't be re-created without the component's inputs.
+    if input_hash is None:
+        scripts: Dict[str, str] = {}
+        if script_type == "js":
+            cache_component_js(comp_cls, scripts)
+        else:
+            cache_component_css(comp_cls, scripts)
+        if cache_key in scripts:
+            _set_scripts_in_cache(scripts)
+            return scripts[cache_key]
 
-    return script
+    return None
 
 
 def get_script_tag(
@@ -833,19 +1430,138 @@ def get_script_tag(
     return content
 
 
+class CacheUrlTemplates(NamedTuple):
+    """
+    URLs of the cache endpoints, with placeholders in place of the URL parameters.
+
+    E.g. `/components/cache/{comp_cls_hash}.{script_type}`
+    """
+
+    script: str
+    """URL of component's JS / CSS"""
+    input_script: str
+    """URL of component's JS / CSS variables"""
+    bundle: str
+    """URL of a bundle of JS / CSS"""
+    urls: "LRUCache[str]"
+    """Already generated URLs, keyed by `(script_type, comp_cls_hash, input_hash)`"""
+
+
+# Resolving URLs with `reverse()` is slow, as Django has to go through the URL patterns
+# and substitute the parameters with regexes. So we resolve the URLs of the cache endpoints only once,
+# and then generate the URLs with string formatting.
+#
+# The URLs depend on the script prefix (set per request), and on the URLconf. Django holds
+# one resolver per URLconf, and creates new resolvers when the URLconf changes (e.g. `ROOT_URLCONF`
+# is overriden in tests). So we keep the templates per resolver, and per script prefix.
+if sys.version_info < (3, 9):
+    cache_url_templates: WeakKeyDictionary = WeakKeyDictionary()
+else:
+    cache_url_templates: WeakKeyDictionary[URLResolver, Dict[str, CacheUrlTemplates]] = WeakKeyDictionary()
+
+# Max number of generated URLs that we keep per URL templates.
+# NOTE: URLs of JS / CSS variables are unique for each combination of variables,
+# so the number of URLs is not bound by the number of components.
+CACHE_URLS_MEMO_SIZE = 4096
+
+# Hashes of the scripts' content, keyed by the scripts' cache keys, so that we don't have to
+# fetch and hash the script each time we generate its URL.
+# NOTE: Set whenever a script is stored in the media cache, so the hash is updated when the script changes.
+content_hashes: "LRUCache[str]" = LRUCache(maxsize=CACHE_URLS_MEMO_SIZE)
+
+
+def get_cache_url_templates() -> CacheUrlTemplates:
+    resolver = get_resolver(get_urlconf())
+    templates_by_prefix = cache_url_templates.get(resolver)
+    if templates_by_prefix is None:
+        templates_by_prefix = cache_url_templates.setdefault(resolver, {})
+
+    script_prefix = get_script_prefix()
+    templates = templates_by_prefix.get(script_prefix)
+    if templates is None:
+        templates = templates_by_prefix.setdefault(script_prefix, _gen_cache_url_templates())
+    return templates
+
+
+def _gen_cache_url_templates() -> CacheUrlTemplates:
+    def reverse_template(viewname: str, params: List[str]) -> str:
+        # NOTE: Placeholders like `{script_type}` would be URL-encoded by `reverse()`,
+        # so we use URL-safe markers instead, and replace them afterwards.
+        url = reverse(viewname, kwargs={param: f"__djc_{param}__" for param in params})
+        for param in params:
+            url = url.replace(f"__djc_{param}__", f"{{{param}}}")
+        return url
+
+    return CacheUrlTemplates(
+        script=reverse_template(CACHE_ENDPOINT_NAME, ["comp_cls_hash", "script_type"]),
+        input_script=reverse_template(CACHE_ENDPOINT_NAME, ["comp_cls_hash", "input_hash", "script_type"]),
+        bundle=reverse_template(BUNDLE_ENDPOINT_NAME, ["bundle_hash", "script_type"]),
+        urls=LRUCache(maxsize=CACHE_URLS_MEMO_SIZE),
+    )
+
+
+# Same as how `reverse()` escapes the URL, so the URLs are the same as if generated by `reverse()`
+def _quote_url_param(value: str) -> str:
+    return quote(value, safe=RFC3986_SUBDELIMS + "/~:@")
+
+
 def get_script_url(
     script_type: ScriptType,
     comp_cls: Type["Component"],
     input_hash: Optional[str],
 ) -> str:
-    return reverse(
-        CACHE_ENDPOINT_NAME,
-        kwargs={
-            "comp_cls_hash": comp_cls._class_hash,
-            "script_type": script_type,
-            **({"input_hash": input_hash} if input_hash is not None else {}),
-        },
+    templates = get_cache_url_templates()
+    url_key = (script_type, comp_cls._class_hash, input_hash)
+    url = templates.urls.get(url_key)
+    if url is None:
+        if input_hash is None:
+            url = templates.script.format(
+                comp_cls_hash=_quote_url_param(comp_cls._class_hash),
+                script_type=script_type,
+            )
+        else:
+            url = templates.input_script.format(
+                comp_cls_hash=_quote_url_param(comp_cls._class_hash),
+                input_hash=_quote_url_param(input_hash),
+                script_type=script_type,
+            )
+        templates.urls.set(url_key, url)
+
+    # Add the hash of the content to the URL, e.g. `/components/cache/MyComp_ab0c2d.js?v=1a2b3c4d`.
+    # When the content changes, so does the URL. So the response can be cached "forever".
+    cache_key = _gen_cache_key(comp_cls._class_hash, script_type, input_hash)
+    content_hash = content_hashes.get(cache_key)
+    if content_hash is None:
+        content = get_script_content(script_type, comp_cls, input_hash)
+        if content is not None:
+            content_hash = _gen_content_hash(content)
+            content_hashes.set(cache_key, content_hash)
+
+    if content_hash is not None:
+        url += f"?{CONTENT_HASH_PARAM}={content_hash}"
+    return url
+
+
+def get_bundle_url(
+    script_type: ScriptType,
+    bundle_hash: str,
+    scripts: Sequence[Tuple[Type["Component"], Optional[str]]],
+) -> str:
+    """
+    Get the URL of a bundle, given the `(component_class, input_hash)` of the bundled scripts.
+
+    The scripts are listed in the URL, e.g. `/components/cache/bundle/1a2b3c4d.js?s=MyComp_ab0c2d,Table_e7f8a9.0ab2c3`,
+    so the bundle can be generated again if it's not in the cache.
+    """
+    url = get_cache_url_templates().bundle.format(
+        bundle_hash=_quote_url_param(bundle_hash),
+        script_type=script_type,
+    )
+    script_ids = sorted(
+        comp_cls._class_hash if input_hash is None else f"{comp_cls._class_hash}.{input_hash}"
+        for comp_cls, input_hash in scripts
     )
+    return f"{url}?{BUNDLE_SCRIPTS_PARAM}={_quote_url_param(','.join(script_ids))}"
 
 
 def _gen_exec_script(
@@ -853,9 +1569,13 @@ def _gen_exec_script(
     to_load_css_tags: List[str],
     loaded_js_urls: List[str],
     loaded_css_urls: List[str],
+    to_load_js_bundles: Sequence[Tuple[str, List[str]]] = (),
+    to_load_css_bundles: Sequence[Tuple[str, List[str]]] = (),
 ) -> Optional[str]:
     # Return None if all lists are empty
-    if not any([to_load_js_tags, to_load_css_tags, loaded_css_urls, loaded_js_urls]):
+    if not any(
+        [to_load_js_tags, to_load_css_tags, loaded_css_urls, loaded_js_urls, to_load_js_bundles, to_load_css_bundles]
+    ):
         return None
 
     def map_to_base64(lst: Sequence[str]) -> List[str]:
@@ -873,6 +1593,14 @@ def _gen_exec_script(
         "loadedJsUrls": map_to_base64(loaded_js_urls),
         "toLoadCssTags": map_to_base64(to_load_css_tags),
         "toLoadJsTags": map_to_base64(to_load_js_tags),
+        # Bundles are loaded after the tags. Each bundle is given together with the URLs
+        # of the scripts it contains, so the client can skip scripts that were already loaded.
+        "toLoadCssBundles": [
+            {"tag": map_to_base64([tag])[0], "urls": map_to_base64(urls)} for tag, urls in to_load_css_bundles
+        ],
+        "toLoadJsBundles": [
+            {"tag": map_to_base64([tag])[0], "urls": map_to_base64(urls)} for tag, urls in to_load_js_bundles
+        ],
     }
 
     # NOTE: This data is embedded into the HTML as JSON. It is the responsibility of
@@ -884,66 +1612,6 @@ def _gen_exec_script(
     return exec_script
 
 
-head_or_body_end_tag_re = re.compile(r"<\/(?:head|body)\s*>", re.DOTALL)
-
-
-def _insert_js_css_to_default_locations(
-    html_content: str,
-    js_content: Optional[str],
-    css_content: Optional[str],
-) -> Optional[str]:
-    """
-    This function tries to insert the JS and CSS content into the default locations.
-
-    JS is inserted at the end of `<body>`, and CSS is inserted at the end of `<head>`.
-
-    We find these tags by looking for the first `</head>` and last `</body>` tags.
-    """
-    if css_content is None and js_content is None:
-        return None
-
-    did_modify_html = False
-
-    first_end_head_tag_index = None
-    last_end_body_tag_index = None
-
-    # First check the content for the first `</head>` and last `</body>` tags
-    for match in head_or_body_end_tag_re.finditer(html_content):
-        tag_name = match[0][2:6]
-
-        # We target the first `</head>`, thus, after we set it, we skip the rest
-        if tag_name == "head":
-            if css_content is not None and first_end_head_tag_index is None:
-                first_end_head_tag_index = match.start()
-
-        # But for `</body>`, we want the last occurrence, so we insert the content only
-        # after the loop.
-        elif tag_name == "body":
-            if js_content is not None:
-                last_end_body_tag_index = match.start()
-
-        else:
-            raise ValueError(f"Unexpected tag name '{tag_name}'")
-
-    # Then do two string insertions. First the CSS, because we assume that <head> is before <body>.
-    index_offset = 0
-    updated_html = html_content
-    if css_content is not None and first_end_head_tag_index is not None:
-        updated_html = updated_html[:first_end_head_tag_index] + css_content + updated_html[first_end_head_tag_index:]
-        index_offset = len(css_content)
-        did_modify_html = True
-
-    if js_content is not None and last_end_body_tag_index is not None:
-        js_index = last_end_body_tag_index + index_offset
-        updated_html = updated_html[:js_index] + js_content + updated_html[js_index:]
-        did_modify_html = True
-
-    if did_modify_html:
-        return updated_html
-    else:
-        return None  # No changes made
-
-
 #########################################################
 # 4. Endpoints for fetching the JS / CSS scripts from within
 #    the browser, as defined from previous steps.
@@ -951,7 +1619,14 @@ def _insert_js_css_to_default_locations(
 
 
 CACHE_ENDPOINT_NAME = "components_cached_script"
+BUNDLE_ENDPOINT_NAME = "components_cached_bundle"
+CONTENT_HASH_PARAM = "v"
+BUNDLE_SCRIPTS_PARAM = "s"
 _CONTENT_TYPES = {"js": "text/javascript", "css": "text/css"}
+# Scripts requested with the hash of their current content never change, so they may be cached for a year.
+# Otherwise, the browsers have to revalidate them with the ETag.
+_IMMUTABLE_CACHE_CONTROL = {"public": True, "max_age": 60 * 60 * 24 * 365, "immutable": True}
+_REVALIDATE_CACHE_CONTROL = {"no_cache": True}
 
 
 def _get_content_types(script_type: ScriptType) -> str:
@@ -974,15 +1649,126 @@ def cached_script_view(
     if comp_cls is None:
         return HttpResponseNotFound()
 
-    script = get_script_content(script_type, comp_cls, input_hash)
+    # NOTE: The scripts are held in the cache as bytes, so we can send them as they are
+    cache_key = _gen_cache_key(comp_cls._class_hash, script_type, input_hash)
+    script = get_component_media_cache().get(cache_key)
     if script is None:
+        # The script may have been evicted from the cache, see `get_script_content()`
+        script_str = get_script_content(script_type, comp_cls, input_hash)
+        if script_str is None:
+            return HttpResponseNotFound()
+        script = script_str.encode()
+
+    content_hash = _gen_content_hash(script)
+    return _create_script_response(
+        req,
+        script=script,
+        script_type=script_type,
+        cache_key=cache_key,
+        content_hash=content_hash,
+        immutable=req.GET.get(CONTENT_HASH_PARAM) == content_hash,
+    )
+
+
+def cached_bundle_view(
+    req: HttpRequest,
+    bundle_hash: str,
+    script_type: ScriptType,
+) -> HttpResponse:
+    if req.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+
+    cache_key = _gen_bundle_cache_key(bundle_hash, script_type)
+    script = get_component_media_cache().get(cache_key)
+    if script is not None:
+        # NOTE: Bundle's hash is derived from the content of the scripts, so the bundle never changes
+        return _create_script_response(
+            req,
+            script=script,
+            script_type=script_type,
+            cache_key=cache_key,
+            content_hash=bundle_hash,
+            immutable=True,
+        )
+
+    # The bundle is not in the cache, e.g. because it was rendered by another process,
+    # so we generate it again from the scripts listed in the URL.
+    scripts: List[CachedScript] = []
+    for script_id in req.GET.get(BUNDLE_SCRIPTS_PARAM, "").split(","):
+        comp_cls_hash, _, input_hash = script_id.partition(".")
+        comp_cls = comp_hash_mapping.get(comp_cls_hash)
+        if comp_cls is None:
+            return HttpResponseNotFound()
+        scripts.append((comp_cls, input_hash or None, get_script_url(script_type, comp_cls, input_hash or None)))
+
+    bundle = _gen_bundle(script_type, scripts)
+    if bundle is None:
         return HttpResponseNotFound()
 
+    # If the scripts changed since the page was rendered, the bundle is different from the requested one.
+    # So we don't cache it under the requested hash, and the browser has to revalidate it.
+    current_hash = _gen_bundle_hash(scripts)
+    if current_hash == bundle_hash:
+        _set_scripts_in_cache({cache_key: bundle})
+    return _create_script_response(
+        req,
+        script=bundle.encode(),
+        script_type=script_type,
+        cache_key=cache_key,
+        content_hash=current_hash,
+        immutable=current_hash == bundle_hash,
+    )
+
+
+def _create_script_response(
+    req: HttpRequest,
+    script: bytes,
+    script_type: ScriptType,
+    cache_key: str,
+    content_hash: str,
+    immutable: bool,
+) -> HttpResponse:
     content_type = _get_content_types(script_type)
-    return HttpResponse(content=script, content_type=content_type)
+
+    # Send the precompressed script if the browser accepts it, see `COMPONENTS.cache_compression`.
+    encoding, content = _get_encoded_script(req, cache_key)
+    response = HttpResponse(content=script if content is None else content, content_type=content_type)
+    if encoding is not None:
+        response.headers["Content-Encoding"] = encoding
+    if app_settings.CACHE_COMPRESSION:
+        patch_vary_headers(response, ["Accept-Encoding"])
+
+    # NOTE: Each encoding is a different representation of the script, so it needs a different ETag
+    response.headers["ETag"] = quote_etag(content_hash if encoding is None else f"{content_hash}-{encoding}")
+    if immutable:
+        patch_cache_control(response, **_IMMUTABLE_CACHE_CONTROL)
+    else:
+        patch_cache_control(response, **_REVALIDATE_CACHE_CONTROL)
+
+    # Respond with 304 Not Modified if the browser already has this version of the script
+    conditional_response = get_conditional_response(req, etag=response.headers["ETag"], response=response)
+    return response if conditional_response is None else conditional_response
+
+
+def _get_encoded_script(
+    req: HttpRequest,
+    cache_key: str,
+) -> Tuple[Optional[CacheCompressionType], Optional[bytes]]:
+    accept_encoding = req.headers.get("Accept-Encoding", "")
+    for encoding in app_settings.CACHE_COMPRESSION:
+        if not re.search(rf"\b{encoding}\b", accept_encoding):
+            continue
+        encoded_cache_key = _gen_encoded_cache_key(cache_key, encoding)
+        content = get_component_media_cache().get(encoded_cache_key)
+        # NOTE: The compressed copy may be missing if the setting was changed after the script was cached.
+        if content is not None:
+            return encoding, content
+    return None, None
 
 
 urlpatterns = [
+    # E.g. `/components/cache/bundle/1a2b3c4d.js`
+    path("cache/bundle/<str:bundle_hash>.<str:script_type>", cached_bundle_view, name=BUNDLE_ENDPOINT_NAME),
     # E.g. `/components/cache/table.js` or `/components/cache/table.0ab2c3.js`
     path("cache/<str:comp_cls_hash>.<str:input_hash>.<str:script_type>", cached_script_view, name=CACHE_ENDPOINT_NAME),
     path("cache/<str:comp_cls_hash>.<str:script_type>", cached_script_view, name=CACHE_ENDPOINT_NAME),
@@ -1020,17 +1806,69 @@ class ComponentDependencyMiddleware:
     # NOTE: Required to work with async
     async def __acall__(self, request: HttpRequest) -> HttpResponseBase:
         response = await self._get_response(request)
-        response = self._process_response(response)
+
+        # Streamed responses are processed only as their content is consumed
+        if isinstance(response, StreamingHttpResponse):
+            return self._process_response(response)
+
+        # Inserting the JS / CSS dependencies means parsing the whole HTML and possibly
+        # reading from the cache. So we do so in a thread, so we don't block the event loop.
+        if self._should_process_response(response):
+            response = await sync_to_async(self._process_response)(response)
         return response
 
-    def _process_response(self, response: HttpResponse) -> HttpResponse:
-        if not isinstance(response, StreamingHttpResponse) and response.get("Content-Type", "").startswith(
-            "text/html"
-        ):
+    def _process_response(self, response: HttpResponseBase) -> HttpResponseBase:
+        if not self._should_process_response(response):
+            return response
+
+        if isinstance(response, StreamingHttpResponse):
+            # The JS and CSS is inserted as the content is streamed, so the length is not known upfront
+            if response.has_header("Content-Length"):
+                del response["Content-Length"]
+
+            # NOTE: Setting `streaming_content` also sets `is_async` based on the given iterator
+            if response.is_async:
+                response.streaming_content = _render_dependencies_abytes_stream(
+                    response.streaming_content,
+                    response.charset,
+                )
+            else:
+                response.streaming_content = _render_dependencies_bytes_stream(
+                    response.streaming_content,
+                    response.charset,
+                )
+        else:
             response.content = render_dependencies(response.content, type="document")
 
         return response
 
+    def _should_process_response(self, response: HttpResponseBase) -> bool:
+        # Files (e.g. static HTML files) are served as they are
+        if isinstance(response, FileResponse):
+            return False
+        return response.get("Content-Type", "").startswith("text/html")
+
+
+def _render_dependencies_bytes_stream(chunks: Iterable[bytes], charset: str) -> Generator[bytes, None, None]:
+    # NOTE: A multi-byte character may be split across chunks, so we decode them incrementally
+    decoder = codecs.getincrementaldecoder(charset)()
+    decoded_chunks = (decoder.decode(chunk) for chunk in chunks)
+    for output in render_dependencies_stream(decoded_chunks, type="document"):
+        yield output.encode(charset)
+
+
+async def _render_dependencies_abytes_stream(
+    chunks: AsyncIterable[bytes], charset: str
+) -> AsyncGenerator[bytes, None]:
+    decoder = codecs.getincrementaldecoder(charset)()
+
+    async def decode_chunks() -> AsyncGenerator[str, None]:
+        async for chunk in chunks:
+            yield decoder.decode(chunk)
+
+    async for output in render_dependencies_astream(decode_chunks(), type="document"):
+        yield output.encode(charset)
+
 
 #########################################################
 # 6. Template tags
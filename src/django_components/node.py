@@ -6,10 +6,12 @@ from typing import Any, Callable, Dict, List, Optional, Tuple, Type, cast
 from django.template import Context, Library
 from django.template.base import Node, NodeList, Parser, Token
 
-from django_components.util.logger import trace_node_msg
+from django_components.util.logger import is_trace_enabled, trace_node_msg
 from django_components.util.misc import gen_id
 from django_components.util.template_tag import (
+    CompiledTagParams,
     TagAttr,
+    compile_params,
     parse_template_tag,
     resolve_params,
     validate_params,
@@ -87,8 +89,28 @@ class NodeMeta(type):
 
         @functools.wraps(orig_render)
         def wrapper_render(self: "BaseNode", context: Context) -> str:
-            trace_node_msg("RENDER", self.tag, self.node_id)
+            if __debug__ and is_trace_enabled():
+                trace_node_msg("RENDER", self.tag, self.node_id)
 
+            # The params are validated against the signature only on the first render. Afterwards,
+            # we only resolve the variables. See `CompiledTagParams`.
+            #
+            # NOTE: We do this on first render instead of at parse time, so that errors
+            #       in the params are raised at the same point as before.
+            if not self._did_compile_params:
+                self._compiled_params = compile_params(orig_render, validation_signature, self.tag, self.params)
+                self._did_compile_params = True
+
+            if self._compiled_params is not None:
+                args, kwargs = self._compiled_params.resolve(context)
+                output = orig_render(self, context, *args, **kwargs)
+
+                if __debug__ and is_trace_enabled():
+                    trace_node_msg("RENDER", self.tag, self.node_id, msg="...Done!")
+                return output
+
+            # Otherwise, e.g. when the params contain spread syntax, we find out which args
+            # and kwargs we're passing to `render()` only after the values are resolved.
             resolved_params = resolve_params(self.tag, self.params, context)
 
             # Template tags may accept kwargs that are not valid Python identifiers, e.g.
@@ -187,7 +209,8 @@ class NodeMeta(type):
 
             output = orig_render(self, context, *args, **kwargs)
 
-            trace_node_msg("RENDER", self.tag, self.node_id, msg="...Done!")
+            if __debug__ and is_trace_enabled():
+                trace_node_msg("RENDER", self.tag, self.node_id, msg="...Done!")
             return output
 
         # Wrap cls.render() so we resolve the args and kwargs and pass them to the
@@ -307,6 +330,10 @@ class BaseNode(Node, metaclass=NodeMeta):
     # MISC
     # #####################################
 
+    # Set on the first render, see `NodeMeta`
+    _compiled_params: Optional[CompiledTagParams] = None
+    _did_compile_params: bool = False
+
     def __init__(
         self,
         params: List[TagAttr],
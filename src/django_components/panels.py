@@ -0,0 +1,98 @@
+"""
+Panel for [Django Debug Toolbar](https://django-debug-toolbar.readthedocs.io/) that shows
+how long the components took to render, see `django_components.profiler`.
+
+```py
+DEBUG_TOOLBAR_PANELS = [
+    ...
+    "django_components.panels.ComponentsPanel",
+]
+```
+
+NOTE: This module requires `django-debug-toolbar` to be installed.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from debug_toolbar.panels import Panel
+from django.http import HttpRequest, HttpResponse
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import SafeString
+
+from django_components.profiler import RenderProfiler, profile_render
+
+
+class ComponentsPanel(Panel):
+    """Shows the render timings of components, aggregated per component class and render phase."""
+
+    title = "Components"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._profiler: Optional[RenderProfiler] = None
+
+    @property
+    def nav_subtitle(self) -> str:
+        stats = self.get_stats()
+        if "total_time" not in stats:
+            return ""
+        return f"{stats['render_count']} renders in {stats['total_time']:.2f}ms"
+
+    def process_request(self, request: HttpRequest) -> HttpResponse:
+        with profile_render() as profiler:
+            self._profiler = profiler
+            return super().process_request(request)
+
+    def generate_stats(self, request: HttpRequest, response: HttpResponse) -> None:
+        if self._profiler is None:
+            return
+
+        # NOTE: Stats are stored by the toolbar, so they must be JSON-serializable
+        rows: List[Dict[str, Any]] = [
+            {
+                "component": stat.component_name,
+                "phase": stat.phase,
+                "calls": stat.calls,
+                "total": stat.total * 1000,
+                "mean": stat.mean * 1000,
+                "p99": stat.p99 * 1000,
+                "max": stat.max * 1000,
+            }
+            for stat in self._profiler.stats()
+        ]
+        records = self._profiler.records
+        self.record_stats(
+            {
+                "rows": rows,
+                "render_count": len({record.render_id for record in records}),
+                # Self time is used so that the nested phases are not counted twice
+                "total_time": sum(record.self_duration for record in records) * 1000,
+            }
+        )
+
+    @property
+    def content(self) -> SafeString:
+        rows = self.get_stats().get("rows", [])
+        if not rows:
+            return format_html("<p>{}</p>", "No components were rendered.")
+
+        body = format_html_join(
+            "\n",
+            "<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>",
+            (
+                (
+                    row["component"],
+                    row["phase"],
+                    row["calls"],
+                    *(f"{row[key]:.3f}" for key in ("total", "mean", "p99", "max")),
+                )
+                for row in rows
+            ),
+        )
+        return format_html(
+            "<table><thead><tr>"
+            "<th>Component</th><th>Phase</th><th>Calls</th>"
+            "<th>Total (ms)</th><th>Mean (ms)</th><th>P99 (ms)</th><th>Max (ms)</th>"
+            "</tr></thead><tbody>{}</tbody></table>",
+            body,
+        )
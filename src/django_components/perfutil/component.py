@@ -1,14 +1,26 @@
-import re
+import asyncio
 from collections import deque
-from typing import TYPE_CHECKING, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
-
+from typing import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from asgiref.sync import async_to_sync
 from django.utils.safestring import mark_safe
 
+from django_components.perfutil.render_session import get_render_session
 from django_components.util.exception import component_error_message
 
-if TYPE_CHECKING:
-    from django_components.component import ComponentContext
-
 # When we're inside a component's template, we need to acccess some component data,
 # as defined by `ComponentContext`. If we have nested components, then
 # each nested component will point to the Context of its parent component
@@ -23,9 +35,8 @@ if TYPE_CHECKING:
 #   `ComponentContext` object, and so on.
 #
 # Thus, similarly to the data stored by `{% provide %}`, we store the actual
-# `ComponentContext` data on a separate dictionary, and what's passed through the Context
-# is only a key to this dictionary.
-component_context_cache: Dict[str, "ComponentContext"] = {}
+# `ComponentContext` data on a separate dictionary, `RenderSession.component_context_cache`,
+# and what's passed through the Context is only a key to this dictionary.
 
 
 class PostRenderQueueItem(NamedTuple):
@@ -51,13 +62,32 @@ class PostRenderQueueItem(NamedTuple):
 # until we know what HTML attributes to apply to the root elements.
 ComponentRenderer = Callable[[Optional[List[str]]], Tuple[str, Dict[str, List[str]]]]
 
-# Render-time cache for component rendering
+# Render-time cache for component rendering is stored on the `RenderSession`:
+# - `component_renderer_cache` - Renderers of components that are waiting to be rendered.
+# - `child_component_attrs` - HTML attributes set by the parent on the component's root elements.
 # See component_post_render()
-component_renderer_cache: Dict[str, Tuple[ComponentRenderer, str]] = {}
-child_component_attrs: Dict[str, List[str]] = {}
+# NOTE: The boolean flag in `component_renderer_cache` says whether the component's HTML is final
+#       once rendered. That is, whether the HTML can NOT be modified anymore by the
+#       `on_component_rendered` callback.
+
+# Function that awaits the data of a component whose `get_context_data()` is async,
+# and then finishes the component's preparation, so that the component's renderer can be called.
+# See `Component._render_impl()`.
+ComponentDataLoader = Callable[[], Awaitable[None]]
 
-nested_comp_pattern = re.compile(r'<template [^>]*?djc-render-id="\w{6}"[^>]*?></template>')
-render_id_pattern = re.compile(r'djc-render-id="(?P<render_id>\w{6})"')
+# Components whose data has not been loaded yet are stored in `RenderSession.component_data_loaders`.
+#
+# A component is added there when its async `get_context_data()` is called. The loader is awaited
+# only once we get to the component in `_iter_component_html()`. At that point we know also about
+# all the component's siblings, so the data of all siblings can be loaded concurrently.
+
+# The placeholders are always generated by `component_post_render()` in the form of
+# `<template djc-render-id="a1b3cf"></template>`. The only thing that may change
+# is that extra attributes may be appended to the `<template>` tag, e.g.
+# `<template djc-render-id="a1b3cf" data-djc-id-a1b3cf=""></template>`.
+PLACEHOLDER_START = '<template djc-render-id="'
+PLACEHOLDER_END = "></template>"
+RENDER_ID_LEN = 6
 
 
 # When a component is rendered, we want to apply HTML attributes like `data-djc-id-a1b3cf`
@@ -73,7 +103,7 @@ render_id_pattern = re.compile(r'djc-render-id="(?P<render_id>\w{6})"')
 # document, even if the root component is only a small part of the document.
 #
 # So instead, when a nested component is rendered, we put there only a placeholder, and store the
-# actual HTML content in `component_renderer_cache`.
+# actual HTML content in `RenderSession.component_renderer_cache`.
 #
 # ```django
 # <div>
@@ -87,7 +117,7 @@ render_id_pattern = re.compile(r'djc-render-id="(?P<render_id>\w{6})"')
 # The full flow is as follows:
 # 1. When a component is nested in another, the child component is rendered, but it returns
 #    only a placeholder like `<template djc-render-id="a1b3cf"></template>`.
-#    The actual HTML output is stored in `component_renderer_cache`.
+#    The actual HTML output is stored in `RenderSession.component_renderer_cache`.
 # 2. The parent of the child component is rendered normally.
 # 3. If the placeholder for the child component is at root of the parent component,
 #    then the placeholder may be tagged with extra attributes, e.g. `data-djc-id-a1b3cf`.
@@ -105,6 +135,12 @@ render_id_pattern = re.compile(r'djc-render-id="(?P<render_id>\w{6})"')
 #    - And if the parent component had any extra attributes set by its parent, we apply these
 #      to the root elements.
 # 8. Lastly, we merge all the parts together, and return the final HTML.
+#
+# NOTE: Steps 6.-8. are implemented in `_iter_component_html()`, which yields the final HTML in chunks.
+#       `component_post_render()` joins the chunks into a single string, while
+#       `component_post_render_stream()` passes the chunks on as they come.
+#       `component_post_render_async()` is the same as `component_post_render()`, except that
+#       the data of components with async `get_context_data()` is awaited without blocking the event loop.
 def component_post_render(
     renderer: ComponentRenderer,
     render_id: str,
@@ -112,11 +148,12 @@ def component_post_render(
     parent_id: Optional[str],
     on_component_rendered_callbacks: Dict[str, Callable[[str], str]],
     on_html_rendered: Callable[[str], str],
+    is_output_final: bool = False,
 ) -> str:
     # Instead of rendering the component's HTML content immediately, we store it,
     # so we can render the component only once we know if there are any HTML attributes
     # to be applied to the resulting HTML.
-    component_renderer_cache[render_id] = (renderer, component_name)
+    get_render_session().component_renderer_cache[render_id] = (renderer, component_name, is_output_final)
 
     if parent_id is not None:
         # Case: Nested component
@@ -124,38 +161,145 @@ def component_post_render(
         return mark_safe(f'<template djc-render-id="{render_id}"></template>')
 
     # Case: Root component - Construct the final HTML by recursively replacing placeholders
-    #
-    # We first generate the component's HTML content, by calling the renderer.
-    #
-    # Then we process the component's HTML from root-downwards, going depth-first.
-    # So if we have a structure:
-    # <div>
-    #   <h2>...</h2>
-    #   <template djc-render-id="a1b3cf"></template>
-    #   <span>...</span>
-    #   <template djc-render-id="f3d3cf"></template>
-    # </div>
-    #
-    # Then we first split up the current HTML into parts, splitting at placeholders:
-    # - <div><h2>...</h2>
-    # - PLACEHOLDER djc-render-id="a1b3cf"
-    # - <span>...</span>
-    # - PLACEHOLDER djc-render-id="f3d3cf"
-    # - </div>
-    #
-    # And put the pairs of (content, placeholder_id) into a queue:
-    # - ("<div><h2>...</h2>", "a1b3cf")
-    # - ("<span>...</span>", "f3d3cf")
-    # - ("</div>", None)
-    #
-    # Then we process each part:
-    # 1. Append the content to the output
-    # 2. If the placeholder ID is not None, then we fetch the renderer by its placeholder ID (e.g. "a1b3cf")
-    # 3. If there were any extra attributes set by the parent component, we apply these to the renderer.
-    # 4. We split the content by placeholders, and put the pairs of (content, placeholder_id) into the queue,
-    #    repeating this whole process until we've processed all nested components.
-    # 5. If the placeholder ID is None, then we've reached the end of the component's HTML content,
-    #    and we can go one level up to continue the process with component's parent.
+    output = "".join(_iter_component_html_sync(render_id, on_component_rendered_callbacks))
+
+    output = on_html_rendered(output)
+
+    return mark_safe(output)
+
+
+# Same as `component_post_render()`, but instead of returning the whole HTML at once,
+# the HTML is yielded in chunks as soon as we know that these chunks will no longer change.
+#
+# NOTE: The components are registered eagerly, but the actual rendering of the component tree
+#       happens only as the returned generator is consumed.
+def component_post_render_stream(
+    renderer: ComponentRenderer,
+    render_id: str,
+    component_name: str,
+    parent_id: Optional[str],
+    on_component_rendered_callbacks: Dict[str, Callable[[str], str]],
+    on_html_rendered: Callable[[Iterator[str]], Iterator[str]],
+    is_output_final: bool = False,
+) -> Iterator[str]:
+    get_render_session().component_renderer_cache[render_id] = (renderer, component_name, is_output_final)
+
+    if parent_id is not None:
+        # Case: Nested component - There is nothing to stream, return only the placeholder
+        return iter([mark_safe(f'<template djc-render-id="{render_id}"></template>')])
+
+    return on_html_rendered(_iter_component_html_sync(render_id, on_component_rendered_callbacks))
+
+
+# Same as `component_post_render()`, but the data of components with async `get_context_data()`
+# is awaited in the current event loop, instead of blocking the thread.
+async def component_post_render_async(
+    renderer: ComponentRenderer,
+    render_id: str,
+    component_name: str,
+    parent_id: Optional[str],
+    on_component_rendered_callbacks: Dict[str, Callable[[str], str]],
+    on_html_rendered: Callable[[str], str],
+    is_output_final: bool = False,
+) -> str:
+    get_render_session().component_renderer_cache[render_id] = (renderer, component_name, is_output_final)
+
+    if parent_id is not None:
+        # Case: Nested component
+        return mark_safe(f'<template djc-render-id="{render_id}"></template>')
+
+    # Case: Root component
+    chunks = [chunk async for chunk in _iter_component_html_async(render_id, on_component_rendered_callbacks)]
+    output = on_html_rendered("".join(chunks))
+
+    return mark_safe(output)
+
+
+# `_iter_component_html()` yields either chunks of HTML, or lists of data loaders that must
+# be awaited before the generator can continue. Here we await the loaders from sync code.
+#
+# NOTE: `async_to_sync` runs the loaders in a separate event loop, so this can't be used
+#       from within a running event loop. In such case, use `Component.arender()`.
+def _iter_component_html_sync(
+    render_id: str,
+    on_component_rendered_callbacks: Dict[str, Callable[[str], str]],
+) -> Generator[str, None, None]:
+    for item in _iter_component_html(render_id, on_component_rendered_callbacks):
+        if isinstance(item, str):
+            yield item
+        else:
+            async_to_sync(_run_data_loaders)(item)
+
+
+async def _iter_component_html_async(
+    render_id: str,
+    on_component_rendered_callbacks: Dict[str, Callable[[str], str]],
+) -> AsyncGenerator[str, None]:
+    for item in _iter_component_html(render_id, on_component_rendered_callbacks):
+        if isinstance(item, str):
+            yield item
+        else:
+            await _run_data_loaders(item)
+
+
+async def _run_data_loaders(loaders: List[ComponentDataLoader]) -> None:
+    await asyncio.gather(*(loader() for loader in loaders))
+
+
+# We first generate the component's HTML content, by calling the renderer.
+#
+# Then we process the component's HTML from root-downwards, going depth-first.
+# So if we have a structure:
+# <div>
+#   <h2>...</h2>
+#   <template djc-render-id="a1b3cf"></template>
+#   <span>...</span>
+#   <template djc-render-id="f3d3cf"></template>
+# </div>
+#
+# Then we first split up the current HTML into parts, splitting at placeholders:
+# - <div><h2>...</h2>
+# - PLACEHOLDER djc-render-id="a1b3cf"
+# - <span>...</span>
+# - PLACEHOLDER djc-render-id="f3d3cf"
+# - </div>
+#
+# And put the pairs of (content, placeholder_id) into a queue:
+# - ("<div><h2>...</h2>", "a1b3cf")
+# - ("<span>...</span>", "f3d3cf")
+# - ("</div>", None)
+#
+# Then we process each part:
+# 1. Append the content to the output
+# 2. If the placeholder ID is not None, then we fetch the renderer by its placeholder ID (e.g. "a1b3cf")
+# 3. If there were any extra attributes set by the parent component, we apply these to the renderer.
+# 4. We split the content by placeholders, and put the pairs of (content, placeholder_id) into the queue,
+#    repeating this whole process until we've processed all nested components.
+# 5. If the placeholder ID is None, then we've reached the end of the component's HTML content,
+#    and we can go one level up to continue the process with component's parent.
+#
+# The generator yields the final HTML in chunks. A chunk is yielded as soon as we know
+# that it will not change anymore, see below.
+#
+# Components with async `get_context_data()` can't be rendered until their data is loaded.
+# So when the generator comes across such components, it yields the list of their data loaders.
+# The caller MUST await the loaders before resuming the generator.
+#
+# The loaders are yielded for all children of a component at once, so the data of the sibling
+# components is loaded concurrently.
+def _iter_component_html(
+    render_id: str,
+    on_component_rendered_callbacks: Dict[str, Callable[[str], str]],
+) -> Generator[Union[str, List[ComponentDataLoader]], None, None]:
+    session = get_render_session()
+    component_renderer_cache = session.component_renderer_cache
+    child_component_attrs = session.child_component_attrs
+    component_data_loaders = session.component_data_loaders
+
+    root_loader = component_data_loaders.pop(render_id, None)
+    if root_loader is not None:
+        yield [root_loader]
+
     process_queue: Deque[PostRenderQueueItem] = deque()
 
     process_queue.append(
@@ -188,8 +332,17 @@ def component_post_render(
     #
     # Once the component's HTML is joined, we can call the callback for the component, and
     # then add the joined HTML to the cache for the parent component to continue the cycle.
+    #
+    # However, this is needed only for components whose HTML may still change once it's rendered,
+    # e.g. because of `Component.on_render_after()`. Components whose output is final (`is_output_final`)
+    # don't need to buffer their HTML. Instead, their HTML is passed directly to the nearest
+    # ancestor that does buffer. And if there is no such ancestor, then the HTML is already final,
+    # and we can yield it right away.
+    #
+    # `buffer_ids` maps component IDs to the ID of the component that collects their HTML,
+    # or `None` if the component's HTML can be yielded right away.
     html_parts_by_component_id: Dict[str, List[str]] = {}
-    content_parts: List[str] = []
+    buffer_ids: Dict[str, Optional[str]] = {}
 
     def get_html_parts(component_id: str) -> List[str]:
         if component_id not in html_parts_by_component_id:
@@ -206,6 +359,22 @@ def component_post_render(
             if curr_item.parent_id is None:
                 raise RuntimeError("Parent ID is None")
 
+            parent_buffer_id = buffer_ids.pop(curr_item.parent_id)
+            on_component_rendered = on_component_rendered_callbacks[curr_item.parent_id]
+
+            # Case: The component's HTML was passed on to the ancestors. So we only need to pass on
+            # also the left-over content. The callback is still called, so the component can clean up,
+            # but the output is already final, so we ignore it.
+            if parent_buffer_id != curr_item.parent_id:
+                if parent_buffer_id is None:
+                    if curr_item.content_before_component:
+                        yield curr_item.content_before_component
+                else:
+                    get_html_parts(parent_buffer_id).append(curr_item.content_before_component)
+
+                on_component_rendered("")
+                continue
+
             parent_parts = html_parts_by_component_id.pop(curr_item.parent_id, [])
 
             # Add the left-over content
@@ -213,15 +382,14 @@ def component_post_render(
 
             # Allow to optionally override/modify the rendered content from outside
             component_html = "".join(parent_parts)
-            on_component_rendered = on_component_rendered_callbacks[curr_item.parent_id]
             component_html = on_component_rendered(component_html)  # type: ignore[arg-type]
 
             # Add the component's HTML to parent's parent's HTML parts
-            if curr_item.grandparent_id is not None:
-                target_list = get_html_parts(curr_item.grandparent_id)
-                target_list.append(component_html)
-            else:
-                content_parts.append(component_html)
+            grandparent_buffer_id = buffer_ids[curr_item.grandparent_id] if curr_item.grandparent_id else None
+            if grandparent_buffer_id is not None:
+                get_html_parts(grandparent_buffer_id).append(component_html)
+            elif component_html:
+                yield component_html
 
             continue
 
@@ -229,15 +397,26 @@ def component_post_render(
         if curr_item.content_before_component:
             if curr_item.parent_id is None:
                 raise RuntimeError("Parent ID is None")
-            parent_html_parts = get_html_parts(curr_item.parent_id)
-            parent_html_parts.append(curr_item.content_before_component)
+            parent_buffer_id = buffer_ids[curr_item.parent_id]
+            if parent_buffer_id is None:
+                yield curr_item.content_before_component
+            else:
+                get_html_parts(parent_buffer_id).append(curr_item.content_before_component)
 
         # Generate component's content, applying the extra HTML attributes set by the parent component
-        curr_comp_renderer, curr_comp_name = component_renderer_cache.pop(curr_item.child_id)
+        curr_comp_renderer, curr_comp_name, curr_comp_is_final = component_renderer_cache.pop(curr_item.child_id)
         # NOTE: This may be undefined, because this is set only for components that
         # are also root elements in their parent's HTML
         curr_comp_attrs = child_component_attrs.pop(curr_item.child_id, None)
 
+        # Decide where the component's HTML will be collected
+        if not curr_comp_is_final:
+            buffer_ids[curr_item.child_id] = curr_item.child_id
+        elif curr_item.parent_id is not None:
+            buffer_ids[curr_item.child_id] = buffer_ids[curr_item.parent_id]
+        else:
+            buffer_ids[curr_item.child_id] = None
+
         full_path = [*curr_item.component_name_path, curr_comp_name]
 
         # This is where we actually render the component
@@ -259,16 +438,9 @@ def component_post_render(
         parts_to_process: List[PostRenderQueueItem] = []
 
         # Split component's content by placeholders, and put the pairs of (content, placeholder_id) into the queue
-        for match in nested_comp_pattern.finditer(curr_comp_content):
-            part_before_component = curr_comp_content[last_index : match.start()]  # noqa: E203
-            last_index = match.end()
-            comp_part = match[0]
-
-            # Extract the placeholder ID from `<template djc-render-id="a1b3cf"></template>`
-            grandchild_id_match = render_id_pattern.search(comp_part)
-            if grandchild_id_match is None:
-                raise ValueError(f"No placeholder ID found in {comp_part}")
-            grandchild_id = grandchild_id_match.group("render_id")
+        for placeholder_start, placeholder_end, grandchild_id in _find_placeholders(curr_comp_content):
+            part_before_component = curr_comp_content[last_index:placeholder_start]
+            last_index = placeholder_end
             parts_to_process.append(
                 PostRenderQueueItem(
                     content_before_component=part_before_component,
@@ -292,11 +464,43 @@ def component_post_render(
             )
         )
 
-        process_queue.extendleft(reversed(parts_to_process))
+        # Load the data of the child components that have async `get_context_data()`.
+        child_loaders = [
+            component_data_loaders.pop(part.child_id)
+            for part in parts_to_process
+            if part.child_id is not None and part.child_id in component_data_loaders
+        ]
+        if child_loaders:
+            yield child_loaders
 
-    # Lastly, join up all pieces of the component's HTML content
-    output = "".join(content_parts)
+        process_queue.extendleft(reversed(parts_to_process))
 
-    output = on_html_rendered(output)
 
-    return mark_safe(output)
+# Find all placeholders like `<template djc-render-id="a1b3cf"></template>` in the component's HTML.
+# Returns a list of tuples of `(start_index, end_index, render_id)`.
+#
+# Since the placeholders have a fixed shape, we don't need a regex to find them. Instead, we jump
+# from one placeholder to the next with `str.find()`, and read the render ID from a fixed offset.
+# So each component's HTML is scanned only once.
+#
+# NOTE: Previously we used regex to find the placeholders, and then another regex to extract
+#       the render ID. See `benchmarks/placeholder_scanning.py` for comparison.
+def _find_placeholders(content: str) -> List[Tuple[int, int, str]]:
+    placeholders: List[Tuple[int, int, str]] = []
+
+    start_index = content.find(PLACEHOLDER_START)
+    while start_index != -1:
+        id_start = start_index + len(PLACEHOLDER_START)
+        id_end = id_start + RENDER_ID_LEN
+        tag_end = content.find(">", id_end)
+
+        # Verify that the ID is followed by the closing quote, and that the `<template>` tag
+        # is immediately closed. Otherwise it's not our placeholder.
+        if content.startswith('"', id_end) and content.startswith(PLACEHOLDER_END, tag_end):
+            end_index = tag_end + len(PLACEHOLDER_END)
+            placeholders.append((start_index, end_index, content[id_start:id_end]))
+            start_index = content.find(PLACEHOLDER_START, end_index)
+        else:
+            start_index = content.find(PLACEHOLDER_START, id_start)
+
+    return placeholders
@@ -3,11 +3,12 @@ This module contains optimizations for the `{% provide %}` feature.
 """
 
 from contextlib import contextmanager
-from typing import Dict, Generator, NamedTuple, Set
+from typing import Generator
 
 from django.template import Context
 
 from django_components.context import _INJECT_CONTEXT_KEY_PREFIX
+from django_components.perfutil.render_session import get_render_session
 
 # Originally, when `{% provide %}` was used, the provided data was passed down
 # through the Context object.
@@ -31,7 +32,7 @@ from django_components.context import _INJECT_CONTEXT_KEY_PREFIX
 # ```
 #
 # Since the provided data is represented only as a key, we have to store the ACTUAL
-# data somewhere. Thus, we store it in a separate dictionary.
+# data somewhere. Thus, we store it in a separate dictionary, `RenderSession.provide_cache`.
 #
 # So when one calls `Component.inject(key)`, we use the key to look up the actual data
 # in the dictionary and return that.
@@ -73,21 +74,22 @@ from django_components.context import _INJECT_CONTEXT_KEY_PREFIX
 # However, this leaves open the edge case of when `{% provide %}` contains NO components.
 # In such case, we check if there are any subscribed components after rendering the contents
 # of `{% provide %}`. If there are NONE, we delete the provided data.
-
-
-# Similarly to ComponentContext instances, we store the actual Provided data
-# outside of the Context object, to make it easier to debug the data flow.
-provide_cache: Dict[str, NamedTuple] = {}
-
-# Keep track of how many components are referencing each provided data.
-provide_references: Dict[str, Set[str]] = {}
-
-# Keep track of all the listeners that are referencing any provided data.
-all_reference_ids: Set[str] = set()
+#
+# The provided data is stored on the `RenderSession`:
+# - `provide_cache` - Similarly to ComponentContext instances, we store the actual Provided data
+#   outside of the Context object, to make it easier to debug the data flow.
+# - `provide_references` - Keep track of how many components are referencing each provided data.
+# - `all_reference_ids` - Keep track of all the listeners that are referencing any provided data.
+#
+# If the render fails midway, whatever is left over is dropped when the `RenderSession` is released.
 
 
 @contextmanager
 def managed_provide_cache(provide_id: str) -> Generator[None, None, None]:
+    session = get_render_session()
+    provide_cache = session.provide_cache
+    provide_references = session.provide_references
+    all_reference_ids = session.all_reference_ids
     all_reference_ids_before = all_reference_ids.copy()
 
     def cache_cleanup() -> None:
@@ -121,11 +123,14 @@ def managed_provide_cache(provide_id: str) -> Generator[None, None, None]:
 
 
 def register_provide_reference(context: Context, reference_id: str) -> None:
+    session = get_render_session()
+    provide_references = session.provide_references
+
     # No `{% provide %}` among the ancestors, nothing to register to
-    if not provide_cache:
+    if not session.provide_cache:
         return
 
-    all_reference_ids.add(reference_id)
+    session.all_reference_ids.add(reference_id)
 
     for key, provide_id in context.flatten().items():
         if not key.startswith(_INJECT_CONTEXT_KEY_PREFIX):
@@ -137,11 +142,15 @@ def register_provide_reference(context: Context, reference_id: str) -> None:
 
 
 def unregister_provide_reference(reference_id: str) -> None:
+    session = get_render_session()
+    provide_cache = session.provide_cache
+    provide_references = session.provide_references
+
     # No registered references, nothing to unregister
-    if reference_id not in all_reference_ids:
+    if reference_id not in session.all_reference_ids:
         return
 
-    all_reference_ids.remove(reference_id)
+    session.all_reference_ids.remove(reference_id)
 
     for provide_id in list(provide_references.keys()):
         if reference_id not in provide_references[provide_id]:
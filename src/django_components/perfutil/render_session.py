@@ -0,0 +1,191 @@
+"""
+This module holds the state that is shared by all components within a single render.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, Generator, List, NamedTuple, Optional, Set, Sized, Tuple
+
+from django_components.util.logger import logger
+
+if TYPE_CHECKING:
+    from django_components.component import ComponentContext
+    from django_components.dependencies import ComponentDependencies
+    from django_components.perfutil.component import ComponentDataLoader, ComponentRenderer
+
+# To render components, we keep some data outside of the Context object, e.g. `ComponentContext`
+# instances, or the renderers of nested components that are waiting to be rendered.
+# See `django_components.perfutil.component` and `django_components.perfutil.provide`.
+#
+# Previously, this data was stored in module-level dictionaries, and the entries were removed
+# manually once they were no longer needed. But if the render raised an error midway, the entries
+# remained in the dictionaries for the life of the worker. And with threaded servers,
+# the dictionaries were shared across requests.
+#
+# Instead, all this data is now owned by a `RenderSession`. The session is started by the root
+# render (e.g. `Component.render()`, or `{% component %}` / `{% provide %}` tags in a plain
+# Django template), and it's shared by all the nested components via a `ContextVar`.
+# Once the root render is done, the session is released, whether the render succeeded or not.
+#
+# NOTE: The entries are still removed as soon as they are no longer needed, so that the memory
+#       can be freed already during long renders. The session only guarantees that nothing
+#       outlives the render.
+render_session_var: ContextVar[Optional["RenderSession"]] = ContextVar("djc_render_session", default=None)
+
+
+class RenderSession:
+    """Render-time state shared by all components rendered within a single root render."""
+
+    def __init__(self) -> None:
+        # See `django_components.perfutil.component`
+        self.component_context_cache: Dict[str, "ComponentContext"] = {}
+        self.component_renderer_cache: Dict[str, Tuple["ComponentRenderer", str, bool]] = {}
+        self.child_component_attrs: Dict[str, List[str]] = {}
+        self.component_data_loaders: Dict[str, "ComponentDataLoader"] = {}
+        # See `django_components.perfutil.provide`
+        self.provide_cache: Dict[str, NamedTuple] = {}
+        self.provide_references: Dict[str, Set[str]] = {}
+        self.all_reference_ids: Set[str] = set()
+        # See `django_components.dependencies.record_component_dependencies()`
+        # NOTE: Dicts are used as ordered sets
+        self.component_dependencies: Dict[str, Dict["ComponentDependencies", None]] = {}
+
+    def count_entries(self) -> Dict[str, int]:
+        """Number of entries held by the session, for each non-empty store."""
+        stores: Dict[str, Sized] = {
+            "component_context_cache": self.component_context_cache,
+            "component_renderer_cache": self.component_renderer_cache,
+            "child_component_attrs": self.child_component_attrs,
+            "component_data_loaders": self.component_data_loaders,
+            "provide_cache": self.provide_cache,
+            "provide_references": self.provide_references,
+            "all_reference_ids": self.all_reference_ids,
+            "component_dependencies": self.component_dependencies,
+        }
+        return {name: len(store) for name, store in stores.items() if store}
+
+    def release(self, failed: bool = False) -> None:
+        """
+        Drop all the data held by the session.
+
+        Entries that are still present at this point were not cleaned up by the render.
+        These are counted in `get_render_session_stats()`.
+        """
+        leaked_entries = self.count_entries()
+        _record_release(leaked_entries, failed)
+
+        if leaked_entries:
+            if failed:
+                logger.debug(f"Render failed, releasing left over render entries: {leaked_entries}")
+            else:
+                logger.warning(f"Render finished, but some render entries were not cleaned up: {leaked_entries}")
+
+        self.component_context_cache.clear()
+        self.component_renderer_cache.clear()
+        self.child_component_attrs.clear()
+        self.component_data_loaders.clear()
+        self.provide_cache.clear()
+        self.provide_references.clear()
+        self.all_reference_ids.clear()
+        self.component_dependencies.clear()
+
+
+def get_render_session() -> RenderSession:
+    """Get the `RenderSession` of the current render. Raises `RuntimeError` outside of a render."""
+    session = render_session_var.get()
+    if session is None:
+        raise RuntimeError("No render session is active. Was this called outside of a component render?")
+    return session
+
+
+@contextmanager
+def render_session() -> Generator[RenderSession, None, None]:
+    """
+    Use the `RenderSession` of the current render. If there is none, start a new session,
+    and release it on exit.
+    """
+    session = render_session_var.get()
+    if session is not None:
+        yield session
+        return
+
+    session = RenderSession()
+    failed = True
+    try:
+        with activate_render_session(session):
+            yield session
+        failed = False
+    finally:
+        session.release(failed=failed)
+
+
+@contextmanager
+def activate_render_session(session: RenderSession) -> Generator[None, None, None]:
+    """
+    Make the session the current session.
+
+    Use this when the render continues outside of the `render_session()` block, e.g. when
+    the rendered HTML is streamed.
+    """
+    token = render_session_var.set(session)
+    try:
+        yield
+    finally:
+        render_session_var.reset(token)
+
+
+#####################################
+# DIAGNOSTICS
+#####################################
+
+
+class RenderSessionStats(NamedTuple):
+    """Statistics of released render sessions, as returned by `get_render_session_stats()`."""
+
+    sessions: int
+    """Number of render sessions that were released."""
+    failed_sessions: int
+    """Number of render sessions that were released after an error."""
+    leaked_entries: Dict[str, int]
+    """
+    Number of entries that were still held by the sessions when they were released,
+    by the name of the store. Outside of failed renders, this should stay empty.
+    """
+
+
+_stats_lock = Lock()
+_sessions = 0
+_failed_sessions = 0
+_leaked_entries: Dict[str, int] = {}
+
+
+def _record_release(leaked_entries: Dict[str, int], failed: bool) -> None:
+    global _sessions, _failed_sessions
+    with _stats_lock:
+        _sessions += 1
+        if failed:
+            _failed_sessions += 1
+        for name, count in leaked_entries.items():
+            _leaked_entries[name] = _leaked_entries.get(name, 0) + count
+
+
+def get_render_session_stats() -> RenderSessionStats:
+    """
+    Get the statistics of the render sessions released by this process so far.
+
+    Use this to check that the render-time data is not left over after renders:
+
+    ```py
+    from django_components.perfutil.render_session import get_render_session_stats
+
+    stats = get_render_session_stats()
+    print(stats.leaked_entries)  # {"component_context_cache": 3}
+    ```
+    """
+    with _stats_lock:
+        return RenderSessionStats(
+            sessions=_sessions,
+            failed_sessions=_failed_sessions,
+            leaked_entries=_leaked_entries.copy(),
+        )
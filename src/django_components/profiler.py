@@ -0,0 +1,256 @@
+"""
+Render-time profiler that measures how long each component spends in each phase of its rendering.
+
+```py
+from django_components.profiler import profile_render
+
+with profile_render() as profiler:
+    MyPage.render()
+
+for stat in profiler.stats():
+    print(stat.component_name, stat.phase, stat.total, stat.p99)
+
+profiler.write_collapsed_stacks("render.txt")  # Open with https://speedscope.app
+```
+"""
+
+import math
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from os import PathLike
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    ContextManager,
+    Dict,
+    Generator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from django_components.component import Component
+
+ProfilePhase = Literal[
+    "get_context_data",
+    "render_template",
+    "set_html_attributes",
+    "render_slot",
+    "on_render_after",
+]
+
+
+class ProfileRecord(NamedTuple):
+    """A single measured phase of a single component render."""
+
+    render_id: str
+    """ID of the component render, e.g. `a1b2c3`."""
+    component_class: Type["Component"]
+    component_name: str
+    component_path: Tuple[str, ...]
+    """Names of the component and all its ancestors, starting with the root component."""
+    phase: ProfilePhase
+    slot_name: Optional[str]
+    """Name of the rendered slot. Set only for the `render_slot` phase."""
+    duration: float
+    """Wall time in seconds, including the time spent in the nested phases."""
+    self_duration: float
+    """Wall time in seconds, excluding the time spent in the nested phases."""
+    allocated: Optional[int]
+    """Net size of the memory allocated in bytes. `None` if not tracing allocations."""
+
+
+class ComponentProfileStats(NamedTuple):
+    """Timings of a single phase aggregated across all renders of a component class."""
+
+    component_class: Type["Component"]
+    component_name: str
+    phase: ProfilePhase
+    calls: int
+    """Number of measurements."""
+    total: float
+    """Sum of wall times in seconds."""
+    mean: float
+    p99: float
+    """99th percentile of wall times in seconds."""
+    max: float
+    allocated: Optional[int]
+    """Sum of net allocated bytes. `None` if not tracing allocations."""
+
+
+class _Frame:
+    __slots__ = ("profiler", "nested_duration")
+
+    def __init__(self, profiler: "RenderProfiler") -> None:
+        self.profiler = profiler
+        self.nested_duration = 0.0
+
+
+# The phase that is being measured. The phases may be nested, e.g. `get_context_data()` of a child
+# component is called while rendering the parent's template. Frames are kept in a ContextVar, so that
+# nesting is tracked correctly also when async components are loaded concurrently.
+# NOTE: ContextVars should be created only at module level, so there is one for all profilers,
+# and each frame knows to which profiler it belongs.
+_current_frame: ContextVar[Optional[_Frame]] = ContextVar("djc_profiler_frame", default=None)
+
+
+class RenderProfiler:
+    """
+    Collects the timings of component renders while active, see `profile_render()`.
+
+    If `trace_allocations` is `True`, the memory allocated in each phase is measured
+    with `tracemalloc`. This slows the rendering down considerably.
+    """
+
+    def __init__(self, trace_allocations: bool = False) -> None:
+        self.trace_allocations = trace_allocations
+        self.records: List[ProfileRecord] = []
+
+    @contextmanager
+    def measure(
+        self,
+        component_class: Type["Component"],
+        component_name: str,
+        render_id: str,
+        component_path: List[str],
+        phase: ProfilePhase,
+        slot_name: Optional[str] = None,
+    ) -> Generator[None, None, None]:
+        parent_frame = _current_frame.get()
+        frame = _Frame(self)
+        token = _current_frame.set(frame)
+        allocated_before = tracemalloc.get_traced_memory()[0] if self.trace_allocations else 0
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            duration = perf_counter() - start
+            allocated = tracemalloc.get_traced_memory()[0] - allocated_before if self.trace_allocations else None
+            _current_frame.reset(token)
+            # NOTE: The parent frame may belong to another profiler, if `profile_render()` blocks are nested
+            if parent_frame is not None and parent_frame.profiler is self:
+                parent_frame.nested_duration += duration
+
+            self.records.append(
+                ProfileRecord(
+                    render_id=render_id,
+                    component_class=component_class,
+                    component_name=component_name,
+                    component_path=tuple(component_path),
+                    phase=phase,
+                    slot_name=slot_name,
+                    duration=duration,
+                    # NOTE: Nested phases of concurrently loaded components may overlap
+                    self_duration=max(duration - frame.nested_duration, 0.0),
+                    allocated=allocated,
+                )
+            )
+
+    def stats(self) -> List[ComponentProfileStats]:
+        """Timings aggregated per component class and phase, sorted by the total time, descending."""
+        records_by_key: Dict[Tuple[Type["Component"], str], List[ProfileRecord]] = {}
+        for record in self.records:
+            records_by_key.setdefault((record.component_class, record.phase), []).append(record)
+
+        stats: List[ComponentProfileStats] = []
+        for (component_class, phase), records in records_by_key.items():
+            durations = sorted(record.duration for record in records)
+            total = sum(durations)
+            stats.append(
+                ComponentProfileStats(
+                    component_class=component_class,
+                    component_name=records[0].component_name,
+                    phase=records[0].phase,
+                    calls=len(durations),
+                    total=total,
+                    mean=total / len(durations),
+                    p99=durations[max(math.ceil(len(durations) * 0.99) - 1, 0)],
+                    max=durations[-1],
+                    allocated=sum(record.allocated or 0 for record in records) if self.trace_allocations else None,
+                )
+            )
+
+        stats.sort(key=lambda stat: stat.total, reverse=True)
+        return stats
+
+    def to_collapsed_stacks(self) -> str:
+        """
+        Format the timings as "collapsed stacks", e.g. `Root;Child;render_template 1520`.
+
+        Each line has the path of the component, the phase, and the time in microseconds spent
+        in the phase itself, without the nested phases.
+
+        This format can be opened with [speedscope](https://www.speedscope.app/), or turned into
+        a flame graph with Brendan Gregg's [`flamegraph.pl`](https://github.com/brendangregg/FlameGraph).
+        """
+        self_times: Dict[str, float] = {}
+        for record in self.records:
+            phase = f"{record.phase}({record.slot_name})" if record.slot_name is not None else record.phase
+            stack = ";".join([*record.component_path, phase])
+            self_times[stack] = self_times.get(stack, 0.0) + record.self_duration
+
+        lines = [f"{stack} {round(self_time * 1_000_000)}" for stack, self_time in self_times.items()]
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def write_collapsed_stacks(self, path: Union[str, PathLike]) -> None:
+        """Write the timings to a file in the "collapsed stacks" format, see `to_collapsed_stacks()`."""
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.to_collapsed_stacks())
+
+
+# The profiler of the current render, if any
+active_profiler: ContextVar[Optional[RenderProfiler]] = ContextVar("djc_active_profiler", default=None)
+
+
+@contextmanager
+def profile_render(trace_allocations: bool = False) -> Generator[RenderProfiler, None, None]:
+    """
+    Profile all components rendered within this block.
+
+    ```py
+    with profile_render() as profiler:
+        MyPage.render()
+
+    print(profiler.stats())
+    ```
+
+    If `trace_allocations` is `True`, also the memory allocated in each phase is measured,
+    using `tracemalloc`.
+    """
+    profiler = RenderProfiler(trace_allocations=trace_allocations)
+
+    started_tracemalloc = trace_allocations and not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start()
+
+    token = active_profiler.set(profiler)
+    try:
+        yield profiler
+    finally:
+        active_profiler.reset(token)
+        if started_tracemalloc:
+            tracemalloc.stop()
+
+
+_NOOP = nullcontext()
+
+
+def profile_phase(
+    component_class: Type["Component"],
+    component_name: str,
+    render_id: str,
+    component_path: List[str],
+    phase: ProfilePhase,
+    slot_name: Optional[str] = None,
+) -> ContextManager[None]:
+    """Measure a phase of the component render, if the render is profiled."""
+    profiler = active_profiler.get()
+    if profiler is None:
+        return _NOOP
+    return profiler.measure(component_class, component_name, render_id, component_path, phase, slot_name)
@@ -6,7 +6,8 @@ from django.utils.safestring import SafeString
 
 from django_components.context import _INJECT_CONTEXT_KEY_PREFIX
 from django_components.node import BaseNode
-from django_components.perfutil.provide import managed_provide_cache, provide_cache
+from django_components.perfutil.provide import managed_provide_cache
+from django_components.perfutil.render_session import get_render_session, render_session
 from django_components.util.misc import gen_id
 
 
@@ -88,7 +89,10 @@ class ProvideNode(BaseNode):
         # NOTE: The "provided" kwargs are meant to be shared privately, meaning that components
         # have to explicitly opt in by using the `Component.inject()` method. That's why we don't
         # add the provided kwargs into the Context.
-        with context.update({}):
+        #
+        # NOTE: If `{% provide %}` is used outside of components, the provided data is kept
+        # in a render session that's shared with the components inside `{% provide %}`.
+        with render_session(), context.update({}):
             # "Provide" the data to child nodes
             provide_id = set_provided_context_var(context, name, kwargs)
 
@@ -117,7 +121,7 @@ def get_injected_context_var(
     # Return provided value if found
     if internal_key in context:
         cache_key = context[internal_key]
-        return provide_cache[cache_key]
+        return get_render_session().provide_cache[cache_key]
 
     # If a default was given, return that
     if default is not None:
@@ -163,6 +167,6 @@ def set_provided_context_var(
     context_key = _INJECT_CONTEXT_KEY_PREFIX + key
     provide_id = gen_id()
     context[context_key] = provide_id
-    provide_cache[provide_id] = payload
+    get_render_session().provide_cache[provide_id] = payload
 
     return provide_id
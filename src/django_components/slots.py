@@ -27,10 +27,11 @@ from django.utils.safestring import SafeString, mark_safe
 from django_components.app_settings import ContextBehavior, app_settings
 from django_components.context import _COMPONENT_CONTEXT_KEY, _INJECT_CONTEXT_KEY_PREFIX
 from django_components.node import BaseNode
-from django_components.perfutil.component import component_context_cache
+from django_components.perfutil.render_session import get_render_session
+from django_components.profiler import profile_phase
 from django_components.util.component_highlight import apply_component_highlight
 from django_components.util.exception import add_slot_to_error_message
-from django_components.util.logger import trace_component_msg
+from django_components.util.logger import is_trace_enabled, trace_component_msg
 from django_components.util.misc import get_index, get_last_index, is_identifier
 
 if TYPE_CHECKING:
@@ -315,6 +316,7 @@ class SlotNode(BaseNode):
             )
 
         component_id: str = context[_COMPONENT_CONTEXT_KEY]
+        component_context_cache = get_render_session().component_context_cache
         component_ctx = component_context_cache[component_id]
         component_name = component_ctx.component_name
         component_path = component_ctx.component_path
@@ -323,15 +325,16 @@ class SlotNode(BaseNode):
         is_default = self.flags[SLOT_DEFAULT_KEYWORD]
         is_required = self.flags[SLOT_REQUIRED_KEYWORD]
 
-        trace_component_msg(
-            "RENDER_SLOT_START",
-            component_name=component_name,
-            component_id=component_id,
-            slot_name=slot_name,
-            component_path=component_path,
-            slot_fills=slot_fills,
-            extra=f"Available fills: {slot_fills}",
-        )
+        if __debug__ and is_trace_enabled():
+            trace_component_msg(
+                "RENDER_SLOT_START",
+                component_name=component_name,
+                component_id=component_id,
+                slot_name=slot_name,
+                component_path=component_path,
+                slot_fills=slot_fills,
+                extra=f"Available fills: {slot_fills}",
+            )
 
         # Check for errors
         if is_default and not component_ctx.is_dynamic_component:
@@ -441,31 +444,33 @@ class SlotNode(BaseNode):
                 if parent_index is not None:
                     parent_index = parent_index + curr_index + 1
 
-            trace_component_msg(
-                "SLOT_PARENT_INDEX",
-                component_name=component_ctx.component_name,
-                component_id=component_ctx.component_id,
-                slot_name=name,
-                component_path=component_ctx.component_path,
-                extra=(
-                    f"Parent index: {parent_index}, Current index: {curr_index}, "
-                    f"Context stack: {[d.get(_COMPONENT_CONTEXT_KEY) for d in context.dicts]}"
-                ),
-            )
+            if __debug__ and is_trace_enabled():
+                trace_component_msg(
+                    "SLOT_PARENT_INDEX",
+                    component_name=component_ctx.component_name,
+                    component_id=component_ctx.component_id,
+                    slot_name=name,
+                    component_path=component_ctx.component_path,
+                    extra=(
+                        f"Parent index: {parent_index}, Current index: {curr_index}, "
+                        f"Context stack: {[d.get(_COMPONENT_CONTEXT_KEY) for d in context.dicts]}"
+                    ),
+                )
             if parent_index is not None:
                 ctx_id_with_fills = context.dicts[parent_index][_COMPONENT_CONTEXT_KEY]
                 ctx_with_fills = component_context_cache[ctx_id_with_fills]
                 slot_fills = ctx_with_fills.fills
 
                 # Add trace message when slot_fills are overwritten
-                trace_component_msg(
-                    "SLOT_FILLS_OVERWRITTEN",
-                    component_name=component_name,
-                    component_id=component_id,
-                    slot_name=slot_name,
-                    component_path=component_path,
-                    extra=f"Slot fills overwritten in django mode. New fills: {slot_fills}",
-                )
+                if __debug__ and is_trace_enabled():
+                    trace_component_msg(
+                        "SLOT_FILLS_OVERWRITTEN",
+                        component_name=component_name,
+                        component_id=component_id,
+                        slot_name=slot_name,
+                        component_path=component_path,
+                        extra=f"Slot fills overwritten in django mode. New fills: {slot_fills}",
+                    )
 
         if fill_name in slot_fills:
             slot_fill_fn = slot_fills[fill_name]
@@ -568,22 +573,31 @@ class SlotNode(BaseNode):
 
             with used_ctx.render_context.push(render_ctx_layer):
                 with add_slot_to_error_message(component_name, slot_name):
-                    # Render slot as a function
-                    # NOTE: While `{% fill %}` tag has to opt in for the `default` and `data` variables,
-                    #       the render function ALWAYS receives them.
-                    output = slot_fill.slot(used_ctx, kwargs, slot_ref)
+                    with profile_phase(
+                        component_ctx.component_class,
+                        component_name,
+                        component_id,
+                        component_path,
+                        "render_slot",
+                        slot_name=slot_name,
+                    ):
+                        # Render slot as a function
+                        # NOTE: While `{% fill %}` tag has to opt in for the `default` and `data` variables,
+                        #       the render function ALWAYS receives them.
+                        output = slot_fill.slot(used_ctx, kwargs, slot_ref)
 
         if app_settings.DEBUG_HIGHLIGHT_SLOTS:
             output = apply_component_highlight("slot", output, f"{component_name} - {slot_name}")
 
-        trace_component_msg(
-            "RENDER_SLOT_END",
-            component_name=component_name,
-            component_id=component_id,
-            slot_name=slot_name,
-            component_path=component_path,
-            slot_fills=slot_fills,
-        )
+        if __debug__ and is_trace_enabled():
+            trace_component_msg(
+                "RENDER_SLOT_END",
+                component_name=component_name,
+                component_id=component_id,
+                slot_name=slot_name,
+                component_path=component_path,
+                slot_fills=slot_fills,
+            )
 
         return output
 
@@ -1064,7 +1078,8 @@ def _nodelist_to_slot_render_func(
         # Thus, get_context_data will overshadow these on conflict.
         ctx.dicts.insert(index_of_last_component_layer, extra_context or {})
 
-        trace_component_msg("RENDER_NODELIST", component_name, component_id=None, slot_name=slot_name)
+        if __debug__ and is_trace_enabled():
+            trace_component_msg("RENDER_NODELIST", component_name, component_id=None, slot_name=slot_name)
 
         rendered = template.render(ctx)
 
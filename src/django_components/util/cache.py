@@ -1,35 +1,59 @@
+from collections import OrderedDict
 from collections.abc import Hashable
-from typing import Dict, Generic, Optional, TypeVar, cast
+from threading import Lock
+from typing import Callable, Generic, NamedTuple, Optional, TypeVar
 
 T = TypeVar("T")
 
 
-class CacheNode(Generic[T]):
-    """A node in the doubly linked list."""
+class CacheStats(NamedTuple):
+    """Usage statistics of an `LRUCache`, as returned by `LRUCache.stats()`."""
 
-    def __init__(self, key: Hashable, value: T):
-        self.key = key
-        self.value = value
-        self.prev: Optional["CacheNode"] = None
-        self.next: Optional["CacheNode"] = None
+    hits: int
+    """Number of `get()` calls that found the key."""
+    misses: int
+    """Number of `get()` calls that did NOT find the key."""
+    evictions: int
+    """Number of items removed to make room for new ones."""
+    size: int
+    """Current number of items in the cache. Or their total size, if the cache was given `getsize`."""
+    maxsize: Optional[int]
+    """Maximum number (or size) of items the cache can hold. `None` if unbounded."""
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of `get()` calls that found the key, between `0.0` and `1.0`."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
 
 
 class LRUCache(Generic[T]):
-    """A simple LRU Cache implementation."""
+    """
+    A simple thread-safe LRU Cache implementation.
+
+    The items are kept in an `OrderedDict`, ordered from the least to the most recently used.
+    """
 
-    def __init__(self, maxsize: Optional[int] = None):
+    def __init__(self, maxsize: Optional[int] = None, getsize: Optional[Callable[[T], int]] = None):
         """
         Initialize the LRU cache.
 
         :param maxsize: Maximum number of items the cache can hold. If None, the cache is unbounded.
+        :param getsize: Function that returns the size of an item, e.g. `len` to measure the size \
+            of strings or bytes. If given, `maxsize` limits the total size of the items, \
+            instead of their number.
         """
         self.maxsize = maxsize
-        self.cache: Dict[Hashable, CacheNode[T]] = {}  # Maps keys to nodes in the doubly linked list
-        # Dummy head and tail nodes to simplify operations
-        self.head = CacheNode[T]("", cast(T, None))  # Most recently used
-        self.tail = CacheNode[T]("", cast(T, None))  # Least recently used
-        self.head.next = self.tail
-        self.tail.prev = self.head
+        self.getsize = getsize
+        self.cache: "OrderedDict[Hashable, T]" = OrderedDict()
+        # Total size of the items, as measured by `getsize`. Used only if `getsize` is given.
+        self._size = 0
+        # Guards writes to `cache`, so the cache can be used from multiple threads
+        # (e.g. with threaded WSGI servers).
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
 
     def get(self, key: Hashable) -> Optional[T]:
         """
@@ -38,14 +62,21 @@ class LRUCache(Generic[T]):
         :param key: Key to look up in the cache.
         :return: Value associated with the key, or None if not found.
         """
-        if key in self.cache:
-            node = self.cache[key]
-            # Move the accessed node to the front (most recently used)
-            self._remove(node)
-            self._add_to_front(node)
-            return node.value
-        else:
-            return None  # Key not found
+        # NOTE: Reads are lock-free, as `get()` is called much more often than `set()`.
+        # The `OrderedDict` operations are atomic, so the worst that can happen is that
+        # the key is evicted by another thread between the two calls below.
+        value = self.cache.get(key)
+        if value is None:
+            self._misses += 1
+            return None
+
+        # Mark the item as the most recently used
+        try:
+            self.cache.move_to_end(key)
+        except KeyError:
+            pass
+        self._hits += 1
+        return value
 
     def has(self, key: Hashable) -> bool:
         """
@@ -67,49 +98,65 @@ class LRUCache(Generic[T]):
         if self.maxsize is not None and self.maxsize <= 0:
             return
 
-        if key in self.cache:
-            node = self.cache[key]
-            # Update the value
-            node.value = value
-            # Move the node to the front (most recently used)
-            self._remove(node)
-            self._add_to_front(node)
-        else:
-            if self.maxsize is not None and len(self.cache) >= self.maxsize:
+        if self.getsize is not None:
+            self._set_sized(key, value, self.getsize)
+            return
+
+        with self._lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+            elif self.maxsize is not None and len(self.cache) >= self.maxsize:
                 # Cache is full; remove the least recently used item
-                lru_node = self.tail.prev
-                if lru_node is None:
-                    raise RuntimeError("LRUCache: Tail node is None")
-                self._remove(lru_node)
-                del self.cache[lru_node.key]
+                self.cache.popitem(last=False)
+                self._evictions += 1
+
+            self.cache[key] = value
+
+    def _set_sized(self, key: Hashable, value: T, getsize: Callable[[T], int]) -> None:
+        # Items that would not fit even into an empty cache are not cached
+        size = getsize(value)
+        if self.maxsize is not None and size > self.maxsize:
+            return
 
-            # Add the new node to the front
-            new_node = CacheNode[T](key, value)
-            self.cache[key] = new_node
-            self._add_to_front(new_node)
+        with self._lock:
+            old_value = self.cache.pop(key, None)
+            if old_value is not None:
+                self._size -= getsize(old_value)
+
+            # Remove the least recently used items until there's enough space
+            while self.maxsize is not None and self.cache and self._size + size > self.maxsize:
+                _, evicted = self.cache.popitem(last=False)
+                self._size -= getsize(evicted)
+                self._evictions += 1
+
+            self.cache[key] = value
+            self._size += size
 
     def clear(self) -> None:
-        """Clear the cache."""
-        self.cache.clear()
-        self.head.next = self.tail
-        self.tail.prev = self.head
-
-    def _remove(self, node: CacheNode) -> None:
-        """Remove a node from the doubly linked list."""
-        prev_node = node.prev
-        next_node = node.next
-
-        if prev_node is not None:
-            prev_node.next = next_node
-
-        if next_node is not None:
-            next_node.prev = prev_node
-
-    def _add_to_front(self, node: CacheNode) -> None:
-        """Add a node right after the head (mark it as most recently used)."""
-        node.next = self.head.next
-        node.prev = self.head
-
-        if self.head.next:
-            self.head.next.prev = node
-            self.head.next = node
+        """Clear the cache. The statistics are reset too."""
+        with self._lock:
+            self.cache.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """
+        Get the usage statistics of the cache.
+
+        Use these to find out if the cache is large enough. E.g. if `evictions`
+        keeps growing, the cache is too small for the number of templates used.
+
+        NOTE: When the cache is used from multiple threads, `hits` and `misses` are approximate.
+
+        :return: `CacheStats` with the number of hits, misses, evictions, and the current size.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self.cache) if self.getsize is None else self._size,
+                maxsize=self.maxsize,
+            )
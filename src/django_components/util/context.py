@@ -1,5 +1,5 @@
 import copy
-from typing import List
+from typing import Any, Dict, List, Optional, Type
 
 from django.template import Context
 from django.template.loader_tags import BlockContext
@@ -11,6 +11,81 @@ class CopiedDict(dict):
     pass
 
 
+class SnapshotContextMixin:
+    """
+    Mixin for the Context classes of snapshots made by `snapshot_context()`.
+
+    A snapshot shares the layers of the Context it was made from, if that Context is
+    a snapshot too. Layers that are shared with other Contexts are listed in
+    `_djc_shared_layers`. Before a shared layer is written to, the Context that writes
+    replaces the layer with its own copy. So the write is not seen by the other Contexts.
+    """
+
+    dicts: List[dict]
+    # Map of `id(layer) -> layer`. Holding the layer keeps its `id()` from being reused.
+    _djc_shared_layers: Dict[int, dict]
+
+    def __copy__(self) -> Any:
+        duplicate = super().__copy__()  # type: ignore[misc]
+        duplicate._djc_shared_layers = self._djc_shared_layers.copy()
+        return duplicate
+
+    def _djc_own_layer(self, index: int) -> None:
+        """If the layer at given index is shared, replace it with a copy owned by this Context."""
+        shared_layers = self._djc_shared_layers
+        if not shared_layers:
+            return
+        layer = self.dicts[index]
+        if shared_layers.pop(id(layer), None) is None:
+            return
+
+        layer_copy = CopiedDict(layer)
+        dicts = self.dicts
+        # NOTE: The same layer may be in the Context more than once, e.g. after `context.push(context)`
+        for layer_index, curr_layer in enumerate(dicts):
+            if curr_layer is layer:
+                dicts[layer_index] = layer_copy
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._djc_own_layer(-1)
+        super().__setitem__(key, value)  # type: ignore[misc]
+
+    def __delitem__(self, key: Any) -> None:
+        self._djc_own_layer(-1)
+        super().__delitem__(key)  # type: ignore[misc]
+
+    def set_upward(self, key: Any, value: Any) -> None:
+        # Same search as in `Context.set_upward()`, so we know which layer will be written to
+        dicts = self.dicts
+        layer_index = len(dicts) - 1
+        for index in reversed(range(len(dicts))):
+            if key in dicts[index]:
+                layer_index = index
+                break
+        self._djc_own_layer(layer_index)
+        super().set_upward(key, value)  # type: ignore[misc]
+
+    def pop(self) -> Any:
+        layer = super().pop()  # type: ignore[misc]
+        shared_layers = self._djc_shared_layers
+        if id(layer) in shared_layers and not any(curr_layer is layer for curr_layer in self.dicts):
+            del shared_layers[id(layer)]
+        return layer
+
+
+_snapshot_context_classes: Dict[Type[Context], Type[Context]] = {}
+
+
+def _get_snapshot_context_class(context_cls: Type[Context]) -> Type[Context]:
+    snapshot_cls = _snapshot_context_classes.get(context_cls)
+    if snapshot_cls is None:
+        snapshot_cls = type(context_cls.__name__, (SnapshotContextMixin, context_cls), {})
+        snapshot_cls.__qualname__ = context_cls.__qualname__
+        snapshot_cls.__module__ = context_cls.__module__
+        _snapshot_context_classes[context_cls] = snapshot_cls
+    return snapshot_cls
+
+
 def snapshot_context(context: Context) -> Context:
     """
     Make a copy of the Context object, so that it can be used as a snapshot.
@@ -28,10 +103,14 @@ def snapshot_context(context: Context) -> Context:
     assert ctx["a"] == 1       # ERROR
     ```
 
-    This function aims to make a shallow copy, but needs to make deeper copies
-    for certain features like forloops or support for `{% block %}` / `{% extends %}`.
+    The layers of a plain Context are copied. But when the Context is itself a snapshot
+    (e.g. a component's template renders a nested component), the layers are shared
+    with it as copy-on-write. See `SnapshotContextMixin`. Layers that hold forloops are
+    always copied, as Django modifies those in place. We also make deeper copies of
+    `{% block %}` / `{% extends %}` state.
     """
     # Using `copy()` should also copy flags like `autoescape`, `use_l10n`, etc.
+    # For snapshots, this also copies the list of shared layers.
     context_copy = copy.copy(context)
 
     # Context is a list of dicts, where the dicts can be thought of as "layers" - when a new
@@ -41,39 +120,32 @@ def snapshot_context(context: Context) -> Context:
     # of the objects created by the forloop, so all forloop metadata (index, first, last, etc.)
     # is preserved for all (potentially nested) forloops.
     #
-    # For non-forloop layers, we just make shallow copies.
-    dicts_with_copied_forloops: List[CopiedDict] = []
-
-    # NOTE: For better performance, we iterate over the dicts in reverse order.
-    #       This is because:
-    #       1. Layers are added to the end of the list.
-    #       2. We assume that user won't be replacing the dicts in the older layers.
-    #       3. Thus, when we come across a layer that has already been copied,
-    #          we know that all layers before it have also been copied.
-    for ctx_dict_index in reversed(range(len(context.dicts))):
-        ctx_dict = context.dicts[ctx_dict_index]
-
-        # This layer is already copied, reuse this and all before it
-        if isinstance(ctx_dict, CopiedDict):
-            # NOTE: +1 because we want to include the current layer
-            dicts_with_copied_forloops = context.dicts[: ctx_dict_index + 1] + dicts_with_copied_forloops
-            break
-
-        # Copy the dict
-        ctx_dict_copy = CopiedDict(ctx_dict)
-        if "forloop" in ctx_dict:
-            ctx_dict_copy["forloop"] = ctx_dict["forloop"].copy()
-
-            # Recursively copy the state of potentially nested forloops
-            curr_forloop = ctx_dict_copy["forloop"]
-            while curr_forloop is not None:
-                curr_forloop["parentloop"] = curr_forloop["parentloop"].copy()
-                if "parentloop" in curr_forloop["parentloop"]:
-                    curr_forloop = curr_forloop["parentloop"]
-                else:
-                    break
-
-        dicts_with_copied_forloops.insert(0, ctx_dict_copy)
+    # We can share a layer only if both this and the original Context know that it's shared,
+    # so that either of them copies the layer before writing to it. We don't change
+    # the original Context, so we can share its layers only if it's already a snapshot.
+    # The topmost layer is copied right away, as that's where writes usually go.
+    if isinstance(context, SnapshotContextMixin):
+        source_shared_layers: Optional[Dict[int, dict]] = context._djc_shared_layers
+        shared_layers: Dict[int, dict] = context_copy._djc_shared_layers  # type: ignore[attr-defined]
+    else:
+        source_shared_layers = None
+        shared_layers = {}
+        context_copy.__class__ = _get_snapshot_context_class(context.__class__)
+        context_copy._djc_shared_layers = shared_layers  # type: ignore[attr-defined]
+
+    dicts_with_copied_forloops: List[dict] = []
+    for ctx_dict in context.dicts[:-1]:
+        # NOTE: The snapshot starts with the same shared layers as the original Context.
+        #       Shared layers never hold forloops, as those are always copied.
+        if id(ctx_dict) in shared_layers:
+            dicts_with_copied_forloops.append(ctx_dict)
+        elif source_shared_layers is None or "forloop" in ctx_dict:
+            dicts_with_copied_forloops.append(_copy_context_layer(ctx_dict))
+        else:
+            source_shared_layers[id(ctx_dict)] = ctx_dict
+            shared_layers[id(ctx_dict)] = ctx_dict
+            dicts_with_copied_forloops.append(ctx_dict)
+    dicts_with_copied_forloops.append(_copy_context_layer(context.dicts[-1]))
 
     context_copy.dicts = dicts_with_copied_forloops
 
@@ -104,6 +176,23 @@ def snapshot_context(context: Context) -> Context:
     return context_copy
 
 
+def _copy_context_layer(ctx_dict: dict) -> CopiedDict:
+    """Make a copy of a Context layer, including the state of (potentially nested) forloops"""
+    ctx_dict_copy = CopiedDict(ctx_dict)
+    if "forloop" in ctx_dict:
+        ctx_dict_copy["forloop"] = ctx_dict["forloop"].copy()
+
+        # Recursively copy the state of potentially nested forloops
+        curr_forloop = ctx_dict_copy["forloop"]
+        while curr_forloop is not None:
+            curr_forloop["parentloop"] = curr_forloop["parentloop"].copy()
+            if "parentloop" in curr_forloop["parentloop"]:
+                curr_forloop = curr_forloop["parentloop"]
+            else:
+                break
+    return ctx_dict_copy
+
+
 def _copy_block_context(block_context: BlockContext) -> BlockContext:
     """Make a shallow copy of BlockContext"""
     block_context_copy = block_context.__class__()
@@ -1,8 +1,16 @@
-from typing import Any, Type
+import io
+import json
+import pickle
+from hashlib import sha256
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Dict, Optional, Tuple, Type
 
-from django.template import Context, NodeList, Template
-from django.template.base import Parser
+import django
+from django.template import Context, Engine, NodeList, Template, TemplateSyntaxError
+from django.template.base import Origin, Parser
+from django.template.smartif import OPERATORS
 
+from django_components.cache import get_template_nodelist_cache
 from django_components.util.template_parser import parse_template
 
 
@@ -17,8 +25,38 @@ def monkeypatch_template_cls(template_cls: Type[Template]) -> None:
 # to use template tags as inputs to the component tag:
 #
 # {% component "my-component" description="{% lorem 3 w %}" / %}
+#
+# If `COMPONENTS.template_cache_dir` is set, the compiled nodelist is also stored on the disk,
+# so other processes can load it instead of parsing the template again.
 def monkeypatch_template_compile_nodelist(template_cls: Type[Template]) -> None:
     def _compile_nodelist(self: Template) -> NodeList:
+        cache = get_template_nodelist_cache()
+        if cache is None:
+            return _parse_nodelist(self)
+
+        cache_key = _gen_nodelist_cache_key(self)
+        entry: Optional[bytes] = cache.get(cache_key)
+        if entry is not None:
+            try:
+                nodelist, self.extra_data = _unpickle_nodelist(self, entry)
+                return nodelist
+            # E.g. a component's tag is no longer registered. In that case we parse the template
+            # as usual, so the same errors are raised as without the cache.
+            except Exception:
+                pass
+
+        nodelist = _parse_nodelist(self)
+        try:
+            entry = _pickle_nodelist(self, nodelist, getattr(self, "extra_data", {}))
+        # Nodes of some template tags cannot be pickled, e.g. if they hold lambdas.
+        # Such templates are not stored.
+        except Exception:
+            entry = None
+        if entry is not None:
+            cache.set(cache_key, entry)
+        return nodelist
+
+    def _parse_nodelist(self: Template) -> NodeList:
         """
         Parse and compile the template source into a nodelist. If debug
         is True and an exception occurs during parsing, the exception is
@@ -33,7 +71,14 @@ def monkeypatch_template_compile_nodelist(template_cls: Type[Template]) -> None:
 
         # tokens = lexer.tokenize()
         #  ---------------- OUR CHANGES START ----------------
-        tokens = parse_template(self.source)
+        # Same as Django, the tokens hold their positions in the source only if debug is True,
+        # as the positions are used only to show where in the template an error occurred.
+        try:
+            tokens = parse_template(self.source, debug=self.engine.debug)
+        except TemplateSyntaxError as e:
+            if self.engine.debug and getattr(e, "token", None) is not None:
+                e.template_debug = self.get_exception_info(e, e.token)  # type: ignore
+            raise
         #  ---------------- OUR CHANGES END ----------------
         parser = Parser(
             tokens,
@@ -56,6 +101,133 @@ def monkeypatch_template_compile_nodelist(template_cls: Type[Template]) -> None:
     template_cls.compile_nodelist = _compile_nodelist
 
 
+try:
+    _djc_version = version("django_components")
+except PackageNotFoundError:
+    _djc_version = ""
+
+
+# The nodes are pickled by reference to their classes and to the template tag and filter functions.
+# So the same template source can be loaded only with the same versions of Django and django-components,
+# and by an engine with the same configuration (e.g. the same builtins and libraries).
+def _gen_nodelist_cache_key(template: Template) -> str:
+    engine = template.engine
+    # Perf - The engine's configuration doesn't change, so we serialize it only once
+    engine_key: Optional[str] = getattr(engine, "_djc_nodelist_cache_key", None)
+    if engine_key is None:
+        engine_key = json.dumps(
+            [
+                django.get_version(),
+                _djc_version,
+                engine.debug,
+                engine.builtins,
+                sorted(engine.libraries.items()),
+            ]
+        )
+        engine._djc_nodelist_cache_key = engine_key  # type: ignore[attr-defined]
+
+    key_hash = sha256(engine_key.encode("utf-8"))
+    key_hash.update(template.source.encode("utf-8"))
+    return f"components:nodelist:{key_hash.hexdigest()}"
+
+
+# The nodes hold references to the template's origin, engine, and parser, which can't be (or shouldn't be)
+# pickled. So we store them as placeholders, and replace them with the current template's origin and engine
+# when the nodes are unpickled.
+#
+# Similarly, the operators of the `{% if %}` tag are classes created inside functions, so we store
+# them by their keys in Django's `OPERATORS`.
+#
+# The parser is kept by the component tags to compile their inputs on the first render, see `TagValueStruct`.
+# For the parser we store which template tags and filters were loaded from which libraries,
+# and we create the parser again from the engine's libraries.
+_if_operator_keys: Dict[type, str] = {operator: key for key, operator in OPERATORS.items()}
+
+
+class _NodelistPickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO, engine: Engine):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.engine = engine
+        self.parser_ids: Dict[int, int] = {}
+
+    def persistent_id(self, obj: Any) -> Any:
+        if isinstance(obj, Origin):
+            return "origin"
+        elif isinstance(obj, Engine):
+            return "engine"
+        elif isinstance(obj, Parser):
+            # The same parser is shared by many nodes, so we store its libraries only once
+            parser_id = self.parser_ids.get(id(obj))
+            if parser_id is not None:
+                return ("parser", parser_id, None)
+            parser_id = self.parser_ids[id(obj)] = len(self.parser_ids)
+            return ("parser", parser_id, _get_parser_libraries(self.engine, obj))
+        elif isinstance(obj, type) and obj in _if_operator_keys:
+            return ("if_operator", _if_operator_keys[obj])
+        return None
+
+
+class _NodelistUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, template: Template):
+        super().__init__(file)
+        self.template = template
+        self.parsers: Dict[int, Parser] = {}
+
+    def persistent_load(self, pid: Any) -> Any:
+        if pid == "origin":
+            return self.template.origin
+        elif pid == "engine":
+            return self.template.engine
+        elif isinstance(pid, tuple) and pid[0] == "parser":
+            _, parser_id, libraries = pid
+            if libraries is not None:
+                self.parsers[parser_id] = _create_parser(self.template, libraries)
+            return self.parsers[parser_id]
+        elif isinstance(pid, tuple) and pid[0] == "if_operator":
+            return OPERATORS[pid[1]]
+        raise pickle.UnpicklingError(f"Unknown persistent ID '{pid}'")
+
+
+# Returns the names of the library for each tag and filter that is not a builtin.
+def _get_parser_libraries(engine: Engine, parser: Parser) -> Tuple[Dict[str, str], Dict[str, str]]:
+    builtins = Parser([], builtins=engine.template_builtins)
+    tags: Dict[str, str] = {}
+    filters: Dict[str, str] = {}
+    for kind, refs in (("tags", tags), ("filters", filters)):
+        builtin_fns: Dict[str, Any] = getattr(builtins, kind)
+        for name, fn in getattr(parser, kind).items():
+            if builtin_fns.get(name) is fn:
+                continue
+            for lib_name, lib in engine.template_libraries.items():
+                if getattr(lib, kind).get(name) is fn:
+                    refs[name] = lib_name
+                    break
+            else:
+                raise pickle.PicklingError(f"Template {kind} '{name}' was not found in the engine's libraries")
+    return tags, filters
+
+
+def _create_parser(template: Template, libraries: Tuple[Dict[str, str], Dict[str, str]]) -> Parser:
+    engine = template.engine
+    parser = Parser([], engine.template_libraries, engine.template_builtins, template.origin)
+    tags, filters = libraries
+    for name, lib_name in tags.items():
+        parser.tags[name] = engine.template_libraries[lib_name].tags[name]
+    for name, lib_name in filters.items():
+        parser.filters[name] = engine.template_libraries[lib_name].filters[name]
+    return parser
+
+
+def _pickle_nodelist(template: Template, nodelist: NodeList, extra_data: Dict) -> bytes:
+    buffer = io.BytesIO()
+    _NodelistPickler(buffer, template.engine).dump((nodelist, extra_data))
+    return buffer.getvalue()
+
+
+def _unpickle_nodelist(template: Template, data: bytes) -> Tuple[NodeList, Dict]:
+    return _NodelistUnpickler(io.BytesIO(data), template).load()
+
+
 def monkeypatch_template_render(template_cls: Type[Template]) -> None:
     # Modify `Template.render` to set `isolated_context` kwarg of `push_state`
     # based on our custom `Template._djc_is_component_nested`.
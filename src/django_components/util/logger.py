@@ -29,6 +29,27 @@ def _get_log_levels() -> Dict[str, int]:
         return logging._nameToLevel.copy()
 
 
+def is_trace_enabled() -> bool:
+    """
+    Whether TRACE level logs are emitted by the `django_components` logger.
+
+    Use this to skip building trace messages when tracing is disabled:
+
+    ```py
+    if __debug__ and is_trace_enabled():
+        trace_component_msg(..., extra=f"Available slots: {slots}")
+    ```
+
+    Guarding the call with `__debug__` removes it from the bytecode altogether
+    when Python is run with optimizations (`python -O`).
+    """
+    if actual_trace_level_num == -1:
+        setup_logging()
+    # NOTE: `Logger.isEnabledFor()` caches its result, and the cache is cleared
+    # when the logging config changes. So this is cheap enough to call on each render.
+    return logger.isEnabledFor(actual_trace_level_num)
+
+
 def trace(message: str, *args: Any, **kwargs: Any) -> None:
     """
     TRACE level logger.
@@ -55,9 +76,7 @@ def trace(message: str, *args: Any, **kwargs: Any) -> None:
     }
     ```
     """
-    if actual_trace_level_num == -1:
-        setup_logging()
-    if logger.isEnabledFor(actual_trace_level_num):
+    if is_trace_enabled():
         logger.log(actual_trace_level_num, message, *args, **kwargs)
 
 
@@ -73,12 +92,15 @@ def trace_node_msg(
 
     `"PARSE slot ID 0088 ...Done!"`
     """
+    if not is_trace_enabled():
+        return
+
     action_normalized = action.ljust(6, " ")
     full_msg = f"{action_normalized} NODE {node_type} ID {node_id} {msg}"
 
     # NOTE: When debugging tests during development, it may be easier to change
     # this to `print()`
-    trace(full_msg)
+    logger.log(actual_trace_level_num, full_msg)
 
 
 def trace_component_msg(
@@ -96,6 +118,8 @@ def trace_component_msg(
 
     `"RENDER_SLOT COMPONENT 'component_name' SLOT: 'slot_name' FILLS: 'fill_name' PATH: Root > Child > Grandchild "`
     """
+    if not is_trace_enabled():
+        return
 
     if component_id:
         component_id_str = f"ID {component_id}"
@@ -121,4 +145,4 @@ def trace_component_msg(
 
     # NOTE: When debugging tests during development, it may be easier to change
     # this to `print()`
-    trace(full_msg)
+    logger.log(actual_trace_level_num, full_msg)
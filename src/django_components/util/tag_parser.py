@@ -36,7 +36,9 @@ and returns an AST representation of the tag:
 See `parse_tag()` for details.
 """
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union, cast
 
 from django.template.base import FilterExpression, Parser
@@ -90,6 +92,13 @@ class TagValue:
 
     parts: List["TagValuePart"]
     compiled: Optional[FilterExpression] = None
+    is_literal: bool = field(default=False, repr=False, compare=False)
+    """
+    Whether the value is a literal without filters, e.g. `"my-class"` or `42`,
+    so it always resolves to the same value. Set by `compile()`.
+    """
+    # The resolved value if `is_literal` is `True`
+    literal_value: Any = field(default=None, repr=False, compare=False)
 
     @property
     def is_spread(self) -> bool:
@@ -117,10 +126,25 @@ class TagValue:
             self.compiled = DynamicFilterExpression(parser, serialized)
         else:
             self.compiled = FilterExpression(serialized, parser)
+            self._detect_literal(self.compiled)
+
+    def _detect_literal(self, compiled: FilterExpression) -> None:
+        if compiled.filters:
+            return
+        # String literals are already resolved by `FilterExpression`, and held in `var`.
+        # Numbers are held as `Variable`s without lookups.
+        if not compiled.is_var:
+            self.is_literal = True
+            self.literal_value = compiled.var
+        elif compiled.var.lookups is None and not compiled.var.translate:
+            self.is_literal = True
+            self.literal_value = compiled.var.literal
 
     def resolve(self, context: Context) -> Any:
         if self.compiled is None:
             raise TemplateSyntaxError("Malformed tag: TagValue.resolve() called before compile()")
+        if self.is_literal:
+            return self.literal_value
         return self.compiled.resolve(context)
 
 
@@ -219,6 +243,15 @@ class TagValueStruct:
     # Parser is passed through so we can resolve variables with filters
     parser: Optional[Parser]
     compiled: bool = False
+    is_literal: bool = field(default=False, repr=False, compare=False)
+    """
+    Whether the value contains only literals, e.g. `[1, 2, 3]` or `{"class": "btn"}`,
+    so it always resolves to the same value. Set by `compile()`.
+    """
+    # The resolved value if `is_literal` is `True`. Lists and dicts are copied before they're returned.
+    literal_value: Any = field(default=None, repr=False, compare=False)
+    # Whether `literal_value` contains nested lists or dicts, so it must be copied deeply
+    literal_is_nested: bool = field(default=False, repr=False, compare=False)
 
     def serialize(self) -> str:
         """
@@ -294,14 +327,34 @@ class TagValueStruct:
             for entry in self.entries:
                 compile_value(entry)
 
+        # If all the values are literals, e.g. `attrs={"class": "btn", "type": "submit"}`,
+        # then we can resolve the value already now, and skip rebuilding it on each render.
+        self.is_literal = all(entry.is_literal for entry in self.entries)
+        if self.is_literal:
+            self.literal_value = self._resolve(Context())
+            self.literal_is_nested = any(isinstance(entry, TagValueStruct) for entry in self.entries)
+
         self.compiled = True
 
-    # Walk down the TagValueStructs and resolve the expressions.
-    #
-    # NOTE: This is where the TagValueStructs are converted to lists and dicts.
     def resolve(self, context: Context) -> Any:
         self.compile()
 
+        if not self.is_literal:
+            return self._resolve(context)
+
+        # Lists and dicts are copied, so that if the resolved value is modified,
+        # it doesn't change the value that's resolved on the next render.
+        if self.type == "simple":
+            return self.literal_value
+        elif self.literal_is_nested:
+            return _copy_literal(self.literal_value)
+        else:
+            return self.literal_value.copy()
+
+    # Walk down the TagValueStructs and resolve the expressions.
+    #
+    # NOTE: This is where the TagValueStructs are converted to lists and dicts.
+    def _resolve(self, context: Context) -> Any:
         if self.type == "simple":
             value = self.entries[0]
             if not isinstance(value, TagValue):
@@ -359,6 +412,46 @@ class TagValueStruct:
             return resolved_dict
 
 
+# Copy nested lists and dicts, so that modifying the copy doesn't change the original.
+# Faster than `copy.deepcopy()`, as literals contain only lists, dicts and immutable values.
+def _copy_literal(value: Union[List, Dict]) -> Union[List, Dict]:
+    if isinstance(value, list):
+        return [_copy_literal(item) if isinstance(item, (list, dict)) else item for item in value]
+    else:
+        return {key: _copy_literal(item) if isinstance(item, (list, dict)) else item for key, item in value.items()}
+
+
+# Match the text until one of the tokens, e.g. `[^ =|]*` for tokens `(" ", "=", "|")`.
+# Tokens in `ignore`, e.g. escaped quotes `\"`, are taken as a whole, even if they contain one of the tokens.
+@lru_cache(maxsize=None)
+def _get_take_until_pattern(tokens: Tuple[str, ...], ignore: Tuple[str, ...]) -> "re.Pattern[str]":
+    if not tokens or not all(tokens) or not all(ignore):
+        raise TemplateSyntaxError("Empty token")
+
+    # Characters that cannot start any of the tokens can be taken without checking the tokens
+    first_chars = "".join(sorted({token[0] for token in tokens}))
+    alternatives = [re.escape(token) for token in ignore]
+    alternatives.append(f"[^{re.escape(first_chars)}]")
+    # Multi-character tokens, e.g. `_("`, whose first character is not a token on its own.
+    # Their first character is taken only if it's not followed by the rest of the token.
+    multi_char_tokens = [token for token in tokens if len(token) > 1 and token[0] not in tokens]
+    if multi_char_tokens:
+        tokens_pattern = "|".join(re.escape(token) for token in multi_char_tokens)
+        multi_first_chars = "".join(sorted({token[0] for token in multi_char_tokens}))
+        alternatives.append(f"(?!{tokens_pattern})[{re.escape(multi_first_chars)}]")
+    return re.compile(f"(?:{'|'.join(alternatives)})*", re.DOTALL)
+
+
+# Match the text as long as it consists of the tokens, e.g. `[ \t\n]*` for whitespace tokens.
+@lru_cache(maxsize=None)
+def _get_take_while_pattern(tokens: Tuple[str, ...]) -> "re.Pattern[str]":
+    if not tokens or not all(tokens):
+        raise TemplateSyntaxError("Empty token")
+    if any(len(token) > 1 for token in tokens):
+        raise TemplateSyntaxError("take_while() accepts only single-character tokens")
+    return re.compile(f"[{re.escape(''.join(tokens))}]*")
+
+
 def parse_tag(text: str, parser: Optional[Parser]) -> Tuple[str, List[TagAttr]]:
     """
     Parse the content of a Django template tag like this:
@@ -413,41 +506,24 @@ def parse_tag(text: str, parser: Optional[Parser]) -> Tuple[str, List[TagAttr]]:
     - Misplaced spread: `attr=[...val]`, `attr={...val}`, `attr=[**val]`, `attr={*val}`
     - Spreading lists and dicts: `...[1, 2, 3]`, `...{"key": "value"}`
     """
+    # NOTE: The text is scanned with regexes and `str.startswith()`, which run in C,
+    # instead of walking it character by character. The text taken so far is always `text[:index]`.
     index = 0
-    normalized = ""
+    text_len = len(text)
 
     def add_token(token: str) -> None:
-        nonlocal normalized
         nonlocal index
-
-        normalized += token
         index += len(token)
 
-    def is_at_end(offset: int = 0) -> bool:
-        return index + offset >= len(text)
+    def is_at_end() -> bool:
+        return index >= text_len
 
     def is_next_token(tokens: Union[List[str], Tuple[str, ...]]) -> bool:
         if not tokens:
             raise TemplateSyntaxError("No tokens provided")
-
-        def is_token_match(token: str) -> bool:
-            if not token:
-                raise TemplateSyntaxError("Empty token")
-
-            for token_index, token_char in enumerate(token):
-                text_char = text[index + token_index] if not is_at_end(token_index) else None
-                if text_char is None or text_char != token_char:
-                    return False
-            return True
-
-        for token in tokens:
-            is_match = is_token_match(token)
-            if is_match:
-                return True
-        return False
+        return text.startswith(tuple(tokens), index)
 
     def taken_n(n: int) -> str:
-        nonlocal index
         result = text[index : index + n]  # noqa: E203
         add_token(result)
         return result
@@ -457,46 +533,13 @@ def parse_tag(text: str, parser: Optional[Parser]) -> Tuple[str, List[TagAttr]]:
         tokens: Union[List[str], Tuple[str, ...]],
         ignore: Optional[Sequence[str]] = None,
     ) -> str:
-        nonlocal index
-        nonlocal text
-
-        result = ""
-        while not is_at_end():
-            char = text[index]
-
-            ignore_token_match: Optional[str] = None
-            for ignore_token in ignore or []:
-                if is_next_token([ignore_token]):
-                    ignore_token_match = ignore_token
-
-            if ignore_token_match:
-                result += "".join(ignore_token_match)
-                add_token(ignore_token_match)
-                continue
-
-            if is_next_token(tokens):
-                return result
-
-            result += char
-            add_token(char)
-        return result
+        match = _get_take_until_pattern(tuple(tokens), tuple(ignore or ())).match(text, index)
+        return taken_n(match.end() - index)  # type: ignore[union-attr]
 
     # tag_name = take_while([" ", "\t", "\n", "\r", "\f"])
     def take_while(tokens: Union[List[str], Tuple[str, ...]]) -> str:
-        nonlocal index
-        nonlocal text
-
-        result = ""
-        while not is_at_end():
-            char = text[index]
-
-            if is_next_token(tokens):
-                result += char
-                add_token(char)
-            else:
-                return result
-
-        return result
+        match = _get_take_while_pattern(tuple(tokens)).match(text, index)
+        return taken_n(match.end() - index)  # type: ignore[union-attr]
 
     def extract_spread_token(curr_struct: TagValueStruct, filter_token: Optional[str]) -> Optional[str]:
         # Move the spread syntax out of the way, so that we properly handle what's next.
@@ -557,7 +600,7 @@ def parse_tag(text: str, parser: Optional[Parser]) -> Tuple[str, List[TagAttr]]:
         # Skip whitespace
         take_while(TAG_WHITESPACE)
 
-        start_index = len(normalized)
+        start_index = index
         key = None
 
         # If token starts with any of these, we assume it's a value without key part.
@@ -575,7 +618,6 @@ def parse_tag(text: str, parser: Optional[Parser]) -> Tuple[str, List[TagAttr]]:
             if not is_next_token(["="]):
                 # This was actually a value (variable) without the key part
                 index -= len(key)
-                normalized = normalized[:start_index]
                 key = None
             else:
                 add_token("=")
@@ -926,4 +968,4 @@ def parse_tag(text: str, parser: Optional[Parser]) -> Tuple[str, List[TagAttr]]:
             )
         )
 
-    return normalized, attrs
+    return text[:index], attrs
@@ -34,76 +34,128 @@ See `parse_template()` for details.
 
 import re
 from functools import lru_cache
-from typing import List, Optional, Tuple
+from typing import List, NoReturn, Tuple
 
-from django.template.base import DebugLexer, Token, TokenType
+from django.template import base
+from django.template.base import Lexer, Token, TokenType
 from django.template.exceptions import TemplateSyntaxError
 
-
-# NOTE: As of 0.125, the strategy is to use Django's lexer, and use our own parser
-#   only when necessary, for the shortest time possible.
+# NOTE: As of 0.130, the template is lexed in a single pass, like Django's `Lexer`.
 #
-#   Before I switched to this strategy, my initial parser was about 50x slower than Django's lexer.
-#   I (Juro) assume it was because I was walking character by character, instead of using a regex.
+#   Previously, we used Django's `DebugLexer`, and whenever a `{% %}` tag contained a quote,
+#   we switched to our character-by-character parser to find where the tag ends, and then
+#   restarted Django's lexer on the remaining text. That was about 8x slower than Django's lexer
+#   for templates with components, as nearly every `{% component "name" %}` tag contains a quote.
 #
-#   The overall speed should then depend on the number of broken tokens in the template.
+#   Now, the regex below recognizes the quoted strings inside of `{% %}` tags, so that
+#   `{% component "my_comp" text="%}" %}` is found in one go.
 #
-#   Performance of the new strategy on a real-world example:
-#   - A template with about 110 lines and 6 components
-#   - Components spanning ~35 lines in total, so roughly 1/3 of the template
-#   - The custom parser is about 8x slower than Django's Debug lexer.
-#   - For a mid-sized project of 200 templates, it would take 7-8 seconds to load all the templates
-#     (from 1 second with Django's lexer).
-#     - However, thanks to django-component's lazy-loading, this should not be a problem.
+#   If a `{% %}` tag contains an unterminated string, we use our character-by-character parser
+#   to raise the error.
+
+# Same as Django's `tag_re` (`{%.*?%}|{{.*?}}|{#.*?#}`), except that `{% %}` tags may contain
+# quoted strings with `%}` inside.
 #
-#   How it works is that:
-#   1. We use Django's lexer to get the tokens.
-#   2. We check them one-by-one, and if we find a broken token, we switch to our parser to fix it.
-#   3. Once the broken token is fixed, we find it's end position, and switch back to the Django lexer
-#      for the remaining text (step 1).
-def parse_template(text: str) -> List[Token]:
-    resolved_tokens: List[Token] = []
-
-    index_start = 0
-    index_end = len(text)
-    lineno_offset = 0
-
-    while index_start < index_end:
-        broken_token: Optional[Token] = None
-        # Do fast tokenization with regex - This is about 50x faster than our custom tokenizer.
-        # We use DebugLexer because we need to get the position of the tokens.
-        # DebugLexer and Lexer have very similar speeds, Debug is about 33% slower.
-        lexer = DebugLexer(text[index_start:index_end])
-        tokens: List[Token] = lexer.tokenize()
-
-        for token in tokens:
-            token.lineno += lineno_offset
-            token.position = (token.position[0] + index_start, token.position[1] + index_start)
-
-            if token.token_type == TokenType.BLOCK and ("'" in token.contents or '"' in token.contents):
-                broken_token = token
-                break
-            else:
-                resolved_tokens.append(token)
-
-        # If we found a broken token, we switch to our slow parser
-        if broken_token is not None:
-            broken_token_start = broken_token.position[0]
-            fixed_token = _detailed_tag_parser(text[broken_token_start:], broken_token.lineno, broken_token_start)
-
-            resolved_tokens.append(fixed_token)
-            index_start = fixed_token.position[1]
-            lineno_offset += (
-                fixed_token.lineno - 1  # -1 because lines are 1-indexed
-                + fixed_token.contents.count("\n")
-            )  # fmt: skip
-        else:
+# If a `{% %}` tag contains an unterminated string, it's matched by the last alternative,
+# which captures an empty string in the second group.
+#
+# NOTE: The loops are "unrolled" (`a*(?:b a*)*` instead of `(?:a|b)*`), so that the regex
+#       doesn't backtrack excessively on tags that don't match.
+# NOTE 2: The regex is a single group of alternatives, same as Django's `tag_re`, so that
+#         the regex engine can quickly skip the text until the next `{`.
+_TAG_PATTERN = r"""
+    (
+        \{%
+        (?={any}*?%\})  # There must be `%}` further in the text, same as in Django
+        [^"'%]*
+        (?:
+            (?:
+                %(?!\})
+                | "[^"\\]*(?:\\.[^"\\]*)*"  # "string" with escaped quotes \"
+                | '[^'\\]*(?:\\.[^'\\]*)*'  # 'string' with escaped quotes \'
+            )
+            [^"'%]*
+        )*
+        %\}
+        | \{\{{any}*?\}\}
+        | \{\#{any}*?\#\}
+        | \{%{any}*?%\}()  # `{% %}` tag with an unterminated string
+    )
+"""
+
+
+# Whether the template tags may span multiple lines depends on whether Django's `tag_re`
+# matches newlines. See `COMPONENTS.multiline_tags`.
+@lru_cache(maxsize=2)
+def _get_tag_re(multiline: bool) -> "re.Pattern[str]":
+    pattern = _TAG_PATTERN.replace("{any}", "." if multiline else "[^\n]")
+    return re.compile(pattern, re.DOTALL | re.VERBOSE)
+
+
+def parse_template(text: str, debug: bool = True) -> List[Token]:
+    """
+    Split the template into tokens, same as Django's `Lexer.tokenize()`, except that
+    `{% %}` tags may contain `%}` inside of quoted strings.
+
+    If `debug` is `True`, the tokens hold their position in the template, same as
+    with Django's `DebugLexer`. Otherwise the positions are `None`, same as with `Lexer`.
+    """
+    # NOTE: We use Django's `Lexer` to create the tokens, so that `{% verbatim %}` is handled the same way.
+    lexer = Lexer(text)
+    create_token = lexer.create_token
+    result: List[Token] = []
+    lineno = 1
+    offset = 0
+
+    # `split()` returns `[text, tag, broken, text, tag, broken, ..., text]`,
+    # where `broken` is `None`, unless the tag contains an unterminated string.
+    tag_re = _get_tag_re(bool(base.tag_re.flags & re.DOTALL))
+    parts = tag_re.split(text)
+    parts_len = len(parts)
+    for part_index in range(0, parts_len, 3):
+        token_string = parts[part_index]
+        if token_string:
+            token_end = offset + len(token_string)
+            position = (offset, token_end) if debug else None
+            result.append(create_token(token_string, position, lineno, False))
+            lineno += token_string.count("\n")
+            offset = token_end
+
+        if part_index + 1 >= parts_len:
             break
 
-    return resolved_tokens
+        tag_string = parts[part_index + 1]
+        tag_end = offset + len(tag_string)
+
+        # `{% %}` tag with an unterminated string - Raise the appropriate error.
+        # Inside `{% verbatim %}`, the tag is just text, so we allow it.
+        if parts[part_index + 2] is not None and not lexer.verbatim:
+            _raise_unterminated_tag(text, tag_string, offset, tag_end, lineno)
+
+        position = (offset, tag_end) if debug else None
+        result.append(create_token(tag_string, position, lineno, True))
+        lineno += tag_string.count("\n")
+        offset = tag_end
+
+    return result
+
+
+# The error holds the token of the tag, same as errors raised by Django's `Parser`, so that
+# `Template.compile_nodelist()` can show where in the template the error occurred.
+# The token has a position even if the template was lexed with `debug=False`.
+def _raise_unterminated_tag(text: str, tag_string: str, start: int, end: int, lineno: int) -> NoReturn:
+    try:
+        _detailed_tag_parser(text[start:], lineno, start)
+        raise TemplateSyntaxError("Unexpected end of text - unterminated {% tag")
+    except TemplateSyntaxError as err:
+        token = Token(TokenType.BLOCK, tag_string[2:-2].strip(), (start, end), lineno)
+        err.token = token  # type: ignore[attr-defined]
+        raise
 
 
 # Handle parsing of `{% %}` tags, while allowing `%}` inside of strings
+#
+# NOTE: This is used only to raise an error for `{% %}` tags that `_get_tag_re()` couldn't match.
 def _detailed_tag_parser(text: str, lineno: int, start_index: int) -> Token:
     index = 0
     length = len(text)
@@ -4,6 +4,7 @@ This file is for logic that focuses on transforming the AST of template tags
 """
 
 import inspect
+import keyword
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple
 
@@ -11,7 +12,7 @@ from django.template import Context, NodeList
 from django.template.base import Parser, Token
 from django.template.exceptions import TemplateSyntaxError
 
-from django_components.expression import process_aggregate_kwargs
+from django_components.expression import is_aggregate_key, process_aggregate_kwargs
 from django_components.util.tag_parser import TagAttr, parse_tag
 
 
@@ -100,6 +101,126 @@ def resolve_params(
     return resolved_params
 
 
+# Placeholder for a param's value, used when we validate only the shape of the params.
+class _ParamRef(NamedTuple):
+    param_index: int
+
+
+class CompiledTagParams:
+    """
+    Params of a single template tag, prepared so that they can be resolved with minimal work on each render.
+
+    Unless the tag uses the spread syntax (`...attrs`) or aggregate kwargs (`attrs:class`), we know
+    from the template alone which params are positional args, kwargs, or kwargs that are not
+    valid Python identifiers (e.g. `data-id`), and which parameters of `render()` they map to.
+    So the params are validated against the signature of `render()` only once, and literal values
+    (e.g. `"my-class"` or `42`) are resolved only once.
+
+    On each render, only the variables are resolved.
+
+    Use `compile_params()` to create an instance.
+    """
+
+    def __init__(
+        self,
+        params: List[TagAttr],
+        literal_values: List[Any],
+        literal_indices: Set[int],
+        arg_indices: List[int],
+        kwarg_indices: List[Tuple[str, int]],
+        defaults: Dict[str, Any],
+    ):
+        self._literal_values = literal_values
+        # Params whose values are not literals, as `(index, value)`
+        self._variables = [(index, param.value) for index, param in enumerate(params) if index not in literal_indices]
+        self._arg_indices = arg_indices
+        self._kwarg_indices = kwarg_indices
+        self._defaults = defaults
+
+    def resolve(self, context: Context) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        """Resolve the params, returning the args and kwargs to be passed to `render()`."""
+        values = self._literal_values.copy()
+        for index, value in self._variables:
+            values[index] = value.resolve(context)
+
+        args = tuple([values[index] for index in self._arg_indices])
+        kwargs = {key: values[index] for key, index in self._kwarg_indices}
+        if self._defaults:
+            kwargs.update(self._defaults)
+        return args, kwargs
+
+
+def compile_params(
+    func: Callable[..., Any],
+    validation_signature: inspect.Signature,
+    tag: str,
+    params: List[TagAttr],
+) -> Optional[CompiledTagParams]:
+    """
+    Prepare the template tag's params for rendering, see `CompiledTagParams`.
+
+    Returns `None` if the params can be validated only once they're resolved, e.g. because
+    they use the spread syntax, or if they don't match the signature. In that case,
+    use `resolve_params()` and `validate_params()` on each render.
+    """
+    keys: Set[str] = set()
+    for param in params:
+        if param.value.spread:
+            return None
+        if param.key is not None:
+            # NOTE: Repeated keys are either an error, or merged in `merge_repeated_kwargs()`
+            if is_aggregate_key(param.key) or param.key in keys:
+                return None
+            keys.add(param.key)
+
+    # Same as in `BaseNode.render()`, we pass kwargs that are not valid Python identifiers
+    # (e.g. `data-id` or `class`) separately from the rest
+    param_refs: List[TagParam] = []
+    invalid_kwarg_refs: Dict[str, Any] = {}
+    for index, param in enumerate(params):
+        if param.key is not None and (not param.key.isidentifier() or keyword.iskeyword(param.key)):
+            invalid_kwarg_refs[param.key] = _ParamRef(index)
+        elif param.key is None and invalid_kwarg_refs:
+            # Positional arg after a special kwarg - Let the error be raised on render
+            return None
+        else:
+            param_refs.append(TagParam(key=param.key, value=_ParamRef(index)))
+
+    try:
+        args, kwargs = validate_params(func, validation_signature, tag, param_refs, invalid_kwarg_refs)
+    except TypeError:
+        # The error is raised on render
+        return None
+
+    # Values that are the defaults of `render()`'s parameters are passed as they are
+    kwarg_indices: List[Tuple[str, int]] = []
+    defaults: Dict[str, Any] = {}
+    for key, value in kwargs.items():
+        if isinstance(value, _ParamRef):
+            kwarg_indices.append((key, value.param_index))
+        else:
+            defaults[key] = value
+
+    literal_values: List[Any] = [None] * len(params)
+    literal_indices: Set[int] = set()
+    for index, param in enumerate(params):
+        # NOTE: Literal lists and dicts are resolved on each render, as they're copied,
+        #       so that changes to them don't carry over to the next render.
+        param.value.compile()
+        if param.value.type == "simple" and param.value.is_literal:
+            literal_values[index] = param.value.resolve(Context())
+            literal_indices.add(index)
+
+    return CompiledTagParams(
+        params=params,
+        literal_values=literal_values,
+        literal_indices=literal_indices,
+        arg_indices=[arg.param_index for arg in args],
+        kwarg_indices=kwarg_indices,
+        defaults=defaults,
+    )
+
+
 # Data obj to give meaning to the parsed tag fields
 class ParsedTag(NamedTuple):
     flags: Dict[str, bool]
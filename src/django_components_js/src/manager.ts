@@ -25,6 +25,12 @@ export type DataFn = () => object;
 
 export type ScriptType = 'js' | 'css';
 
+/** Single `<script>` / `<link>` tag that loads several scripts at once, together with the URLs of those scripts */
+export interface ScriptBundle {
+  tag: string;
+  urls: string[];
+}
+
 /**
  * Usage:
  *
@@ -190,6 +196,26 @@ export const createComponentsManager = () => {
     return urlsSet.has(url);
   };
 
+  /**
+   * Load a bundle of scripts with a single request. If some of the scripts in the bundle were
+   * already loaded, then we load the remaining scripts one by one instead, so no script is run twice.
+   */
+  const loadBundle = (type: ScriptType, bundle: ScriptBundle) => {
+    const toLoadUrls = bundle.urls.filter((url) => !isScriptLoaded(type, url));
+    if (!toLoadUrls.length) return [];
+
+    if (toLoadUrls.length < bundle.urls.length) {
+      return toLoadUrls.map((url) => (
+        type === 'js'
+          ? loadJs(`<script src="${url}"></script>`)
+          : loadCss(`<link href="${url}" media="all" rel="stylesheet">`)
+      ));
+    }
+
+    bundle.urls.forEach((url) => markScriptLoaded(type, url));
+    return [type === 'js' ? loadJs(bundle.tag) : loadCss(bundle.tag)];
+  };
+
   const registerComponent = (name: string, compFn: ComponentFn) => {
     components[name] = compFn;
   };
@@ -234,11 +260,20 @@ export const createComponentsManager = () => {
     loadedJsUrls: string[];
     toLoadCssTags: string[];
     toLoadJsTags: string[];
+    toLoadCssBundles?: ScriptBundle[];
+    toLoadJsBundles?: ScriptBundle[];
   }) => {
+    const decodeBundle = (bundle: ScriptBundle): ScriptBundle => ({
+      tag: atob(bundle.tag),
+      urls: bundle.urls.map((s) => atob(s)),
+    });
+
     const loadedCssUrls = inputs.loadedCssUrls.map((s) => atob(s));
     const loadedJsUrls = inputs.loadedJsUrls.map((s) => atob(s));
     const toLoadCssTags = inputs.toLoadCssTags.map((s) => atob(s));
     const toLoadJsTags = inputs.toLoadJsTags.map((s) => atob(s));
+    const toLoadCssBundles = (inputs.toLoadCssBundles || []).map(decodeBundle);
+    const toLoadJsBundles = (inputs.toLoadJsBundles || []).map(decodeBundle);
 
     // Mark as loaded the CSS that WAS inlined into the HTML.
     loadedCssUrls.forEach((s) => markScriptLoaded("css", s));
@@ -247,14 +282,22 @@ export const createComponentsManager = () => {
     // Load CSS that was not inlined into the HTML
     // NOTE: We don't need to wait for CSS to load
     Promise
-        .all(toLoadCssTags.map((s) => loadCss(s)))
+        .all([
+          ...toLoadCssTags.map((s) => loadCss(s)),
+          ...toLoadCssBundles.flatMap((bundle) => loadBundle('css', bundle)),
+        ])
         .catch(console.error);
 
     // Load JS that was not inlined into the HTML
     const jsScriptsPromise = Promise
         // NOTE: Interestingly enough, when we insert scripts into the DOM programmatically,
         // the order of execution is the same as the order of insertion.
-        .all(toLoadJsTags.map((s) => loadJs(s)))
+        .all([
+          ...toLoadJsTags.map((s) => loadJs(s)),
+          // NOTE: Bundles contain the components' JS, which may depend on the JS from `Media.js`.
+          // So we load the bundles last.
+          ...toLoadJsBundles.flatMap((bundle) => loadBundle('js', bundle)),
+        ])
         .catch(console.error);
   };
 
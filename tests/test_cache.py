@@ -1,10 +1,24 @@
-from django.test import TestCase, override_settings
+import os
+import shutil
+import tempfile
+from threading import Thread
+from typing import List
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.template import Context, Template, TemplateSyntaxError
+from django.test import Client, TestCase, override_settings
 from django.core.cache.backends.locmem import LocMemCache
 
-from django_components.util.cache import LRUCache
-from django_components import Component, register
+from django_components.cache import ComponentMediaCache, get_component_media_cache, get_template_nodelist_cache
+from django_components.component import component_node_subclasses_by_name
+from django_components.node import BaseNode, template_tag
+from django_components.templatetags import component_tags
+from django_components.util.cache import CacheStats, LRUCache
+from django_components import Component, register, registry, render_dependencies
 
 from .django_test_setup import setup_test_config
+from .testutils import BaseTestCase
 
 setup_test_config({"autodiscover": False})
 
@@ -64,6 +78,93 @@ class CacheTests(TestCase):
         self.assertEqual(cache.get("b"), None)
         self.assertEqual(cache.get("c"), None)
 
+    def test_cache_update_existing_key(self):
+        cache = LRUCache[int](maxsize=2)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        # Updating "a" marks it as the most recently used
+        cache.set("a", 3)
+        cache.set("c", 4)
+
+        self.assertEqual(cache.get("a"), 3)
+        self.assertEqual(cache.get("b"), None)
+        self.assertEqual(cache.get("c"), 4)
+
+    def test_cache_stats(self):
+        cache = LRUCache[int](maxsize=2)
+        self.assertEqual(cache.stats(), CacheStats(hits=0, misses=0, evictions=0, size=0, maxsize=2))
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.get("a")
+        cache.get("x")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.stats(), CacheStats(hits=2, misses=1, evictions=1, size=2, maxsize=2))
+
+        cache.clear()
+        self.assertEqual(cache.stats(), CacheStats(hits=0, misses=0, evictions=0, size=0, maxsize=2))
+
+    def test_cache_threads(self):
+        cache = LRUCache[int](maxsize=50)
+
+        def worker(offset: int):
+            for i in range(1000):
+                key = (offset + i) % 100
+                if cache.get(key) is None:
+                    cache.set(key, key)
+
+        threads = [Thread(target=worker, args=(offset,)) for offset in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(cache.stats().size, 50)
+        for key, value in cache.cache.items():
+            self.assertEqual(key, value)
+
+    def test_cache_getsize(self):
+        cache = LRUCache[bytes](maxsize=10, getsize=len)
+
+        cache.set("a", b"1234")
+        cache.set("b", b"5678")
+        self.assertEqual(cache.stats().size, 8)
+
+        # Evicts as many items as needed to fit the new item
+        cache.set("c", b"123456789")
+        self.assertEqual(cache.get("a"), None)
+        self.assertEqual(cache.get("b"), None)
+        self.assertEqual(cache.get("c"), b"123456789")
+        self.assertEqual(cache.stats(), CacheStats(hits=1, misses=2, evictions=2, size=9, maxsize=10))
+
+        # Updating existing key replaces its size
+        cache.set("c", b"12")
+        cache.set("d", b"12345678")
+        self.assertEqual(cache.get("c"), b"12")
+        self.assertEqual(cache.stats().size, 10)
+
+        # Items larger than the cache are not cached
+        cache.set("e", b"12345678901")
+        self.assertEqual(cache.get("e"), None)
+        self.assertEqual(cache.get("d"), b"12345678")
+
+        cache.clear()
+        self.assertEqual(cache.stats().size, 0)
+
+    def test_cache_stats_hit_ratio(self):
+        cache = LRUCache[int](maxsize=2)
+        self.assertEqual(cache.stats().hit_ratio, 0.0)
+
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("a")
+        cache.get("a")
+        cache.get("x")
+        self.assertEqual(cache.stats().hit_ratio, 0.75)
+
 
 class ComponentMediaCacheTests(TestCase):
     def setUp(self):
@@ -160,3 +261,257 @@ class ComponentMediaCacheTests(TestCase):
             self.test_cache.get(f"__components:{TestMediaAndVarsComponent._class_hash}:css:{css_vars_hash}").strip(),
             "",
         )
+
+
+class CountingCache(LocMemCache):
+    """Cache that records the calls, as if it was a remote cache like Redis"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls: List[str] = []
+        self._in_call = False
+
+    def _record(self, name, method, *args, **kwargs):
+        # NOTE: E.g. `set_many()` calls `set()` internally, so we record only the outermost call
+        if self._in_call:
+            return method(*args, **kwargs)
+        self.calls.append(name)
+        self._in_call = True
+        try:
+            return method(*args, **kwargs)
+        finally:
+            self._in_call = False
+
+    def get(self, *args, **kwargs):
+        return self._record("get", super().get, *args, **kwargs)
+
+    def get_many(self, *args, **kwargs):
+        return self._record("get_many", super().get_many, *args, **kwargs)
+
+    def set(self, *args, **kwargs):
+        return self._record("set", super().set, *args, **kwargs)
+
+    def set_many(self, *args, **kwargs):
+        return self._record("set_many", super().set_many, *args, **kwargs)
+
+    def has_key(self, *args, **kwargs):
+        return self._record("has_key", super().has_key, *args, **kwargs)
+
+
+@override_settings(COMPONENTS={"cache": "counting-cache"})
+class ComponentMediaCacheBatchingTests(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.counting_cache = CountingCache("counting-cache", {})
+        caches["counting-cache"] = self.counting_cache
+
+        # Use a fresh media cache in each test, so that `COMPONENTS.cache` is applied
+        patcher = patch("django_components.cache.component_media_cache", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _gen_components(self):
+        components = []
+        for index in range(3):
+            # NOTE: Component's hash is derived from its name, so each class must have a different name
+            comp_cls = type(
+                f"BatchComponent{index}",
+                (Component,),
+                {
+                    "template": "<div>{{ index }}</div>",
+                    "js": f"console.log({index});",
+                    "css": f".item-{index} {{ color: red; }}",
+                    "get_context_data": lambda self, index: {"index": index},
+                    "get_js_data": lambda self, index: {"index": index},
+                },
+            )
+            components.append(comp_cls)
+        return components
+
+    def test_scripts_set_once_per_render(self):
+        components = self._gen_components()
+
+        for index, comp_cls in enumerate(components):
+            comp_cls.render(kwargs={"index": index}, render_dependencies=False)
+        # JS, CSS, and JS variables of each component are set in a single call
+        self.assertEqual(self.counting_cache.calls, ["set_many", "set_many", "set_many"])
+
+        # Rendering again doesn't reach the cache at all
+        self.counting_cache.calls.clear()
+        for index, comp_cls in enumerate(components):
+            comp_cls.render(kwargs={"index": index}, render_dependencies=False)
+        self.assertEqual(self.counting_cache.calls, [])
+
+        self.assertEqual(
+            self.counting_cache.get(f"__components:{components[0]._class_hash}:js"),
+            "console.log(0);",
+        )
+
+    def test_scripts_fetched_with_single_call(self):
+        components = self._gen_components()
+        content = "".join(
+            comp_cls.render(kwargs={"index": index}, render_dependencies=False)
+            for index, comp_cls in enumerate(components)
+        )
+        content = f"<html><head></head><body>{content}</body></html>"
+
+        # Scripts that were cached in this process are not fetched from the cache
+        self.counting_cache.calls.clear()
+        rendered = render_dependencies(content)
+        self.assertEqual(self.counting_cache.calls, [])
+
+        # Otherwise, all scripts are fetched with a single call
+        get_component_media_cache().local.clear()
+        self.assertEqual(render_dependencies(content), rendered)
+        self.assertEqual(self.counting_cache.calls, ["get_many"])
+        self.assertInHTML("<script>console.log(2);</script>", rendered)
+
+
+class ComponentMediaTieredCacheTests(BaseTestCase):
+    def test_local_only(self):
+        cache = ComponentMediaCache(max_size=10)
+
+        cache.set_many({"a": "1234", "b": b"5678"})
+        self.assertEqual(cache.get_many(["a", "b", "x"]), {"a": b"1234", "b": b"5678"})
+
+        cache.set_many({"c": "123456"})
+        self.assertEqual(cache.get("a"), None)
+        self.assertTrue(cache.has_local("c"))
+
+        stats = cache.stats()
+        self.assertEqual(stats.local.size, 10)
+        self.assertEqual(stats.local.evictions, 1)
+        self.assertEqual(stats.remote_hits, 0)
+        self.assertEqual(stats.remote_misses, 2)
+
+    def test_write_through_to_remote(self):
+        remote = LocMemCache("test-remote", {})
+        cache = ComponentMediaCache(max_size=10, remote=remote)
+
+        cache.set_many({"a": "1234", "b": b"5678"})
+        # Strings are stored in the remote cache as they are
+        self.assertEqual(remote.get("a"), "1234")
+        self.assertEqual(remote.get("b"), b"5678")
+
+        # Evicted entries are fetched from the remote cache again
+        cache.set_many({"c": "123456"})
+        self.assertFalse(cache.has_local("a"))
+        self.assertEqual(cache.get_many(["a", "x"]), {"a": b"1234"})
+        self.assertTrue(cache.has_local("a"))
+
+        stats = cache.stats()
+        self.assertEqual(stats.remote_hits, 1)
+        self.assertEqual(stats.remote_misses, 1)
+
+        cache.clear()
+        self.assertEqual(remote.get("c"), None)
+        self.assertEqual(cache.stats().local.size, 0)
+
+    @override_settings(COMPONENTS={"cache_local_max_size": 10})
+    @patch("django_components.cache.component_media_cache", None)
+    def test_default_cache_keeps_evicted_scripts(self):
+        cache = get_component_media_cache()
+        self.assertIsInstance(cache.remote, LocMemCache)
+
+        # E.g. JS / CSS variables, which can't be generated again
+        cache.set_many({f"vars-{index}": "12345678" for index in range(400)})
+        self.assertFalse(cache.has_local("vars-0"))
+        self.assertEqual(cache.get("vars-0"), b"12345678")
+
+    @override_settings(COMPONENTS={"cache_local_max_size": 100})
+    @patch("django_components.cache.component_media_cache", None)
+    def test_evicted_component_scripts(self):
+        class EvictedComponent(Component):
+            template = "<html><head></head><body><div>Hello</div></body></html>"
+            js = "console.log('evicted');"
+            css = ".evicted { color: red; }"
+
+        EvictedComponent.render()
+        cache = get_component_media_cache()
+        self.assertEqual(cache.stats().local.maxsize, 100)
+
+        # Fill the cache with other scripts, so the component's scripts are evicted
+        cache.set_many({f"other-{index}": "x" * 50 for index in range(3)})
+        self.assertFalse(cache.has_local(f"__components:{EvictedComponent._class_hash}:js"))
+
+        # Component's own JS and CSS are cached again when needed
+        rendered = EvictedComponent.render()
+        self.assertInHTML("<script>console.log('evicted');</script>", rendered)
+        response = Client().get(f"/components/cache/{EvictedComponent._class_hash}.css")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b".evicted { color: red; }")
+
+
+class TemplateNodelistCacheTests(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        super().tearDown()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(get_template_nodelist_cache())
+
+    def test_nodelist_cached_on_disk(self):
+        @register("inner")
+        class Inner(Component):
+            template = "<b>{{ value }} {{ label }}</b>{% slot 'content' default %}{% endslot %}"
+
+            def get_context_data(self, value, label):
+                return {"value": value, "label": label}
+
+        template_str = """
+            {% load component_tags %}
+            {% if value >= 100 and value != 200 %}
+                {% component "inner" value=value|add:1 label="{% lorem 1 w %}" %}
+                    Slot: {{ value }}
+                {% endcomponent %}
+            {% endif %}
+        """
+
+        with override_settings(COMPONENTS={"template_cache_dir": self.cache_dir}):
+            rendered1 = Template(template_str).render(Context({"value": 123}))
+            entries = os.listdir(self.cache_dir)
+
+            # E.g. in a new process, the nodes are loaded from the disk
+            component_node_subclasses_by_name.clear()
+            with patch("django_components.util.django_monkeypatch.parse_template") as parse_template_mock:
+                rendered2 = Template(template_str).render(Context({"value": 123}))
+                parse_template_mock.assert_not_called()
+
+        self.assertIn('<b data-djc-id-a1bc3f="">124 lorem</b>', rendered1)
+        self.assertIn("Slot: 124", rendered1)
+        self.assertEqual(rendered1.replace("a1bc3f", "a1bc41"), rendered2)
+        self.assertEqual(os.listdir(self.cache_dir), entries)
+
+    def test_unpicklable_nodes_not_cached(self):
+        @template_tag(component_tags.register, tag="mytag")
+        def render(node: BaseNode, context: Context) -> str:
+            return "Hello"
+
+        with override_settings(COMPONENTS={"template_cache_dir": self.cache_dir}):
+            template = Template("{% load component_tags %}{% mytag / %}")
+
+        # The node class created by `template_tag()` can't be pickled
+        self.assertEqual(template.render(Context({})), "Hello")
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+        render._node.unregister(component_tags.register)  # type: ignore[attr-defined]
+
+    def test_unregistered_component_parsed_again(self):
+        @register("inner")
+        class Inner(Component):
+            template = "Inner"
+
+        template_str = """{% load component_tags %}{% component "inner" / %}"""
+
+        with override_settings(COMPONENTS={"template_cache_dir": self.cache_dir}):
+            Template(template_str)
+            registry.unregister("inner")
+
+            # The stored nodes can't be used, so the template is parsed, and raises the same error
+            # as without the cache
+            with self.assertRaisesMessage(TemplateSyntaxError, "Invalid block tag on line 1: 'component'"):
+                Template(template_str)
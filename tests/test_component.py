@@ -3,6 +3,7 @@ Tests focusing on the Component class.
 For tests focusing on the `component` tag, see `test_templatetags_component.py`
 """
 
+import asyncio
 import re
 import sys
 from typing import Any, Dict, List, Tuple, Union, no_type_check
@@ -25,6 +26,7 @@ from django.urls import path
 from django.utils.safestring import SafeString
 
 from django_components import Component, ComponentView, Slot, SlotFunc, register, registry, types
+from django_components.perfutil.render_session import get_render_session, get_render_session_stats, render_session_var
 from django_components.slots import SlotRef
 from django_components.urls import urlpatterns as dc_urlpatterns
 
@@ -1229,6 +1231,33 @@ class ComponentRenderTest(BaseTestCase):
             "Variable: <strong data-djc-id-a1bc3e>a1bc3e</strong>",
         )
 
+    def test_render_nested_in_html_comments_and_attributes(self):
+        @register("inner")
+        class InnerComponent(Component):
+            template: types.django_html = """
+                <span>{{ text }}</span>
+            """
+
+            def get_context_data(self, text):
+                return {"text": text}
+
+        class OuterComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <div>
+                    <!-- {% component "inner" text="commented" / %} -->
+                    {% component "inner" text="first" / %}{% component "inner" text="second" / %}
+                    <p title='djc-render-id="abcdef"'>{% component "inner" text="third" / %}</p>
+                </div>
+            """
+
+        rendered = OuterComponent.render(render_dependencies=False)
+        self.assertNotIn("djc-render-id", rendered.replace('djc-render-id="abcdef"', ""))
+        self.assertIn('<span data-djc-id-a1bc43="">commented</span>', rendered)
+        self.assertInHTML("<span data-djc-id-a1bc44>first</span>", rendered)
+        self.assertInHTML("<span data-djc-id-a1bc45>second</span>", rendered)
+        self.assertInHTML("<span data-djc-id-a1bc46>third</span>", rendered)
+
     @parametrize_context_behavior(["django", "isolated"])
     def test_render_to_response_can_access_instance(self):
         class TestComponent(Component):
@@ -1246,6 +1275,447 @@ class ComponentRenderTest(BaseTestCase):
         )
 
 
+class ComponentRenderStreamTest(BaseTestCase):
+    @parametrize_context_behavior(["django", "isolated"])
+    def test_render_to_stream_same_as_render(self):
+        @register("nested")
+        class NestedComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <div>
+                    {% slot "content" default / %}
+                </div>
+            """
+
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <main>
+                    {% component "nested" %}
+                        Hello from {{ name }}
+                    {% endcomponent %}
+                </main>
+            """
+
+            def get_context_data(self, name):
+                return {"name": name}
+
+        chunks = list(SimpleComponent.render_to_stream(kwargs={"name": "John"}, render_dependencies=False))
+
+        self.assertGreater(len(chunks), 1)
+        self.assertHTMLEqual(
+            "".join(chunks),
+            """
+            <main data-djc-id-a1bc3e>
+                <div data-djc-id-a1bc40>
+                    Hello from John
+                </div>
+            </main>
+            """,
+        )
+
+    def test_render_to_stream_yields_before_children_rendered(self):
+        rendered_components: List[str] = []
+
+        @register("nested")
+        class NestedComponent(Component):
+            template: types.django_html = "<div>{{ name }}</div>"
+
+            def get_context_data(self, name):
+                return {"name": name}
+
+            def on_render_before(self, context, template):
+                rendered_components.append(context["name"])
+
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <head>HEAD</head>
+                {% component "nested" name="one" / %}
+                {% component "nested" name="two" / %}
+            """
+
+        chunks = SimpleComponent.render_to_stream(render_dependencies=False)
+        self.assertEqual(rendered_components, [])
+
+        first_chunk = next(chunks)
+        self.assertIn(">HEAD</head>", first_chunk)
+        self.assertEqual(rendered_components, [])
+
+        rest = "".join(chunks)
+        self.assertEqual(rendered_components, ["one", "two"])
+        self.assertIn('="">one</div>', rest)
+        self.assertIn('="">two</div>', rest)
+
+    def test_render_to_stream_on_render_after(self):
+        @register("nested")
+        class NestedComponent(Component):
+            template: types.django_html = "<div>NESTED</div>"
+
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <main>{% component "nested" / %}</main>
+            """
+
+            def on_render_after(self, context, template, content):
+                return content.upper()
+
+        chunks = list(SimpleComponent.render_to_stream(render_dependencies=False))
+
+        # The whole component is sent in a single chunk, because `on_render_after`
+        # may modify the HTML
+        self.assertEqual(len(chunks), 1)
+        self.assertHTMLEqual(
+            chunks[0],
+            """
+            <MAIN DATA-DJC-ID-A1BC3E><DIV DATA-DJC-ID-A1BC40>NESTED</DIV></MAIN>
+            """,
+        )
+
+    def test_render_to_stream_dependencies(self):
+        @register("nested")
+        class NestedComponent(Component):
+            template: types.django_html = "<div>NESTED</div>"
+            js = "console.log('nested');"
+            css = ".nested { color: red; }"
+
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <html>
+                    <head>{% component_css_dependencies %}</head>
+                    <body>
+                        {% component "nested" / %}
+                        {% component_js_dependencies %}
+                    </body>
+                </html>
+            """
+
+        chunks = list(SimpleComponent.render_to_stream())
+        rendered = "".join(chunks[:-1])
+
+        self.assertNotIn("_RENDERED", rendered)
+        self.assertNotIn("CSS_PLACEHOLDER", rendered)
+        self.assertNotIn("JS_PLACEHOLDER", rendered)
+        self.assertIn('="">NESTED</div>', rendered)
+
+        # JS and CSS are sent in the last chunk
+        self.assertIn("<style>.nested { color: red; }</style>", chunks[-1])
+        self.assertIn("<script>console.log('nested');</script>", chunks[-1])
+        self.assertIn("django_components/django_components.min.js", chunks[-1])
+
+    def test_render_to_stream_prepends_exceptions_with_component_path(self):
+        @register("broken")
+        class Broken(Component):
+            template: types.django_html = "{{ data.nonexistent }}"
+
+            def get_context_data(self):
+                return {"data": {}}
+
+            def on_render_before(self, context, template):
+                raise ValueError("Oops")
+
+        class Root(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                {% component "broken" / %}
+            """
+
+        chunks = Root.render_to_stream(render_dependencies=False)
+
+        with self.assertRaisesMessage(
+            ValueError,
+            "An error occured while rendering components Root > broken:\nOops",
+        ):
+            list(chunks)
+
+
+class ComponentAsyncRenderTest(BaseTestCase):
+    async def test_arender_same_as_render(self):
+        @register("nested")
+        class NestedComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <div>
+                    {% slot "content" default / %}
+                </div>
+            """
+
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <main>
+                    {% component "nested" %}
+                        Hello from {{ name }}
+                    {% endcomponent %}
+                </main>
+            """
+
+            def get_context_data(self, name):
+                return {"name": name}
+
+        rendered = await SimpleComponent.arender(kwargs={"name": "John"}, render_dependencies=False)
+        self.assertHTMLEqual(
+            rendered,
+            """
+            <main data-djc-id-a1bc3e>
+                <div data-djc-id-a1bc40>
+                    Hello from John
+                </div>
+            </main>
+            """,
+        )
+
+    async def test_arender_async_get_context_data(self):
+        @register("user")
+        class UserComponent(Component):
+            template: types.django_html = """
+                <li>{{ name }} ({{ component_id }})</li>
+            """
+
+            async def get_context_data(self, user_id):
+                await asyncio.sleep(0)
+                return {"name": f"User {user_id}", "component_id": self.id}
+
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <ul>
+                    {% for user_id in user_ids %}
+                        {% component "user" user_id=user_id / %}
+                    {% endfor %}
+                </ul>
+            """
+
+            async def get_context_data(self):
+                return {"user_ids": [1, 2]}
+
+        rendered = await SimpleComponent.arender(render_dependencies=False)
+        self.assertHTMLEqual(
+            rendered,
+            """
+            <ul data-djc-id-a1bc3e>
+                <li data-djc-id-a1bc40>User 1 (a1bc40)</li>
+                <li data-djc-id-a1bc41>User 2 (a1bc41)</li>
+            </ul>
+            """,
+        )
+
+    async def test_arender_loads_siblings_concurrently(self):
+        loading: List[int] = []
+        max_loading: List[int] = [0]
+
+        @register("user")
+        class UserComponent(Component):
+            template: types.django_html = """
+                <li>{{ user_id }}</li>
+            """
+
+            async def get_context_data(self, user_id):
+                loading.append(user_id)
+                max_loading[0] = max(max_loading[0], len(loading))
+                await asyncio.sleep(0.01)
+                loading.remove(user_id)
+                return {"user_id": user_id}
+
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <ul>
+                    {% component "user" user_id=1 / %}
+                    {% component "user" user_id=2 / %}
+                    {% component "user" user_id=3 / %}
+                </ul>
+            """
+
+        rendered = await SimpleComponent.arender(render_dependencies=False)
+        self.assertEqual(max_loading[0], 3)
+        self.assertHTMLEqual(
+            rendered,
+            """
+            <ul data-djc-id-a1bc3e>
+                <li data-djc-id-a1bc42>1</li>
+                <li data-djc-id-a1bc43>2</li>
+                <li data-djc-id-a1bc44>3</li>
+            </ul>
+            """,
+        )
+
+    async def test_arender_async_get_context_data_with_inject(self):
+        @register("injectee")
+        class InjectComponent(Component):
+            template: types.django_html = """
+                <div>{{ key }}</div>
+            """
+
+            async def get_context_data(self):
+                await asyncio.sleep(0)
+                return {"key": self.inject("my_provide").key}
+
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                {% provide "my_provide" key="hi" %}
+                    {% component "injectee" / %}
+                {% endprovide %}
+                {% component "injectee" / %}
+            """
+
+        with self.assertRaisesMessage(KeyError, "Component 'injectee' tried to inject a variable 'my_provide'"):
+            await SimpleComponent.arender(render_dependencies=False)
+
+        class SimpleComponent2(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                {% provide "my_provide" key="hi" %}
+                    {% component "injectee" / %}
+                {% endprovide %}
+            """
+
+        rendered = await SimpleComponent2.arender(render_dependencies=False)
+        self.assertInHTML("<div data-djc-id-a1bc45 data-djc-id-a1bc49>hi</div>", rendered)
+
+    def test_render_async_get_context_data(self):
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                Variable: <strong>{{ variable }}</strong>
+            """
+
+            async def get_context_data(self, variable):
+                await asyncio.sleep(0)
+                return {"variable": variable}
+
+        rendered = SimpleComponent.render(kwargs={"variable": "test"}, render_dependencies=False)
+        self.assertHTMLEqual(rendered, "Variable: <strong data-djc-id-a1bc3e>test</strong>")
+
+    async def test_arender_to_response(self):
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                Variable: <strong>{{ variable }}</strong>
+            """
+
+            async def get_context_data(self, variable):
+                return {"variable": variable}
+
+        response = await SimpleComponent.arender_to_response(kwargs={"variable": "test"}, status=201)
+        self.assertIsInstance(response, HttpResponse)
+        self.assertEqual(response.status_code, 201)
+        self.assertInHTML("<strong data-djc-id-a1bc3e>test</strong>", response.content.decode())
+
+    async def test_arender_prepends_exceptions_with_component_path(self):
+        @register("broken")
+        class Broken(Component):
+            template: types.django_html = """
+                <div>Hello</div>
+            """
+
+            async def get_context_data(self):
+                raise ValueError("Oops")
+
+        class Root(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                {% component "broken" / %}
+            """
+
+        with self.assertRaisesMessage(ValueError, "An error occured while rendering components Root > broken:\nOops"):
+            await Root.arender()
+
+
+class ComponentRenderSessionTest(BaseTestCase):
+    def _define_components(self, on_render_before=None):
+        @register("nested")
+        class NestedComponent(Component):
+            template: types.django_html = """
+                <div>{{ sessions_match }}</div>
+            """
+
+            def get_context_data(self):
+                return {"sessions_match": get_render_session() is root_session[0]}
+
+            def on_render_before(self, context, template):
+                if on_render_before:
+                    on_render_before()
+
+        root_session = []
+
+        class Root(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                {% component "nested" / %}
+                {% component "nested" / %}
+            """
+
+            def get_context_data(self):
+                root_session.append(get_render_session())
+                return {}
+
+        return Root
+
+    def test_session_released_after_render(self):
+        Root = self._define_components()
+        stats_before = get_render_session_stats()
+
+        rendered = Root.render(render_dependencies=False)
+
+        self.assertHTMLEqual(
+            rendered,
+            """
+            <div data-djc-id-a1bc3e data-djc-id-a1bc41>True</div>
+            <div data-djc-id-a1bc3e data-djc-id-a1bc42>True</div>
+            """,
+        )
+        self.assertIsNone(render_session_var.get())
+
+        stats_after = get_render_session_stats()
+        self.assertEqual(stats_after.sessions, stats_before.sessions + 1)
+        self.assertEqual(stats_after.failed_sessions, stats_before.failed_sessions)
+        self.assertEqual(stats_after.leaked_entries, stats_before.leaked_entries)
+
+    def test_session_released_after_error(self):
+        def raise_error():
+            raise ValueError("Oops")
+
+        Root = self._define_components(on_render_before=raise_error)
+        stats_before = get_render_session_stats()
+
+        with self.assertRaisesMessage(ValueError, "Oops"):
+            Root.render()
+
+        self.assertIsNone(render_session_var.get())
+
+        # The entries of the components that didn't finish rendering are released with the session
+        stats_after = get_render_session_stats()
+        self.assertEqual(stats_after.sessions, stats_before.sessions + 1)
+        self.assertEqual(stats_after.failed_sessions, stats_before.failed_sessions + 1)
+        self.assertGreater(
+            stats_after.leaked_entries["component_context_cache"],
+            stats_before.leaked_entries.get("component_context_cache", 0),
+        )
+
+    def test_session_released_after_stream_consumed(self):
+        Root = self._define_components()
+        stats_before = get_render_session_stats()
+
+        chunks = Root.render_to_stream(render_dependencies=False)
+        self.assertIsNone(render_session_var.get())
+        self.assertEqual(get_render_session_stats().sessions, stats_before.sessions)
+
+        rendered = "".join(chunks)
+
+        self.assertIn(">True</div>", rendered)
+        self.assertNotIn(">False</div>", rendered)
+        self.assertIsNone(render_session_var.get())
+        stats_after = get_render_session_stats()
+        self.assertEqual(stats_after.sessions, stats_before.sessions + 1)
+        self.assertEqual(stats_after.leaked_entries, stats_before.leaked_entries)
+
+    def test_get_render_session_outside_render_raises(self):
+        with self.assertRaisesMessage(RuntimeError, "No render session is active"):
+            get_render_session()
+
+
 class ComponentHookTest(BaseTestCase):
     def test_on_render_before(self):
         @register("nested")
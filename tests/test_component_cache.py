@@ -0,0 +1,397 @@
+from django.core.cache import caches
+from django.template import Context, Template
+from django.test import override_settings
+
+from django_components import Component, ComponentCache, register, registry, types
+from django_components.cache import get_component_media_cache
+
+from .django_test_setup import setup_test_config
+from .testutils import BaseTestCase
+
+setup_test_config({"autodiscover": False})
+
+
+class ComponentCacheTest(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        caches["default"].clear()
+
+    def test_cache_disabled_by_default(self):
+        calls = []
+
+        class TestComponent(Component):
+            template = "<div>{{ value }}</div>"
+
+            def get_context_data(self, value):
+                calls.append(value)
+                return {"value": value}
+
+        TestComponent.render(kwargs={"value": 1})
+        TestComponent.render(kwargs={"value": 1})
+
+        self.assertEqual(calls, [1, 1])
+
+    def test_cache_same_input(self):
+        calls = []
+
+        class TestComponent(Component):
+            template = "<div>{{ value }}</div>"
+
+            class Cache(ComponentCache):
+                enabled = True
+
+            def get_context_data(self, value):
+                calls.append(value)
+                return {"value": value}
+
+        rendered1 = TestComponent.render(kwargs={"value": 1}, render_dependencies=False)
+        rendered2 = TestComponent.render(kwargs={"value": 1}, render_dependencies=False)
+        rendered3 = TestComponent.render(kwargs={"value": 2}, render_dependencies=False)
+
+        self.assertEqual(calls, [1, 2])
+        self.assertHTMLEqual(rendered1, "<div data-djc-id-a1bc3e>1</div>")
+        # Cached HTML gets a new render ID
+        self.assertHTMLEqual(rendered2, "<div data-djc-id-a1bc3f>1</div>")
+        self.assertHTMLEqual(rendered3, "<div data-djc-id-a1bc40>2</div>")
+
+    def test_cache_skipped_for_non_primitive_input(self):
+        calls = []
+
+        # Objects with the same repr, like `<User: john>` for users with different pks
+        class User:
+            def __init__(self, pk):
+                self.pk = pk
+
+            def __repr__(self):
+                return "<User: john>"
+
+        class TestComponent(Component):
+            template = "<div>{{ user.pk }}</div>"
+
+            class Cache(ComponentCache):
+                enabled = True
+
+            def get_context_data(self, user):
+                calls.append(user.pk)
+                return {"user": user}
+
+        rendered1 = TestComponent.render(kwargs={"user": User(1)}, render_dependencies=False)
+        rendered2 = TestComponent.render(kwargs={"user": User(2)}, render_dependencies=False)
+
+        self.assertEqual(calls, [1, 2])
+        self.assertHTMLEqual(rendered1, "<div data-djc-id-a1bc3e>1</div>")
+        self.assertHTMLEqual(rendered2, "<div data-djc-id-a1bc3f>2</div>")
+        self.assertIsNone(TestComponent.Cache(TestComponent()).hash((), {"user": User(1)}, {}))
+
+    def test_cache_primitive_input(self):
+        calls = []
+
+        class TestComponent(Component):
+            template = "<div>{{ items|length }}</div>"
+
+            class Cache(ComponentCache):
+                enabled = True
+
+            def get_context_data(self, items, options):
+                calls.append(items)
+                return {"items": items}
+
+        TestComponent.render(kwargs={"items": [1, "a", None], "options": {"b": 1.5, "a": True}})
+        TestComponent.render(kwargs={"options": {"a": True, "b": 1.5}, "items": [1, "a", None]})
+        TestComponent.render(kwargs={"items": [1, "a", None], "options": {"a": 1, "b": 1.5}})
+
+        # `True` and `1` are different inputs
+        self.assertEqual(len(calls), 2)
+
+    def test_cache_key_depends_on_code(self):
+        class TestComponent(Component):
+            template = "<div>{{ value }}</div>"
+
+            class Cache(ComponentCache):
+                enabled = True
+
+            def get_context_data(self, value):
+                return {"value": value}
+
+        rendered1 = TestComponent.render(kwargs={"value": 1}, render_dependencies=False)
+        self.assertHTMLEqual(rendered1, "<div data-djc-id-a1bc3e>1</div>")
+
+        # E.g. the template changed in a new deploy, but the cache was kept
+        TestComponent.template = "<span>{{ value }}</span>"
+        rendered2 = TestComponent.render(kwargs={"value": 1}, render_dependencies=False)
+        self.assertHTMLEqual(rendered2, "<span data-djc-id-a1bc3f>1</span>")
+
+        TestComponent.Cache.version = "2"
+        key1 = TestComponent.Cache(TestComponent()).get_cache_key((), {"value": 1}, {})
+        self.assertIsNone(caches["default"].get(key1))
+
+        TestComponent.Cache.version = "3"
+        key2 = TestComponent.Cache(TestComponent()).get_cache_key((), {"value": 1}, {})
+        self.assertNotEqual(key1, key2)
+
+    def test_cache_nested_components(self):
+        calls = []
+
+        @register("inner")
+        class Inner(Component):
+            template = "<span>{{ value }}</span>"
+
+            def get_context_data(self, value):
+                calls.append(value)
+                return {"value": value}
+
+        @register("cached")
+        class Cached(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                {% component "inner" value=value / %}
+                <b>{{ value }}</b>
+            """
+
+            class Cache(ComponentCache):
+                enabled = True
+
+            def get_context_data(self, value):
+                calls.append(f"cached-{value}")
+                return {"value": value}
+
+        template = Template("""
+            {% load component_tags %}
+            <main>
+                {% component "cached" value=1 / %}
+            </main>
+            {% component "cached" value=1 / %}
+            """)
+        rendered = template.render(Context({}))
+
+        self.assertEqual(calls, ["cached-1", 1])
+        self.assertHTMLEqual(
+            rendered,
+            """
+            <main>
+                <span data-djc-id-a1bc40 data-djc-id-a1bc42>1</span>
+                <b data-djc-id-a1bc40>1</b>
+            </main>
+            <span data-djc-id-a1bc43 data-djc-id-a1bc44>1</span>
+            <b data-djc-id-a1bc43>1</b>
+            """,
+        )
+
+    def test_cache_applies_parent_attributes(self):
+        @register("cached")
+        class Cached(Component):
+            template = "<div>{{ value }}</div>"
+
+            class Cache(ComponentCache):
+                enabled = True
+
+            def get_context_data(self, value):
+                return {"value": value}
+
+        class Parent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                {% component "cached" value=1 / %}
+            """
+
+        rendered1 = Parent.render(render_dependencies=False)
+        rendered2 = Parent.render(render_dependencies=False)
+
+        self.assertHTMLEqual(rendered1, "<div data-djc-id-a1bc3e data-djc-id-a1bc40>1</div>")
+        self.assertHTMLEqual(rendered2, "<div data-djc-id-a1bc41 data-djc-id-a1bc42>1</div>")
+
+    def test_cache_renders_dependencies(self):
+        class TestComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <html>
+                    <head>{% component_css_dependencies %}</head>
+                    <body>{{ value }}{% component_js_dependencies %}</body>
+                </html>
+            """
+            css = ".my-class { color: red; }"
+            js = "console.log('hello');"
+
+            class Cache(ComponentCache):
+                enabled = True
+
+            def get_context_data(self, value):
+                return {"value": value}
+
+        TestComponent.render(kwargs={"value": 1})
+        get_component_media_cache().clear()
+        rendered = TestComponent.render(kwargs={"value": 1})
+
+        self.assertInHTML("<style>.my-class { color: red; }</style>", rendered)
+        self.assertInHTML("<script>console.log('hello');</script>", rendered)
+        self.assertNotIn("_RENDERED", rendered)
+
+    def test_cache_nested_renders_dependencies(self):
+        class ChildComponent(Component):
+            template = "<div>{{ value }}</div>"
+            css = ".my-class { color: red; }"
+
+            class Cache(ComponentCache):
+                enabled = True
+
+            def get_context_data(self, value):
+                return {"value": value}
+
+        class ParentComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <html>
+                    <head></head>
+                    <body>{% component "child" value=1 / %}</body>
+                </html>
+            """
+
+        registry.register(name="child", component=ChildComponent)
+
+        # On the second render, the child's HTML is taken from the cache
+        rendered1 = ParentComponent.render()
+        rendered2 = ParentComponent.render()
+
+        self.assertInHTML("<style>.my-class { color: red; }</style>", rendered1)
+        self.assertInHTML("<style>.my-class { color: red; }</style>", rendered2)
+        self.assertNotIn("_RENDERED", rendered2)
+
+    def test_cache_contains_dependencies_announced_outside(self):
+        class ChildComponent(Component):
+            template = "<span>child</span>"
+            css = ".child { color: red; }"
+
+        class CachedComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <div>{% component "child" / %}</div>
+            """
+
+            class Cache(ComponentCache):
+                enabled = True
+
+        registry.register(name="child", component=ChildComponent)
+        registry.register(name="cached", component=CachedComponent)
+
+        # The child is rendered before the cached component, but the cached HTML
+        # must still contain the child's dependencies
+        class ParentComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <div>
+                    {% component "child" / %}
+                    {% component "cached" / %}
+                </div>
+            """
+
+        ParentComponent.render(render_dependencies=False)
+
+        class OtherParentComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <html>
+                    <head></head>
+                    <body>{% component "cached" / %}</body>
+                </html>
+            """
+
+        rendered = OtherParentComponent.render()
+        self.assertInHTML("<style>.child { color: red; }</style>", rendered)
+
+    def test_cache_on_render_after(self):
+        class TestComponent(Component):
+            template = "<div>{{ value }}</div>"
+
+            class Cache(ComponentCache):
+                enabled = True
+
+            def get_context_data(self, value):
+                return {"value": value}
+
+            def on_render_after(self, context, template, content):
+                return content + "<p>after</p>"
+
+        rendered1 = TestComponent.render(kwargs={"value": 1}, render_dependencies=False)
+        rendered2 = TestComponent.render(kwargs={"value": 1}, render_dependencies=False)
+
+        self.assertHTMLEqual(rendered1, "<div data-djc-id-a1bc3e>1</div><p>after</p>")
+        self.assertHTMLEqual(rendered2, "<div data-djc-id-a1bc3f>1</div><p>after</p>")
+
+    def test_cache_slots(self):
+        calls = []
+
+        class TestComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <div>{% slot "content" default / %}</div>
+            """
+
+            class Cache(ComponentCache):
+                enabled = True
+
+            def get_context_data(self):
+                calls.append(1)
+                return {}
+
+        # String slots are part of the cache key
+        TestComponent.render(slots={"content": "hello"})
+        TestComponent.render(slots={"content": "hello"})
+        TestComponent.render(slots={"content": "world"})
+        self.assertEqual(len(calls), 2)
+
+        # Slot functions are not cached
+        TestComponent.render(slots={"content": lambda *a: "hello"})
+        TestComponent.render(slots={"content": lambda *a: "hello"})
+        self.assertEqual(len(calls), 4)
+
+    def test_cache_custom_hash(self):
+        calls = []
+
+        class TestComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <div>{% slot "content" default / %}</div>
+            """
+
+            class Cache(ComponentCache):
+                enabled = True
+
+                def hash(self, args, kwargs, slots):
+                    return self.component.input.context["lang"]
+
+            def get_context_data(self):
+                calls.append(1)
+                return {}
+
+        rendered1 = TestComponent.render(slots={"content": lambda *a: "hello"}, context={"lang": "en"})
+        rendered2 = TestComponent.render(slots={"content": lambda *a: "hola"}, context={"lang": "en"})
+        TestComponent.render(slots={"content": lambda *a: "hola"}, context={"lang": "es"})
+
+        self.assertEqual(len(calls), 2)
+        self.assertIn("hello", rendered1)
+        self.assertIn("hello", rendered2)
+
+    @override_settings(
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "components": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "components"},
+        }
+    )
+    def test_cache_name_and_ttl(self):
+        class TestComponent(Component):
+            template = "<div>{{ value }}</div>"
+
+            class Cache(ComponentCache):
+                enabled = True
+                cache_name = "components"
+                ttl = 60
+
+            def get_context_data(self, value):
+                return {"value": value}
+
+        TestComponent.render(kwargs={"value": 1})
+
+        cache_key = TestComponent.Cache(TestComponent()).get_cache_key((), {"value": 1}, {})
+        self.assertIsNotNone(caches["components"].get(cache_key))
+        self.assertIsNone(caches["default"].get(cache_key))
+        self.assertIn(caches["components"].make_key(cache_key), caches["components"]._expire_info)
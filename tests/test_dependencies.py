@@ -5,15 +5,33 @@ if calling `Component.render()` or `render_dependencies()` behave as expected.
 For checking the OUTPUT of the dependencies, see `test_dependency_rendering.py`.
 """
 
+import base64
+import gzip
+import io
+import json
 import re
-from unittest.mock import Mock
+from types import ModuleType
+from typing import List, Tuple, Type
+from unittest.mock import Mock, patch
 
-from django.http import HttpResponseNotModified
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
 from django.template import Context, Template
+from django.test import Client, override_settings
+from django.urls import include, path, reverse, set_script_prefix, set_urlconf
 
 from django_components import Component, registry, render_dependencies, types
+from django_components.cache import get_component_media_cache
 from django_components.components.dynamic import DynamicComponent
+from django_components.dependencies import (
+    _gen_dependency_manifest,
+    content_hashes,
+    get_bundle_url,
+    get_dependency_manifest,
+    get_script_content,
+    get_script_url,
+)
 from django_components.middleware import ComponentDependencyMiddleware
+from django_components.perfutil.render_session import get_render_session_stats
 
 from .django_test_setup import setup_test_config
 from .testutils import BaseTestCase, create_and_process_template_response
@@ -163,6 +181,90 @@ class RenderDependenciesTests(BaseTestCase):
             count=0,
         )  # Inlined JS
 
+    def test_component_render_records_dependencies_outside_of_html(self):
+        class TestComponent(SimpleComponent):
+            pass
+
+        class OtherComponent(Component):
+            template = "<span>other</span>"
+            css = ".other { color: blue; }"
+
+        class ParentComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <html>
+                    <head></head>
+                    <body>
+                        {% component "test" variable="foo" / %}
+                        {% component "test" variable="bar" / %}
+                        {% component "other" / %}
+                    </body>
+                </html>
+            """
+
+            def on_render_after(self, context, template, content):
+                rendered_contents.append(content)
+
+        registry.register(name="test", component=TestComponent)
+        registry.register(name="other", component=OtherComponent)
+
+        leaked_entries = get_render_session_stats().leaked_entries
+        rendered_contents: List[str] = []
+        rendered = ParentComponent.render()
+
+        # The HTML rendered by the components doesn't contain the dependency comments
+        self.assertEqual(len(rendered_contents), 1)
+        self.assertNotIn("_RENDERED", rendered_contents[0])
+
+        self.assertInHTML("<style>.xyz { color: red; }</style>", rendered, count=1)
+        self.assertInHTML("<style>.other { color: blue; }</style>", rendered, count=1)
+        self.assertInHTML('<script>console.log("xyz");</script>', rendered, count=1)
+        self.assertInHTML('<link href="style.css" media="all" rel="stylesheet">', rendered, count=1)
+        self.assertNotIn("_RENDERED", rendered)
+
+        # When the HTML leaves the render, the dependencies are kept in the HTML,
+        # once for each component class
+        rendered_raw = ParentComponent.render(render_dependencies=False)
+        self.assertEqual(rendered_raw.count("_RENDERED"), 3)
+
+        # Nothing is left over in the render session
+        self.assertEqual(get_render_session_stats().leaked_entries, leaked_entries)
+
+    def test_dependency_comments_deduplicated_per_class(self):
+        class TestComponent(SimpleComponent):
+            def get_js_data(self, variable, variable2="default"):
+                return {"variable": variable}
+
+        class ParentComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                {% for variable in variables %}
+                    {% component "test" variable=variable / %}
+                {% endfor %}
+            """
+
+            def get_context_data(self):
+                return {"variables": ["foo", "bar", "foo", "bar", "foo"]}
+
+        registry.register(name="test", component=TestComponent)
+
+        rendered_raw = ParentComponent.render(render_dependencies=False)
+        comments = re.findall(r"<!-- _RENDERED (\S+) -->", rendered_raw)
+
+        # Instances with the same JS variables share the comment
+        js_input_hashes = sorted(comment.split(",")[2] for comment in comments[1:])
+        self.assertEqual(len(comments), 3)
+        self.assertTrue(comments[0].startswith("ParentComponent_"))
+        self.assertEqual(len(set(js_input_hashes)), 2)
+
+        # Each `{% component %}` tag in a plain template is rendered separately, so each has its own comment
+        template = Template("""
+            {% load component_tags %}
+            {% component "test" variable="foo" / %}
+            {% component "test" variable="foo" / %}
+            """)
+        self.assertEqual(template.render(Context({})).count("_RENDERED"), 2)
+
     def test_component_render_to_response_renders_dependencies(self):
         class SimpleComponentWithDeps(SimpleComponent):
             template: types.django_html = (
@@ -288,6 +390,35 @@ class RenderDependenciesTests(BaseTestCase):
             count=1,
         )
 
+    def test_inserts_to_first_head_and_last_body_in_bytes(self):
+        registry.register(name="test", component=SimpleComponent)
+
+        template_str: types.django_html = """
+            {% load component_tags %}
+            <html>
+                <head></head>
+                <body>
+                    <template><head></head><body></body></template>
+                    {% component "test" variable="foo" / %}
+                </body>
+            </html>
+        """
+        rendered_raw = Template(template_str).render(Context({}))
+        rendered = render_dependencies(rendered_raw.encode())
+
+        self.assertIsInstance(rendered, bytes)
+        rendered_str = rendered.decode()
+        self.assertEqual(rendered_str.count("_RENDERED"), 0)
+        self.assertEqual(rendered_str.count("<style"), 1)
+
+        self.assertIn("<template><head></head><body></body></template>", rendered_str)
+        # CSS is inserted before the first `</head>`, JS before the last `</body>`
+        css_index = rendered_str.index("<style>")
+        js_index = rendered_str.index('<script src="django_components/django_components.min.js">')
+        self.assertLess(css_index, rendered_str.index("</head>"))
+        self.assertLess(rendered_str.index("</template>"), js_index)
+        self.assertLess(js_index, rendered_str.rindex("</body>"))
+
     # NOTE: Some HTML parser libraries like selectolax or lxml try to "correct" the given HTML.
     #       We want to avoid this behavior, so user gets the exact same HTML back.
     def test_does_not_try_to_add_close_tags(self):
@@ -400,9 +531,9 @@ class RenderDependenciesTests(BaseTestCase):
 
         # Base64 encodings:
         # `PGxpbmsgaHJlZj0ic3R5bGUuY3NzIiBtZWRpYT0iYWxsIiByZWw9InN0eWxlc2hlZXQiPg==` -> `<link href="style.css" media="all" rel="stylesheet">`  # noqa: E501
-        # `PGxpbmsgaHJlZj0iL2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50XzMxMTA5Ny5jc3MiIG1lZGlhPSJhbGwiIHJlbD0ic3R5bGVzaGVldCI+` -> `<link href="/components/cache/SimpleComponent_311097.css" media="all" rel="stylesheet">`  # noqa: E501
+        # `PGxpbmsgaHJlZj0iL2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50XzMxMTA5Ny5jc3M/dj02MDNmN2UyNiIgbWVkaWE9ImFsbCIgcmVsPSJzdHlsZXNoZWV0Ij4=` -> `<link href="/components/cache/SimpleComponent_311097.css?v=603f7e26" media="all" rel="stylesheet">`  # noqa: E501
         # `PHNjcmlwdCBzcmM9InNjcmlwdC5qcyI+PC9zY3JpcHQ+` -> `<script src="script.js"></script>`
-        # `PHNjcmlwdCBzcmM9Ii9jb21wb25lbnRzL2NhY2hlL1NpbXBsZUNvbXBvbmVudF8zMTEwOTcuanMiPjwvc2NyaXB0Pg==` -> `<script src="/components/cache/SimpleComponent_311097.js"></script>`  # noqa: E501
+        # `PHNjcmlwdCBzcmM9Ii9jb21wb25lbnRzL2NhY2hlL1NpbXBsZUNvbXBvbmVudF8zMTEwOTcuanM/dj05ZWI3OTRiZCI+PC9zY3JpcHQ+` -> `<script src="/components/cache/SimpleComponent_311097.js?v=9eb794bd"></script>`  # noqa: E501
         expected = """
             <table class="table-auto border-collapse divide-y divide-x divide-slate-300 w-full">
                 <!-- Table head -->
@@ -429,9 +560,11 @@ class RenderDependenciesTests(BaseTestCase):
                 {"loadedCssUrls": [],
                 "loadedJsUrls": [],
                 "toLoadCssTags": ["PGxpbmsgaHJlZj0ic3R5bGUuY3NzIiBtZWRpYT0iYWxsIiByZWw9InN0eWxlc2hlZXQiPg==",
-                    "PGxpbmsgaHJlZj0iL2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50XzMxMTA5Ny5jc3MiIG1lZGlhPSJhbGwiIHJlbD0ic3R5bGVzaGVldCI+"],
+                    "PGxpbmsgaHJlZj0iL2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50XzMxMTA5Ny5jc3M/dj02MDNmN2UyNiIgbWVkaWE9ImFsbCIgcmVsPSJzdHlsZXNoZWV0Ij4="],
                 "toLoadJsTags": ["PHNjcmlwdCBzcmM9InNjcmlwdC5qcyI+PC9zY3JpcHQ+",
-                "PHNjcmlwdCBzcmM9Ii9jb21wb25lbnRzL2NhY2hlL1NpbXBsZUNvbXBvbmVudF8zMTEwOTcuanMiPjwvc2NyaXB0Pg=="]}
+                "PHNjcmlwdCBzcmM9Ii9jb21wb25lbnRzL2NhY2hlL1NpbXBsZUNvbXBvbmVudF8zMTEwOTcuanM/dj05ZWI3OTRiZCI+PC9zY3JpcHQ+"],
+                "toLoadCssBundles": [],
+                "toLoadJsBundles": []}
             </script>
         """  # noqa: E501
 
@@ -468,6 +601,158 @@ class RenderDependenciesTests(BaseTestCase):
         ):
             ComponentWithScript.render(kwargs={"variable": "foo"})
 
+    def test_dependency_manifest_is_computed_once_per_class(self):
+        class OtherComponent(SimpleComponent):
+            pass
+
+        registry.register(name="test", component=SimpleComponent)
+        registry.register(name="other", component=OtherComponent)
+        template = Template("""
+            {% load component_tags %}
+            {% component_js_dependencies %}
+            {% component 'test' variable='foo' / %}
+            {% component 'other' variable='foo' / %}
+            """)
+
+        with patch(
+            "django_components.dependencies._gen_dependency_manifest",
+            wraps=_gen_dependency_manifest,
+        ) as gen_manifest:
+            rendered1 = render_dependencies(template.render(Context({})), type="document")
+            render_dependencies(template.render(Context({})), type="document")
+            rendered2 = render_dependencies(template.render(Context({})), type="fragment")
+
+        self.assertEqual(
+            [call.args[0] for call in gen_manifest.call_args_list],
+            [SimpleComponent, OtherComponent],
+        )
+        self.assertInHTML('<script>console.log("xyz");</script>', rendered1, count=2)
+        self.assertInHTML('<script src="script.js"></script>', rendered1, count=1)
+        self.assertNotIn('<script>console.log("xyz");</script>', rendered2)
+
+        manifest = get_dependency_manifest(SimpleComponent)
+        self.assertEqual(manifest.media_js, (("script.js", '<script src="script.js"></script>'),))
+        self.assertEqual(manifest.media_css, (("style.css", '<link href="style.css" media="all" rel="stylesheet">'),))
+        assert manifest.js is not None
+        self.assertEqual(manifest.js.inlined_tag, '<script>console.log("xyz");</script>')
+
+    def test_dependency_manifest_per_script_prefix(self):
+        SimpleComponent.render(kwargs={"variable": "foo"})
+        manifest = get_dependency_manifest(SimpleComponent)
+
+        set_script_prefix("/subpath/")
+        try:
+            prefixed_manifest = get_dependency_manifest(SimpleComponent)
+        finally:
+            set_script_prefix("/")
+
+        assert manifest.js is not None
+        assert prefixed_manifest.js is not None
+        self.assertEqual(manifest.js.url, f"/components/cache/{SimpleComponent._class_hash}.js?v=9eb794bd")
+        self.assertEqual(
+            prefixed_manifest.js.url, f"/subpath/components/cache/{SimpleComponent._class_hash}.js?v=9eb794bd"
+        )
+        self.assertIs(get_dependency_manifest(SimpleComponent), manifest)
+
+
+class ScriptUrlTests(BaseTestCase):
+    def test_same_as_reverse(self):
+        class Ünicode(Component):
+            template: types.django_html = "Hello"
+            js: types.js = 'console.log("hello");'
+
+        Ünicode.render()
+
+        self.assertEqual(
+            get_script_url("js", Ünicode, None),
+            reverse(
+                "components_cached_script",
+                kwargs={"comp_cls_hash": Ünicode._class_hash, "script_type": "js"},
+            )
+            + "?v=0c115107",
+        )
+        # Not cached yet, so no content hash
+        self.assertEqual(
+            get_script_url("css", Ünicode, "abc123"),
+            reverse(
+                "components_cached_script",
+                kwargs={"comp_cls_hash": Ünicode._class_hash, "input_hash": "abc123", "script_type": "css"},
+            ),
+        )
+        self.assertEqual(
+            get_bundle_url("js", "1a2b3c4d", [(SimpleComponent, None)]),
+            reverse("components_cached_bundle", kwargs={"bundle_hash": "1a2b3c4d", "script_type": "js"})
+            + f"?s={SimpleComponent._class_hash}",
+        )
+
+    def test_url_resolved_only_once(self):
+        SimpleComponent.render(kwargs={"variable": "foo"})
+        get_script_url("js", SimpleComponent, None)
+
+        with patch("django_components.dependencies.reverse") as reverse_mock:
+            for _ in range(3):
+                get_script_url("js", SimpleComponent, None)
+                get_script_url("css", SimpleComponent, "abc123")
+                get_bundle_url("js", "1a2b3c4d", [(SimpleComponent, None)])
+        reverse_mock.assert_not_called()
+
+    def test_content_hashed_only_once(self):
+        SimpleComponent.render(kwargs={"variable": "foo"})
+        url = get_script_url("js", SimpleComponent, None)
+
+        with patch("django_components.dependencies.get_script_content") as get_content_mock:
+            for _ in range(3):
+                self.assertEqual(get_script_url("js", SimpleComponent, None), url)
+        get_content_mock.assert_not_called()
+
+    def test_script_prefix_and_urlconf(self):
+        SimpleComponent.render(kwargs={"variable": "foo"})
+
+        set_script_prefix("/subpath/")
+        try:
+            self.assertEqual(
+                get_script_url("js", SimpleComponent, None),
+                f"/subpath/components/cache/{SimpleComponent._class_hash}.js?v=9eb794bd",
+            )
+        finally:
+            set_script_prefix("/")
+
+        urlconf = ModuleType("custom_urlconf")
+        urlconf.urlpatterns = [path("assets/", include("django_components.dependencies"))]  # type: ignore
+        set_urlconf(urlconf)
+        try:
+            self.assertEqual(
+                get_script_url("js", SimpleComponent, None),
+                f"/assets/cache/{SimpleComponent._class_hash}.js?v=9eb794bd",
+            )
+            self.assertEqual(
+                get_bundle_url("css", "1a2b3c4d", [(SimpleComponent, "abc123")]),
+                f"/assets/cache/bundle/1a2b3c4d.css?s={SimpleComponent._class_hash}.abc123",
+            )
+        finally:
+            set_urlconf(None)
+
+        self.assertEqual(
+            get_script_url("js", SimpleComponent, None),
+            f"/components/cache/{SimpleComponent._class_hash}.js?v=9eb794bd",
+        )
+
+    # NOTE: Use the default media cache, even if other tests set a custom one
+    @patch("django_components.cache.component_media_cache", None)
+    def test_many_components(self):
+        # NOTE: Component's hash is derived from its name, so each class must have a different name
+        components: List[Type[Component]] = [
+            type(f"ManyComponent{index}", (Component,), {"template": "Hello", "js": f"console.log({index});"})
+            for index in range(400)
+        ]
+        for comp_cls in components:
+            comp_cls.render()
+
+        # Scripts of earlier components must not be evicted from the media cache
+        for index, comp_cls in enumerate(components):
+            self.assertEqual(get_script_content("js", comp_cls, None), f"console.log({index});")
+            self.assertIn("?v=", get_script_url("js", comp_cls, None))
+
 
 class MiddlewareTests(BaseTestCase):
     def test_middleware_response_without_content_type(self):
@@ -476,6 +761,30 @@ class MiddlewareTests(BaseTestCase):
         request = Mock()
         self.assertEqual(response, middleware(request=request))
 
+    async def test_middleware_async(self):
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <html><head>{% component_css_dependencies %}</head>
+                <body>Variable: <strong>{{ variable }}</strong>{% component_js_dependencies %}</body></html>
+            """
+            css = ".xyz { color: red; }"
+
+            async def get_context_data(self):
+                return {"variable": "foo"}
+
+        async def get_response(request):
+            html = await SimpleComponent.arender(request=request, render_dependencies=False)
+            return HttpResponse(html)
+
+        middleware = ComponentDependencyMiddleware(get_response=get_response)
+        response = await middleware(request=Mock())
+        content = response.content.decode()
+
+        self.assertInHTML("<style>.xyz { color: red; }</style>", content, count=1)
+        self.assertInHTML('<script src="django_components/django_components.min.js"></script>', content, count=1)
+        self.assertNotIn("_RENDERED", content)
+
     def test_middleware_response_with_components_with_slash_dash_and_underscore(self):
         registry.register("dynamic", DynamicComponent)
         registry.register("test-component", component=SimpleComponent)
@@ -533,3 +842,328 @@ class MiddlewareTests(BaseTestCase):
             rendered3.count('Variable: <strong data-djc-id-a1bc46="" data-djc-id-a1bc45="">value</strong>'),
             1,
         )
+
+    def _render_streamed_page(self, with_js_placeholder: bool) -> bytes:
+        registry.register(name="test", component=SimpleComponent)
+
+        template_str: types.django_html = """
+            {% load component_tags %}
+            <html>
+                <head>{% component_css_dependencies %}</head>
+                <body>
+                    <p>Příliš žluťoučký kůň</p>
+                    {% component "test" variable="foo" / %}
+                    JS_HERE
+                </body>
+            </html>
+        """
+        template_str = template_str.replace(
+            "JS_HERE", "{% component_js_dependencies %}" if with_js_placeholder else ""
+        )
+        return Template(template_str).render(Context({})).encode()
+
+    def _split_bytes(self, content: bytes, size: int):
+        # Small chunks, so that comments, placeholders, `</body>`, and multi-byte characters are split
+        return [content[index:][:size] for index in range(0, len(content), size)]
+
+    def _assert_streamed_dependencies(self, content: str):
+        self.assertNotIn("_RENDERED", content)
+        self.assertNotIn("CSS_PLACEHOLDER", content)
+        self.assertNotIn("JS_PLACEHOLDER", content)
+        self.assertIn("<p>Příliš žluťoučký kůň</p>", content)
+        self.assertInHTML("<style>.xyz { color: red; }</style>", content, count=1)
+        self.assertInHTML('<script>console.log("xyz");</script>', content, count=1)
+        self.assertInHTML('<script src="django_components/django_components.min.js"></script>', content, count=1)
+
+        # Dependencies are inserted inside `<body>`
+        body_start = content.index("<body>")
+        body_end = content.index("</body>")
+        body = content[body_start:body_end]
+        self.assertIn("<style>", body)
+        self.assertIn("django_components.min.js", body)
+
+    def test_middleware_streaming_response(self):
+        for with_js_placeholder in (True, False):
+            with self.subTest(with_js_placeholder=with_js_placeholder):
+                registry.clear()
+                html = self._render_streamed_page(with_js_placeholder)
+                chunks = self._split_bytes(html, 7)
+
+                middleware = ComponentDependencyMiddleware(
+                    get_response=lambda _: StreamingHttpResponse(iter(chunks), content_type="text/html")
+                )
+                response = middleware(request=Mock())
+
+                self.assertFalse(response.is_async)
+                content = b"".join(response.streaming_content).decode()
+                self._assert_streamed_dependencies(content)
+
+    async def test_middleware_streaming_response_async(self):
+        html = self._render_streamed_page(with_js_placeholder=False)
+        chunks = self._split_bytes(html, 5)
+
+        async def stream():
+            for chunk in chunks:
+                yield chunk
+
+        async def get_response(request):
+            return StreamingHttpResponse(stream(), content_type="text/html")
+
+        middleware = ComponentDependencyMiddleware(get_response=get_response)
+        response = await middleware(request=Mock())
+
+        self.assertTrue(response.is_async)
+        content = b"".join([chunk async for chunk in response.streaming_content]).decode()
+        self._assert_streamed_dependencies(content)
+
+    def test_middleware_streaming_response_component_after_body(self):
+        registry.register(name="test", component=SimpleComponent)
+        template = Template("""
+            {% load component_tags %}
+            <html><body>{% component_js_dependencies %}</body></html>
+            {% component "test" variable="foo" / %}
+        """)
+        chunks = [template.render(Context({})).encode()]
+
+        middleware = ComponentDependencyMiddleware(
+            get_response=lambda _: StreamingHttpResponse(iter(chunks), content_type="text/html")
+        )
+        response = middleware(request=Mock())
+        content = b"".join(response.streaming_content).decode()
+
+        self.assertNotIn("_RENDERED", content)
+        # Components rendered after the dependencies were inserted are loaded by the dependency manager
+        self.assertNotIn("<style>", content)
+        html_end = content.index("</html>")
+        tail = content[html_end:]
+        self.assertIn('<script type="application/json" data-djc>', tail)
+        self.assertIn('"toLoadCssTags": ["', tail)
+        self.assertIn('"toLoadJsTags": ["', tail)
+
+    def test_middleware_streaming_response_removes_content_length(self):
+        html = self._render_streamed_page(with_js_placeholder=False)
+        chunks = self._split_bytes(html, 7)
+
+        def get_response(request):
+            response = StreamingHttpResponse(iter(chunks), content_type="text/html")
+            response["Content-Length"] = str(len(html))
+            return response
+
+        middleware = ComponentDependencyMiddleware(get_response=get_response)
+        response = middleware(request=Mock())
+
+        self.assertFalse(response.has_header("Content-Length"))
+        content = b"".join(response.streaming_content).decode()
+        self._assert_streamed_dependencies(content)
+
+    def test_middleware_skips_file_response(self):
+        html = b"<html><head></head><body><p>Static</p></body></html>"
+
+        middleware = ComponentDependencyMiddleware(
+            get_response=lambda _: FileResponse(io.BytesIO(html), content_type="text/html")
+        )
+        response = middleware(request=Mock())
+
+        self.assertEqual(response["Content-Length"], str(len(html)))
+        content = b"".join(response.streaming_content)
+        self.assertEqual(content, html)
+
+
+class CachedScriptViewTests(BaseTestCase):
+    def test_script_url_has_content_hash(self):
+        SimpleComponent.render(kwargs={"variable": "foo"})
+
+        url = get_script_url("js", SimpleComponent, None)
+        self.assertEqual(url, f"/components/cache/{SimpleComponent._class_hash}.js?v=9eb794bd")
+
+        response = Client().get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content.decode(), 'console.log("xyz");')
+        self.assertEqual(response["Content-Type"], "text/javascript")
+        self.assertEqual(response["ETag"], '"9eb794bd"')
+        self.assertEqual(response["Cache-Control"], "public, max-age=31536000, immutable")
+
+    def test_script_url_without_content_hash_must_revalidate(self):
+        SimpleComponent.render(kwargs={"variable": "foo"})
+
+        # E.g. if the script changed since the URL was rendered
+        for url in [
+            f"/components/cache/{SimpleComponent._class_hash}.css",
+            f"/components/cache/{SimpleComponent._class_hash}.css?v=abc",
+        ]:
+            with self.subTest(url=url):
+                response = Client().get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response["ETag"], '"603f7e26"')
+                self.assertEqual(response["Cache-Control"], "no-cache")
+
+    def test_conditional_get(self):
+        SimpleComponent.render(kwargs={"variable": "foo"})
+        url = get_script_url("js", SimpleComponent, None)
+
+        response = Client().get(url, HTTP_IF_NONE_MATCH='"9eb794bd"')
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], '"9eb794bd"')
+
+        response = Client().get(url, HTTP_IF_NONE_MATCH='"0000000"')
+        self.assertEqual(response.status_code, 200)
+
+    def test_not_found(self):
+        SimpleComponent.render(kwargs={"variable": "foo"})
+
+        self.assertEqual(Client().get("/components/cache/Unknown_123456.js").status_code, 404)
+        self.assertEqual(
+            Client().get(f"/components/cache/{SimpleComponent._class_hash}.123456.js").status_code,
+            404,
+        )
+        self.assertEqual(Client().post(get_script_url("js", SimpleComponent, None)).status_code, 405)
+
+    @override_settings(COMPONENTS={"cache_compression": ["gzip"]})
+    def test_compressed_script(self):
+        SimpleComponent.render(kwargs={"variable": "foo"})
+        url = get_script_url("js", SimpleComponent, None)
+
+        response = Client().get(url, HTTP_ACCEPT_ENCODING="deflate, gzip;q=1.0, *;q=0.5")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertEqual(response["ETag"], '"9eb794bd-gzip"')
+        self.assertEqual(gzip.decompress(response.content).decode(), 'console.log("xyz");')
+
+        response = Client().get(url, HTTP_IF_NONE_MATCH='"9eb794bd-gzip"', HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response.status_code, 304)
+
+        response = Client().get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertEqual(response.content.decode(), 'console.log("xyz");')
+
+
+class BundleTests(BaseTestCase):
+    def _render_fragment(self, content: str) -> dict:
+        rendered = render_dependencies(content, type="fragment")
+        exec_script = re.search(r'<script type="application/json" data-djc>(.*?)</script>', rendered, re.DOTALL)
+        assert exec_script is not None
+        return json.loads(exec_script[1])
+
+    def _decode_bundle(self, bundle: dict) -> Tuple[str, List[str]]:
+        tag = base64.b64decode(bundle["tag"]).decode()
+        url_match = re.search(r'(?:src|href)="([^"]+)"', tag)
+        assert url_match is not None
+        url = url_match[1]
+        return url, [base64.b64decode(member).decode() for member in bundle["urls"]]
+
+    def test_fragment_with_multiple_components_loads_bundle(self):
+        class OtherComponent(Component):
+            template: types.django_html = "Other"
+            css: types.css = ".other { color: blue; }"
+            js: types.js = 'console.log("other");'
+
+        content = SimpleComponent.render(kwargs={"variable": "foo"}, render_dependencies=False)
+        content += OtherComponent.render(render_dependencies=False)
+        data = self._render_fragment(content)
+
+        # Component's own JS / CSS is in bundles, while Media JS / CSS is loaded as before
+        self.assertEqual(len(data["toLoadJsTags"]), 1)
+        self.assertEqual(len(data["toLoadCssTags"]), 1)
+        self.assertEqual(len(data["toLoadJsBundles"]), 1)
+        self.assertEqual(len(data["toLoadCssBundles"]), 1)
+
+        js_url, js_members = self._decode_bundle(data["toLoadJsBundles"][0])
+        self.assertRegex(js_url, r"^/components/cache/bundle/[0-9a-f]{8}\.js\?s=")
+        self.assertEqual(
+            sorted(js_members),
+            sorted([get_script_url("js", SimpleComponent, None), get_script_url("js", OtherComponent, None)]),
+        )
+
+        response = Client().get(js_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/javascript")
+        self.assertEqual(response["Cache-Control"], "public, max-age=31536000, immutable")
+        self.assertEqual(response["ETag"], f'"{js_url.split("?")[0].rsplit("/", 1)[1][:-3]}"')
+        # Scripts are ordered by their URLs
+        js_by_url = {
+            get_script_url("js", SimpleComponent, None): 'console.log("xyz");',
+            get_script_url("js", OtherComponent, None): 'console.log("other");',
+        }
+        self.assertEqual(response.content.decode(), "\n;\n".join(js_by_url[url] for url in sorted(js_members)))
+
+        css_url, _ = self._decode_bundle(data["toLoadCssBundles"][0])
+        self.assertRegex(css_url, r"^/components/cache/bundle/[0-9a-f]{8}\.css\?s=")
+        response = Client().get(css_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(".xyz", response.content.decode())
+        self.assertIn(".other { color: blue; }", response.content.decode())
+
+    def test_bundle_does_not_depend_on_render_order(self):
+        class OtherComponent(Component):
+            template: types.django_html = "Other"
+            js: types.js = 'console.log("other");'
+
+        simple = SimpleComponent.render(kwargs={"variable": "foo"}, render_dependencies=False)
+        other = OtherComponent.render(render_dependencies=False)
+
+        data1 = self._render_fragment(simple + other)
+        data2 = self._render_fragment(other + simple)
+        self.assertEqual(data1["toLoadJsBundles"][0]["tag"], data2["toLoadJsBundles"][0]["tag"])
+        # Only one component has CSS, so it is loaded without a bundle
+        self.assertEqual(data1["toLoadCssBundles"], [])
+        self.assertEqual(len(data1["toLoadCssTags"]), 2)
+
+    def test_single_component_is_not_bundled(self):
+        content = SimpleComponent.render(kwargs={"variable": "foo"}, render_dependencies=False)
+        data = self._render_fragment(content)
+        self.assertEqual(data["toLoadJsBundles"], [])
+        self.assertEqual(data["toLoadCssBundles"], [])
+        self.assertEqual(len(data["toLoadJsTags"]), 2)
+
+    def test_bundle_not_found(self):
+        self.assertEqual(Client().get("/components/cache/bundle/12345678.js").status_code, 404)
+        self.assertEqual(Client().get("/components/cache/bundle/12345678.js?s=Unknown_123456").status_code, 404)
+
+        SimpleComponent.render(kwargs={"variable": "foo"})
+        self.assertEqual(
+            Client().get(f"/components/cache/bundle/12345678.js?s={SimpleComponent._class_hash}.123456").status_code,
+            404,
+        )
+
+    # E.g. when the bundle was rendered by another process, or it was evicted from the cache
+    def test_bundle_regenerated_when_not_in_cache(self):
+        class OtherComponent(Component):
+            template: types.django_html = "Other"
+            js: types.js = 'console.log("other");'
+
+        content = SimpleComponent.render(kwargs={"variable": "foo"}, render_dependencies=False)
+        content += OtherComponent.render(render_dependencies=False)
+        js_url, _ = self._decode_bundle(self._render_fragment(content)["toLoadJsBundles"][0])
+        expected = Client().get(js_url)
+
+        get_component_media_cache().clear()
+
+        response = Client().get(js_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, expected.content)
+        self.assertEqual(response["ETag"], expected["ETag"])
+        self.assertEqual(response["Cache-Control"], "public, max-age=31536000, immutable")
+
+    def test_changed_bundle_not_immutable(self):
+        class OtherComponent(Component):
+            template: types.django_html = "Other"
+            js: types.js = 'console.log("other");'
+
+        content = SimpleComponent.render(kwargs={"variable": "foo"}, render_dependencies=False)
+        content += OtherComponent.render(render_dependencies=False)
+        js_url, _ = self._decode_bundle(self._render_fragment(content)["toLoadJsBundles"][0])
+        bundle_hash = js_url.split("?")[0].rsplit("/", 1)[1][:-3]
+
+        get_component_media_cache().clear()
+        content_hashes.clear()
+        OtherComponent.js = 'console.log("changed");'
+
+        response = Client().get(js_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('console.log("changed");', response.content.decode())
+        self.assertNotEqual(response["ETag"], f'"{bundle_hash}"')
+        self.assertEqual(response["Cache-Control"], "no-cache")
@@ -200,6 +200,94 @@ class LoadScriptTests(_BaseDepManagerTestCase):
         await page.close()
 
 
+# Tests for the bundles passed to the manager via the `<script type="application/json" data-djc>` tag
+@override_settings(STATIC_URL="static/")
+class LoadBundleTests(_BaseDepManagerTestCase):
+    async def _load_bundles(self, page: Page, loaded_urls: List[str]) -> dict:
+        # JS code that marks some scripts as loaded, and then inserts the exec script
+        # with one JS and one CSS bundle. Returns the URLs of the scripts that were loaded.
+        test_js: types.js = """async (loadedUrls) => {
+            loadedUrls.forEach((url) => {
+                Components.manager.markScriptLoaded('js', `/comp/${url}.js`);
+                Components.manager.markScriptLoaded('css', `/comp/${url}.css`);
+            });
+
+            const jsBundle = {
+                tag: btoa('<script src="/bundle/a1b2c3.js"></script>'),
+                urls: ['/comp/one.js', '/comp/two.js', '/comp/three.js'].map((url) => btoa(url)),
+            };
+            const cssBundle = {
+                tag: btoa('<link href="/bundle/a1b2c3.css" media="all" rel="stylesheet">'),
+                urls: ['/comp/one.css', '/comp/two.css', '/comp/three.css'].map((url) => btoa(url)),
+            };
+
+            const execScript = document.createElement('script');
+            execScript.type = 'application/json';
+            execScript.setAttribute('data-djc', '');
+            execScript.text = JSON.stringify({
+                loadedCssUrls: [],
+                loadedJsUrls: [],
+                toLoadCssTags: [],
+                toLoadJsTags: [],
+                toLoadCssBundles: [cssBundle],
+                toLoadJsBundles: [jsBundle],
+            });
+            document.body.append(execScript);
+
+            // Wait for the MutationObserver to pick up the exec script
+            await new Promise((resolve) => setTimeout(resolve, 0));
+
+            return {
+                js: [...document.querySelectorAll('script[src]')].map((el) => el.getAttribute('src')),
+                css: [...document.querySelectorAll('link')].map((el) => el.getAttribute('href')),
+            };
+        }"""
+
+        return await page.evaluate(test_js, loaded_urls)
+
+    @with_playwright
+    async def test_loads_bundle(self):
+        page = await self._create_page_with_dep_manager()
+
+        data = await self._load_bundles(page, [])
+
+        self.assertEqual(data["js"], ["/bundle/a1b2c3.js"])
+        self.assertEqual(data["css"], ["/bundle/a1b2c3.css"])
+
+        # The scripts in the bundle are marked as loaded, so they are not loaded again
+        test_js: types.js = """() => {
+            Components.manager.loadJs('<script src="/comp/two.js"></script>');
+            Components.manager.loadCss('<link href="/comp/two.css">');
+            return document.querySelectorAll('script[src], link').length;
+        }"""
+        num_scripts = await page.evaluate(test_js)
+        self.assertEqual(num_scripts, 2)
+
+        await page.close()
+
+    @with_playwright
+    async def test_loads_missing_scripts_of_partially_loaded_bundle(self):
+        page = await self._create_page_with_dep_manager()
+
+        data = await self._load_bundles(page, ["two"])
+
+        self.assertEqual(data["js"], ["/comp/one.js", "/comp/three.js"])
+        self.assertEqual(data["css"], ["/comp/one.css", "/comp/three.css"])
+
+        await page.close()
+
+    @with_playwright
+    async def test_skips_fully_loaded_bundle(self):
+        page = await self._create_page_with_dep_manager()
+
+        data = await self._load_bundles(page, ["one", "two", "three"])
+
+        self.assertEqual(data["js"], [])
+        self.assertEqual(data["css"], [])
+
+        await page.close()
+
+
 # Tests for `manager.registerComponent()` / `registerComponentData()` / `callComponent()`
 @override_settings(STATIC_URL="static/")
 class CallComponentTests(_BaseDepManagerTestCase):
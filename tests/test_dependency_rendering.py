@@ -194,7 +194,9 @@ class DependencyRenderingTests(BaseTestCase):
                 {"loadedCssUrls": ["c3R5bGUuY3Nz"],
                 "loadedJsUrls": ["c2NyaXB0Lmpz"],
                 "toLoadCssTags": [],
-                "toLoadJsTags": []}
+                "toLoadJsTags": [],
+                "toLoadCssBundles": [],
+                "toLoadJsBundles": []}
             </script>
             """,
             rendered,
@@ -229,7 +231,9 @@ class DependencyRenderingTests(BaseTestCase):
                 {"loadedCssUrls": ["c3R5bGUuY3Nz"],
                 "loadedJsUrls": ["c2NyaXB0Lmpz"],
                 "toLoadCssTags": [],
-                "toLoadJsTags": []}
+                "toLoadJsTags": [],
+                "toLoadCssBundles": [],
+                "toLoadJsBundles": []}
             </script>
             """,
             rendered,
@@ -295,7 +299,9 @@ class DependencyRenderingTests(BaseTestCase):
                 {"loadedCssUrls": ["c3R5bGUuY3Nz"],
                 "loadedJsUrls": ["c2NyaXB0Lmpz"],
                 "toLoadCssTags": [],
-                "toLoadJsTags": []}
+                "toLoadJsTags": [],
+                "toLoadCssBundles": [],
+                "toLoadJsBundles": []}
             </script>
             """,
             rendered,
@@ -353,7 +359,9 @@ class DependencyRenderingTests(BaseTestCase):
                 {"loadedCssUrls": ["c3R5bGUuY3Nz", "c3R5bGUyLmNzcw=="],
                 "loadedJsUrls": ["c2NyaXB0Lmpz", "c2NyaXB0Mi5qcw=="],
                 "toLoadCssTags": [],
-                "toLoadJsTags": []}
+                "toLoadJsTags": [],
+                "toLoadCssBundles": [],
+                "toLoadJsBundles": []}
             </script>
             """,
             rendered,
@@ -455,28 +463,30 @@ class DependencyRenderingTests(BaseTestCase):
         # `c3R5bGUuY3Nz` -> `style.css`
         # `c3R5bGUyLmNzcw==` -> `style2.css`
         # `eHl6MS5jc3M=` -> `xyz1.css`
-        # `L2NvbXBvbmVudHMvY2FjaGUvT3RoZXJDb21wb25lbnRfNjMyOWFlLmNzcw==` -> `/components/cache/OtherComponent_6329ae.css`
-        # `L2NvbXBvbmVudHMvY2FjaGUvT3RoZXJDb21wb25lbnRfNjMyOWFlLmpz` -> `/components/cache/OtherComponent_6329ae.js`
-        # `L2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50TmVzdGVkX2YwMmQzMi5jc3M=` -> `/components/cache/SimpleComponentNested_f02d32.css`
-        # `L2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50TmVzdGVkX2YwMmQzMi5qcw==` -> `/components/cache/SimpleComponentNested_f02d32.js`
+        # `L2NvbXBvbmVudHMvY2FjaGUvT3RoZXJDb21wb25lbnRfNjMyOWFlLmNzcz92PTYwM2Y3ZTI2` -> `/components/cache/OtherComponent_6329ae.css?v=603f7e26`  # noqa: E501
+        # `L2NvbXBvbmVudHMvY2FjaGUvT3RoZXJDb21wb25lbnRfNjMyOWFlLmpzP3Y9OWViNzk0YmQ=` -> `/components/cache/OtherComponent_6329ae.js?v=9eb794bd`  # noqa: E501
+        # `L2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50TmVzdGVkX2YwMmQzMi5jc3M/dj0xNjhkMWJhZQ==` -> `/components/cache/SimpleComponentNested_f02d32.css?v=168d1bae`  # noqa: E501
+        # `L2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50TmVzdGVkX2YwMmQzMi5qcz92PTgwODcwMTVm` -> `/components/cache/SimpleComponentNested_f02d32.js?v=8087015f`  # noqa: E501
         # `c2NyaXB0Lmpz` -> `script.js`
         # `c2NyaXB0Mi5qcw==` -> `script2.js`
         # `eHl6MS5qcw==` -> `xyz1.js`
         self.assertInHTML(
             """
             <script type="application/json" data-djc>
-                {"loadedCssUrls": ["L2NvbXBvbmVudHMvY2FjaGUvT3RoZXJDb21wb25lbnRfNjMyOWFlLmNzcw==",
-                    "L2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50TmVzdGVkX2YwMmQzMi5jc3M=",
+                {"loadedCssUrls": ["L2NvbXBvbmVudHMvY2FjaGUvT3RoZXJDb21wb25lbnRfNjMyOWFlLmNzcz92PTYwM2Y3ZTI2",
+                    "L2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50TmVzdGVkX2YwMmQzMi5jc3M/dj0xNjhkMWJhZQ==",
                     "c3R5bGUuY3Nz",
                     "c3R5bGUyLmNzcw==",
                     "eHl6MS5jc3M="],
-                "loadedJsUrls": ["L2NvbXBvbmVudHMvY2FjaGUvT3RoZXJDb21wb25lbnRfNjMyOWFlLmpz",
-                    "L2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50TmVzdGVkX2YwMmQzMi5qcw==",
+                "loadedJsUrls": ["L2NvbXBvbmVudHMvY2FjaGUvT3RoZXJDb21wb25lbnRfNjMyOWFlLmpzP3Y9OWViNzk0YmQ=",
+                    "L2NvbXBvbmVudHMvY2FjaGUvU2ltcGxlQ29tcG9uZW50TmVzdGVkX2YwMmQzMi5qcz92PTgwODcwMTVm",
                     "c2NyaXB0Lmpz",
                     "c2NyaXB0Mi5qcw==",
                     "eHl6MS5qcw=="],
                 "toLoadCssTags": [],
-                "toLoadJsTags": []}
+                "toLoadJsTags": [],
+                "toLoadCssBundles": [],
+                "toLoadJsBundles": []}
             </script>
             """,
             rendered,
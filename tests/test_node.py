@@ -1,4 +1,5 @@
 import inspect
+from unittest.mock import patch
 
 from django.template import Context, Template
 from django.template.exceptions import TemplateSyntaxError
@@ -6,6 +7,7 @@ from django.template.exceptions import TemplateSyntaxError
 from django_components import types
 from django_components.node import BaseNode, template_tag
 from django_components.templatetags import component_tags
+from django_components.util.template_tag import validate_params
 
 from .django_test_setup import setup_test_config
 from .testutils import BaseTestCase
@@ -369,6 +371,58 @@ class NodeTests(BaseTestCase):
 
         TestNode.unregister(component_tags.register)
 
+    def test_node_render_params_validated_once(self):
+        captured = []
+
+        class TestNode(BaseNode):
+            tag = "mytag"
+
+            def render(self, context: Context, name: str, *args, msg: str = "Hi", **kwargs) -> str:
+                captured.append((name, args, msg, kwargs))
+                return ""
+
+        TestNode.register(component_tags.register)
+
+        template = Template(
+            """
+            {% load component_tags %}
+            {% mytag my_name 123 my_list a=1 b=my_var data-id=my_var %}
+            {% mytag ...my_args msg="Hello" %}
+            """
+        )
+
+        with patch("django_components.util.template_tag.validate_params", wraps=validate_params) as validate:
+            template.render(Context({"my_name": "John", "my_list": [1], "my_var": "x", "my_args": ["Mary"]}))
+            template.render(Context({"my_name": "Jane", "my_list": [2], "my_var": "y", "my_args": ["Anne", 4]}))
+
+        self.assertEqual(
+            captured,
+            [
+                ("John", (123, [1]), "Hi", {"a": 1, "b": "x", "data-id": "x"}),
+                ("Mary", (), "Hello", {}),
+                ("Jane", (123, [2]), "Hi", {"a": 1, "b": "y", "data-id": "y"}),
+                ("Anne", (4,), "Hello", {}),
+            ],
+        )
+        # The params of the first tag are validated only once, while the params of the second tag
+        # (with spread syntax) are validated on each render.
+        self.assertEqual(validate.call_count, 1)
+
+        # Invalid params raise on each render
+        template2 = Template(
+            """
+            {% load component_tags %}
+            {% mytag msg="Hello" / %}
+            """
+        )
+        for _ in range(2):
+            with self.assertRaisesMessage(
+                TypeError, "Invalid parameters for tag 'mytag': missing a required argument: 'name'"
+            ):
+                template2.render(Context({}))
+
+        TestNode.unregister(component_tags.register)
+
 
 class DecoratorTests(BaseTestCase):
     def test_decorator_requires_tag(self):
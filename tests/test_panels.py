@@ -0,0 +1,92 @@
+import json
+
+import pytest
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, override_settings
+
+from django_components import Component, register, types
+from django_components.profiler import active_profiler
+
+from .django_test_setup import setup_test_config
+from .testutils import BaseTestCase
+
+setup_test_config({"autodiscover": False})
+
+pytest.importorskip("debug_toolbar")
+
+from django_components.panels import ComponentsPanel  # noqa: E402
+
+
+# NOTE: The toolbar's app requires `STATIC_URL` to be set
+@override_settings(STATIC_URL="static/")
+class ComponentsPanelTest(BaseTestCase):
+    def _make_components(self):
+        @register("inner")
+        class Inner(Component):
+            template: types.django_html = "<span>Inner</span>"
+
+        class Outer(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                {% component "inner" / %}
+                {% component "inner" / %}
+            """
+
+        return Inner, Outer
+
+    # Run the request through the panel the same way as the toolbar does
+    def _process_request(self, get_response) -> ComponentsPanel:
+        # NOTE: The toolbar stores the panels' stats in a model, so the toolbar's app must be installed
+        # before the toolbar's settings are changed.
+        with self.modify_settings(INSTALLED_APPS={"append": "debug_toolbar"}), self.settings(
+            DEBUG_TOOLBAR_PANELS=["django_components.panels.ComponentsPanel"]
+        ):
+            from debug_toolbar.toolbar import DebugToolbar
+
+            request = RequestFactory().get("/")
+            toolbar = DebugToolbar(request, get_response)
+            response = toolbar.process_request(request)
+
+            panel = toolbar.get_panel_by_id("ComponentsPanel")
+            assert isinstance(panel, ComponentsPanel)
+            panel.generate_stats(request, response)
+        return panel
+
+    def test_profiles_request(self):
+        _, Outer = self._make_components()
+        profilers = []
+
+        def get_response(request: HttpRequest) -> HttpResponse:
+            profilers.append(active_profiler.get())
+            return HttpResponse(Outer.render())
+
+        panel = self._process_request(get_response)
+
+        # The request is profiled, and the profiler is deactivated afterwards
+        self.assertIsNotNone(profilers[0])
+        self.assertIsNone(active_profiler.get())
+
+        stats = panel.get_stats()
+        self.assertEqual(stats["render_count"], 3)
+        self.assertGreater(stats["total_time"], 0)
+        self.assertEqual(panel.nav_subtitle, f"3 renders in {stats['total_time']:.2f}ms")
+
+        rows = {(row["component"], row["phase"]): row for row in stats["rows"]}
+        self.assertEqual(rows[("inner", "render_template")]["calls"], 2)
+        self.assertEqual(rows[("Outer", "render_template")]["calls"], 1)
+
+        # Toolbar stores the stats, so they must be JSON-serializable
+        json.dumps(stats)
+
+        self.assertIn("<th>Component</th>", panel.content)
+        self.assertIn("<td>inner</td><td>render_template</td><td>2</td>", panel.content)
+
+    def test_no_components_rendered(self):
+        def get_response(request: HttpRequest) -> HttpResponse:
+            return HttpResponse("Hello")
+
+        panel = self._process_request(get_response)
+
+        self.assertEqual(panel.get_stats()["render_count"], 0)
+        self.assertEqual(panel.get_stats()["rows"], [])
+        self.assertEqual(panel.content, "<p>No components were rendered.</p>")
@@ -0,0 +1,180 @@
+import asyncio
+import os
+import tempfile
+import time
+from typing import List
+
+from django_components import Component, register, types
+from django_components.profiler import RenderProfiler, active_profiler, profile_render
+
+from .django_test_setup import setup_test_config
+from .testutils import BaseTestCase
+
+setup_test_config({"autodiscover": False})
+
+
+class ProfilerTest(BaseTestCase):
+    def _make_components(self):
+        @register("inner")
+        class Inner(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <span>{% slot "content" default %}{% endslot %}</span>
+            """
+
+            def get_context_data(self):
+                time.sleep(0.01)
+                return {}
+
+        class Outer(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                {% component "inner" %}one{% endcomponent %}
+                {% component "inner" %}two{% endcomponent %}
+            """
+
+        return Inner, Outer
+
+    def test_not_active_by_default(self):
+        _, Outer = self._make_components()
+        Outer.render()
+        self.assertIsNone(active_profiler.get())
+
+    def test_records_phases(self):
+        Inner, Outer = self._make_components()
+
+        with profile_render() as profiler:
+            Outer.render()
+
+        self.assertIsNone(active_profiler.get())
+        self.assertEqual(
+            sorted({(record.component_name, record.phase, record.slot_name) for record in profiler.records}),
+            [
+                ("Outer", "get_context_data", None),
+                ("Outer", "on_render_after", None),
+                ("Outer", "render_template", None),
+                ("Outer", "set_html_attributes", None),
+                ("inner", "get_context_data", None),
+                ("inner", "on_render_after", None),
+                ("inner", "render_slot", "content"),
+                ("inner", "render_template", None),
+                ("inner", "set_html_attributes", None),
+            ],
+        )
+
+        inner_paths = {record.component_path for record in profiler.records if record.component_class is Inner}
+        self.assertEqual(inner_paths, {("Outer", "inner")})
+
+        # Inner components are rendered within the Outer's template
+        outer_template = next(
+            record
+            for record in profiler.records
+            if record.component_name == "Outer" and record.phase == "render_template"
+        )
+        self.assertGreaterEqual(outer_template.duration, 0.02)
+        self.assertLess(outer_template.self_duration, outer_template.duration)
+        self.assertIsNone(outer_template.allocated)
+
+    def test_stats(self):
+        Inner, Outer = self._make_components()
+
+        with profile_render() as profiler:
+            Outer.render()
+
+        stats = profiler.stats()
+        self.assertEqual(stats, sorted(stats, key=lambda stat: stat.total, reverse=True))
+
+        inner_data = next(stat for stat in stats if stat.component_class is Inner and stat.phase == "get_context_data")
+        self.assertEqual(inner_data.calls, 2)
+        self.assertGreaterEqual(inner_data.total, 0.02)
+        self.assertAlmostEqual(inner_data.mean, inner_data.total / 2)
+        self.assertEqual(inner_data.p99, inner_data.max)
+        self.assertIsNone(inner_data.allocated)
+
+    def test_nested_profilers(self):
+        Inner, _ = self._make_components()
+
+        class Profiled(Component):
+            template = "{{ inner }}"
+
+            def get_context_data(self):
+                with profile_render() as inner_profiler:
+                    inner = Inner.render(slots={"content": "one"})
+                inner_profilers.append(inner_profiler)
+                return {"inner": inner}
+
+        inner_profilers: List[RenderProfiler] = []
+        with profile_render() as profiler:
+            Profiled.render()
+
+        self.assertEqual({record.component_name for record in profiler.records}, {"Profiled"})
+        self.assertEqual({record.component_name for record in inner_profilers[0].records}, {"Inner"})
+
+        # Phases recorded by the inner profiler are not subtracted from the outer profiler's self time
+        record = next(record for record in profiler.records if record.phase == "get_context_data")
+        self.assertGreaterEqual(record.self_duration, 0.01)
+        self.assertEqual(record.self_duration, record.duration)
+
+    def test_trace_allocations(self):
+        class Allocating(Component):
+            template = "{{ items|length }}"
+
+            def get_context_data(self):
+                return {"items": [object() for _ in range(10_000)]}
+
+        with profile_render(trace_allocations=True) as profiler:
+            Allocating.render()
+
+        stat = next(stat for stat in profiler.stats() if stat.phase == "get_context_data")
+        self.assertGreater(stat.allocated, 100_000)
+
+    def test_collapsed_stacks(self):
+        _, Outer = self._make_components()
+
+        with profile_render() as profiler:
+            Outer.render()
+
+        lines = profiler.to_collapsed_stacks().splitlines()
+        stacks = {line.rsplit(" ", 1)[0]: int(line.rsplit(" ", 1)[1]) for line in lines}
+        self.assertIn("Outer;render_template", stacks)
+        self.assertIn("Outer;inner;render_slot(content)", stacks)
+        # Both renders of Inner are merged into a single stack
+        self.assertEqual(len(lines), len(stacks))
+        self.assertGreaterEqual(stacks["Outer;inner;get_context_data"], 20_000)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "render.txt")
+            profiler.write_collapsed_stacks(path)
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(file.read(), profiler.to_collapsed_stacks())
+
+    async def test_async_components(self):
+        @register("user")
+        class UserComponent(Component):
+            template = "<li>{{ user_id }}</li>"
+
+            async def get_context_data(self, user_id):
+                await asyncio.sleep(0.01)
+                return {"user_id": user_id}
+
+        class Outer(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <ul>
+                    {% component "user" user_id=1 / %}
+                    {% component "user" user_id=2 / %}
+                </ul>
+            """
+
+        with profile_render() as profiler:
+            await Outer.arender()
+
+        user_data = [
+            record
+            for record in profiler.records
+            if record.component_class is UserComponent and record.phase == "get_context_data"
+        ]
+        self.assertEqual(len(user_data), 2)
+        for record in user_data:
+            self.assertGreaterEqual(record.duration, 0.01)
+            self.assertEqual(record.component_path, ("Outer", "user"))
@@ -1,3 +1,6 @@
+import json
+from pathlib import Path
+from typing import Any, Union
 from unittest import skip
 
 from django.template import Context, Template, TemplateSyntaxError
@@ -2636,6 +2639,49 @@ class TagParserTests(BaseTestCase):
         self.assertEqual(attrs, expected_attrs)
 
 
+# The tags, and how they were parsed by the previous implementation of `parse_tag()`,
+# which walked the tag text character by character. The tags were randomly put together
+# from fragments of tags, so they include also invalid and incomplete tags.
+FUZZ_CASES_PATH = Path(__file__).parent / "tag_parser_fuzz_cases.json"
+
+
+class TagParserFuzzTests(BaseTestCase):
+    def _serialize_value(self, value: Union[TagValueStruct, TagValue]) -> Any:
+        if isinstance(value, TagValueStruct):
+            return {
+                "type": value.type,
+                "spread": value.spread,
+                "entries": [self._serialize_value(entry) for entry in value.entries],
+            }
+        return [[part.value, part.quoted, part.spread, part.translation, part.filter] for part in value.parts]
+
+    def _parse(self, text: str) -> Any:
+        try:
+            name, attrs = parse_tag(text, None)
+        except Exception as err:
+            return {"error": [type(err).__name__, str(err)]}
+        return {
+            "name": name,
+            "attrs": [[attr.key, attr.start_index, self._serialize_value(attr.value)] for attr in attrs],
+        }
+
+    def _assert_cases(self, group: str) -> None:
+        with FUZZ_CASES_PATH.open(encoding="utf-8") as file:
+            cases = json.load(file)[group]
+
+        for text, expected in cases:
+            self.assertEqual(self._parse(text), expected, f"Tag: {text!r}")
+
+    def test_valid_tags(self):
+        self._assert_cases("valid")
+
+    def test_mutated_tags(self):
+        self._assert_cases("mutated")
+
+    def test_random_fragments(self):
+        self._assert_cases("random")
+
+
 class ResolverTests(BaseTestCase):
     def test_resolve_simple(self):
         _, attrs = parse_tag("123", None)
@@ -2671,6 +2717,35 @@ class ResolverTests(BaseTestCase):
         resolved = attrs[0].value.resolve(context)
         self.assertEqual(resolved, {"key": "foo", "bar": "baz", "key3": "baz"})
 
+    def test_resolve_literal_returns_copies(self):
+        _, attrs = parse_tag('{"a": [1, 2], "b": {"c": "d"}, **{"e": 3}}', None)
+        value = attrs[0].value
+
+        resolved1 = value.resolve(Context())
+        self.assertTrue(value.is_literal)
+        self.assertEqual(resolved1, {"a": [1, 2], "b": {"c": "d"}, "e": 3})
+
+        # Modifying the resolved value, including the nested lists and dicts,
+        # must not change the value resolved next time
+        resolved1["a"].append(3)
+        resolved1["b"]["c"] = "x"
+        resolved1["f"] = 4
+
+        resolved2 = value.resolve(Context())
+        self.assertEqual(resolved2, {"a": [1, 2], "b": {"c": "d"}, "e": 3})
+        self.assertIsNot(resolved1, resolved2)
+
+    def test_resolve_literal_mixed_with_variables(self):
+        _, attrs = parse_tag('{"a": [1, 2], "b": [1, val], "c": "d"|upper}', _get_parser())
+        value = attrs[0].value
+
+        resolved = value.resolve(Context({"val": "foo"}))
+        self.assertFalse(value.is_literal)
+        self.assertEqual(resolved, {"a": [1, 2], "b": [1, "foo"], "c": "D"})
+
+        resolved = value.resolve(Context({"val": "bar"}))
+        self.assertEqual(resolved, {"a": [1, 2], "b": [1, "bar"], "c": "D"})
+
     def test_resolve_dynamic_expr(self):
         parser = _get_parser()
         _, attrs = parse_tag("'{% lorem 4 w %}'", parser)
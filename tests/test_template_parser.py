@@ -1,7 +1,10 @@
-from django.template import Context
-from django.template.base import Template, Token, TokenType
+from unittest.mock import patch
+
+from django.template import Context, Engine, TemplateSyntaxError
+from django.template.base import DebugLexer, Lexer, Template, Token, TokenType
 
 from django_components import Component, register, types
+from django_components.util import django_monkeypatch
 from django_components.util.template_parser import parse_template
 
 from .django_test_setup import setup_test_config
@@ -203,6 +206,80 @@ class TemplateParserTests(BaseTestCase):
 
         self.assertEqual(token_tuples, expected_tokens)
 
+    def test_template_tag_unterminated_string(self):
+        with self.assertRaisesMessage(TemplateSyntaxError, "Unexpected end of text - unterminated ' string"):
+            parse_template("{% component 'my_comp %}")
+
+    def test_template_tag_unterminated_string_has_position(self):
+        with self.assertRaises(TemplateSyntaxError) as cm:
+            parse_template("Hello\n{% component 'my_comp %}", debug=False)
+
+        self.assertEqual(token2tuple(cm.exception.token), (TokenType.BLOCK, "component 'my_comp", (6, 30), 2))
+
+    def test_template_tag_unterminated_string_in_verbatim(self):
+        tokens = parse_template("{% verbatim %}{% component 'my_comp %}{% endverbatim %}")
+
+        token_tuples = [token2tuple(token) for token in tokens]
+        expected_tokens = [
+            (TokenType.BLOCK, "verbatim", (0, 14), 1),
+            (TokenType.TEXT, "{% component 'my_comp %}", (14, 38), 1),
+            (TokenType.BLOCK, "endverbatim", (38, 55), 1),
+        ]
+
+        self.assertEqual(token_tuples, expected_tokens)
+
+    def test_lineno_after_quoted_tags(self):
+        tokens = parse_template(
+            """{% component 'a' text="%}" %}
+            {% component 'b' text="one
+            two %}" %}
+            {% component 'c' %}
+            {{ var }}"""
+        )
+
+        token_tuples = [(token.token_type, token.contents, token.lineno) for token in tokens]
+        expected_tokens = [
+            (TokenType.BLOCK, "component 'a' text=\"%}\"", 1),
+            (TokenType.TEXT, "\n            ", 1),
+            (TokenType.BLOCK, "component 'b' text=\"one\n            two %}\"", 2),
+            (TokenType.TEXT, "\n            ", 3),
+            (TokenType.BLOCK, "component 'c'", 4),
+            (TokenType.TEXT, "\n            ", 4),
+            (TokenType.VAR, "var", 5),
+        ]
+
+        self.assertEqual(token_tuples, expected_tokens)
+
+    def test_no_debug(self):
+        tokens = parse_template("Hello {{ name }}{% component 'my_comp' key='%}' %}", debug=False)
+
+        token_tuples = [(token.token_type, token.contents, token.position, token.lineno) for token in tokens]
+        expected_tokens = [
+            (TokenType.TEXT, "Hello ", None, 1),
+            (TokenType.VAR, "name", None, 1),
+            (TokenType.BLOCK, "component 'my_comp' key='%}'", None, 1),
+        ]
+
+        self.assertEqual(token_tuples, expected_tokens)
+
+    # Templates without `%}` inside of quoted strings must be tokenized the same as with Django's lexers
+    def test_same_as_django_lexer(self):
+        template = """
+            {% extends "base.html" %}
+            {% block content %}{# comment #}
+                {% for item in items %}<div class="{{ item.class }}">{{ item.name|default:50 }}%</div>{% endfor %}
+                {% verbatim %}{% if %}{{ x }}{% endverbatim %}
+                {% if a %%} { {% } %} {{ x }
+                {% endif %}
+            {% endblock %}
+        """
+
+        def to_tuples(tokens):
+            return [(token.token_type, token.contents, token.position, token.lineno) for token in tokens]
+
+        self.assertEqual(to_tuples(parse_template(template)), to_tuples(DebugLexer(template).tokenize()))
+        self.assertEqual(to_tuples(parse_template(template, debug=False)), to_tuples(Lexer(template).tokenize()))
+
     # Check that a template that contains `{% %}` inside of a component tag is parsed correctly
     def test_component_mixed(self):
         @register("test")
@@ -245,3 +322,29 @@ class TemplateParserTests(BaseTestCase):
             </div>
             """,
         )
+
+    def test_template_compiled_without_positions_if_not_debug(self):
+        template_str = "{% if True %}{{ value }}{% endif %}"
+
+        with patch.object(django_monkeypatch, "parse_template", wraps=parse_template) as parse_template_spy:
+            template = Template(template_str, engine=Engine(debug=False))
+            parse_template_spy.assert_called_once_with(template_str, debug=False)
+            self.assertIsNone(template.nodelist[0].token.position)
+
+            template = Template(template_str, engine=Engine(debug=True))
+            parse_template_spy.assert_called_with(template_str, debug=True)
+            self.assertEqual(template.nodelist[0].token.position, (0, 13))
+
+        self.assertEqual(template.render(Context({"value": 123})), "123")
+
+    def test_template_lexing_error_annotated_if_debug(self):
+        template_str = "Hello\n{% if 'value %}"
+
+        with self.assertRaises(TemplateSyntaxError) as cm:
+            Template(template_str, engine=Engine(debug=True))
+        self.assertEqual(cm.exception.template_debug["line"], 2)
+        self.assertEqual(cm.exception.template_debug["during"], "{% if 'value %}")
+
+        with self.assertRaises(TemplateSyntaxError) as cm:
+            Template(template_str, engine=Engine(debug=False))
+        self.assertFalse(hasattr(cm.exception, "template_debug"))
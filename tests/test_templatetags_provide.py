@@ -3,7 +3,7 @@ from typing import Any
 from django.template import Context, Template, TemplateSyntaxError
 
 from django_components import Component, register, types
-from django_components.perfutil.provide import provide_cache, provide_references, all_reference_ids
+from django_components.perfutil.render_session import get_render_session, get_render_session_stats, render_session_var
 
 from .django_test_setup import setup_test_config
 from .testutils import BaseTestCase, parametrize_context_behavior
@@ -11,11 +11,21 @@ from .testutils import BaseTestCase, parametrize_context_behavior
 setup_test_config({"autodiscover": False})
 
 
-class ProvideTemplateTagTest(BaseTestCase):
+class ProvideBaseTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self._leaked_entries_before = get_render_session_stats().leaked_entries
+
+    # The provided data must be removed once no components reference it,
+    # and NOT only once the render session is released.
     def _assert_clear_cache(self):
-        self.assertEqual(provide_cache, {})
-        self.assertEqual(provide_references, {})
-        self.assertEqual(all_reference_ids, set())
+        self.assertIsNone(render_session_var.get())
+        leaked_entries = get_render_session_stats().leaked_entries
+        for store in ["provide_cache", "provide_references", "all_reference_ids"]:
+            self.assertEqual(leaked_entries.get(store, 0), self._leaked_entries_before.get(store, 0))
+
+
+class ProvideTemplateTagTest(ProvideBaseTestCase):
 
     @parametrize_context_behavior(["django", "isolated"])
     def test_provide_basic(self):
@@ -655,11 +665,7 @@ class ProvideTemplateTagTest(BaseTestCase):
         self._assert_clear_cache()
 
 
-class InjectTest(BaseTestCase):
-    def _assert_clear_cache(self):
-        self.assertEqual(provide_cache, {})
-        self.assertEqual(provide_references, {})
-        self.assertEqual(all_reference_ids, set())
+class InjectTest(ProvideBaseTestCase):
 
     @parametrize_context_behavior(["django", "isolated"])
     def test_inject_basic(self):
@@ -928,11 +934,7 @@ class InjectTest(BaseTestCase):
 #
 # Instead, we manage the state ourselves, and remove the cache entry
 # when the component rendered is done.
-class ProvideCacheTest(BaseTestCase):
-    def _assert_clear_cache(self):
-        self.assertEqual(provide_cache, {})
-        self.assertEqual(provide_references, {})
-        self.assertEqual(all_reference_ids, set())
+class ProvideCacheTest(ProvideBaseTestCase):
 
     def test_provide_outside_component(self):
         tester = self
@@ -946,7 +948,7 @@ class ProvideCacheTest(BaseTestCase):
             """
 
             def get_context_data(self):
-                tester.assertEqual(len(provide_cache), 1)
+                tester.assertEqual(len(get_render_session().provide_cache), 1)
 
                 data = self.inject("my_provide")
                 return {"data": data, "ran": True}
@@ -987,7 +989,7 @@ class ProvideCacheTest(BaseTestCase):
             template = ""
 
             def get_context_data(self):
-                tester.assertEqual(len(provide_cache), 1)
+                tester.assertEqual(len(get_render_session().provide_cache), 1)
                 data = self.inject("my_provide")
 
                 raise ValueError("Oops")
@@ -1022,7 +1024,7 @@ class ProvideCacheTest(BaseTestCase):
             """
 
             def get_context_data(self):
-                tester.assertEqual(len(provide_cache), 1)
+                tester.assertEqual(len(get_render_session().provide_cache), 1)
 
                 data = self.inject("my_provide")
                 return {"data": data, "ran": True}
@@ -1061,7 +1063,7 @@ class ProvideCacheTest(BaseTestCase):
             template = ""
 
             def get_context_data(self):
-                tester.assertEqual(len(provide_cache), 1)
+                tester.assertEqual(len(get_render_session().provide_cache), 1)
 
                 data = self.inject("my_provide")
                 raise ValueError("Oops")
@@ -1,3 +1,10 @@
+import logging
+
+from django.template import Context, Template
+
+from django_components import Component, registry, types
+from django_components.util.context import snapshot_context
+from django_components.util.logger import is_trace_enabled, logger, trace_component_msg
 from django_components.util.misc import is_str_wrapped_in_quotes
 
 from .django_test_setup import setup_test_config
@@ -18,3 +25,194 @@ class UtilsTest(BaseTestCase):
         self.assertEqual(is_str_wrapped_in_quotes(""), False)
         self.assertEqual(is_str_wrapped_in_quotes('""'), True)
         self.assertEqual(is_str_wrapped_in_quotes("\"'"), False)
+
+
+class SnapshotContextTest(BaseTestCase):
+    def test_snapshot_is_not_affected_by_later_changes(self):
+        ctx = Context({"a": 1})
+        with ctx.update({"b": 2}):
+            with ctx.update({"c": 3}):
+                snapshot = snapshot_context(ctx)
+
+            ctx["b"] = "changed"
+            ctx["d"] = 4
+        ctx["a"] = "changed"
+
+        self.assertEqual(snapshot["a"], 1)
+        self.assertEqual(snapshot["b"], 2)
+        self.assertEqual(snapshot["c"], 3)
+        self.assertNotIn("d", snapshot)
+
+        self.assertEqual(ctx["a"], "changed")
+        self.assertNotIn("b", ctx)
+
+    def test_layers_of_plain_context_are_copied(self):
+        ctx = Context({"a": 1})
+        with ctx.update({"b": 2}):
+            dicts = ctx.dicts.copy()
+            snapshot = snapshot_context(ctx)
+
+            # The original Context is left as it was
+            self.assertEqual(ctx.dicts, dicts)
+            for layer, orig_layer in zip(snapshot.dicts, ctx.dicts):
+                self.assertIsNot(layer, orig_layer)
+
+            ctx.set_upward("a", "changed")
+
+        self.assertEqual(snapshot["a"], 1)
+
+    def test_layers_of_snapshot_are_shared_until_written(self):
+        ctx = Context({"a": 1})
+        with ctx.update({"b": 2}):
+            snapshot = snapshot_context(ctx)
+        with snapshot.update({"c": 3}):
+            child1 = snapshot_context(snapshot)
+            child2 = snapshot_context(snapshot)
+
+            # Only the topmost layer is copied, the rest is shared
+            self.assertIs(child1.dicts[1], snapshot.dicts[1])
+            self.assertIs(child2.dicts[1], snapshot.dicts[1])
+            self.assertIsNot(child1.dicts[-1], snapshot.dicts[-1])
+
+        # Write from the original Context
+        snapshot["b"] = "changed"
+        self.assertEqual(snapshot["b"], "changed")
+        self.assertEqual(child1["b"], 2)
+        self.assertEqual(child2["b"], 2)
+        self.assertIs(child1.dicts[2], child2.dicts[2])
+
+        # Write from a snapshot
+        child1.set_upward("a", "child1")
+        self.assertEqual(child1["a"], "child1")
+        self.assertEqual(child2["a"], 1)
+        self.assertEqual(snapshot["a"], 1)
+        self.assertIs(child2.dicts[1], snapshot.dicts[1])
+
+    def test_snapshot_sees_its_own_writes(self):
+        ctx = Context({"a": 1})
+        with ctx.update({"b": 2}):
+            with ctx.update({"c": 3}):
+                snapshot = snapshot_context(ctx)
+        with snapshot.update({"d": 4}):
+            child = snapshot_context(snapshot)
+
+        child.set_upward("a", "child")
+        child.set_upward("b", "child")
+        del child["d"]
+        child["c"] = "child"
+
+        self.assertEqual(child["a"], "child")
+        self.assertEqual(child["b"], "child")
+        self.assertEqual(child["c"], "child")
+        self.assertNotIn("d", child)
+
+        self.assertEqual(snapshot["a"], 1)
+        self.assertEqual(snapshot["b"], 2)
+        self.assertEqual(snapshot["c"], 3)
+        self.assertEqual(ctx["a"], 1)
+
+    def test_snapshot_of_snapshot(self):
+        ctx = Context({"a": 1})
+        with ctx.update({"b": 2}):
+            snapshot1 = snapshot_context(ctx)
+        with snapshot1.update({"c": 3}):
+            snapshot2 = snapshot_context(snapshot1)
+
+        ctx.dicts[1]["a"] = "changed"
+        snapshot1["b"] = "changed"
+
+        self.assertEqual(snapshot1["a"], 1)
+        self.assertEqual(snapshot2["a"], 1)
+        self.assertEqual(snapshot2["b"], 2)
+        self.assertEqual(snapshot2["c"], 3)
+
+    def test_cycle_in_component_sets_variable_from_outer_context(self):
+        class CycleComponent(Component):
+            template: types.django_html = """
+                {% for i in "123" %}{% cycle "a" "b" as foo silent %}[{{ foo }}]{% endfor %}
+            """
+
+        class OuterComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                {% with foo="y" %}{% component "cycle" / %}{% endwith %}
+            """
+
+        registry.register("cycle", CycleComponent)
+        registry.register("outer", OuterComponent)
+
+        template_str: types.django_html = """
+            {% load component_tags %}
+            {% with foo="x" %}{% component "cycle" / %}|{{ foo }}{% endwith %}
+        """
+        template = Template(template_str)
+        rendered = template.render(Context({}))
+        self.assertIn("[a][b][a]", rendered)
+        # The variable is set in the component's Context, not in the Context of the template
+        self.assertIn("|x", rendered)
+
+        # Nested component, whose outer Context is a snapshot
+        template_str = """
+            {% load component_tags %}
+            {% component "outer" / %}
+        """
+        template = Template(template_str)
+        rendered = template.render(Context({}))
+        self.assertIn("[a][b][a]", rendered)
+
+    def test_forloop_state_is_copied(self):
+        ctx = Context({"items": [1, 2]})
+
+        # ForNode modifies the forloop dicts in place, so we do the same here
+        outer_loop = {"parentloop": {}, "counter": 1}
+        with ctx.push(forloop=outer_loop, outer=1):
+            inner_loop = {"parentloop": outer_loop, "counter": 1}
+            with ctx.push(forloop=inner_loop, inner=1):
+                with ctx.update({"x": 1}):
+                    snapshot = snapshot_context(ctx)
+                inner_loop["counter"] = 2
+                outer_loop["counter"] = 2
+
+        self.assertEqual(snapshot["forloop"]["counter"], 1)
+        self.assertEqual(snapshot["forloop"]["parentloop"]["counter"], 1)
+
+
+class TraceLoggingTest(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self._orig_level = logger.level
+
+    def tearDown(self):
+        logger.setLevel(self._orig_level)
+        super().tearDown()
+
+    def test_is_trace_enabled_follows_logger_level(self):
+        logger.setLevel(logging.DEBUG)
+        self.assertFalse(is_trace_enabled())
+
+        logger.setLevel(5)
+        self.assertTrue(is_trace_enabled())
+
+    def test_message_not_built_when_disabled(self):
+        class Fills(dict):
+            def keys(self):
+                raise AssertionError("Fills should not be formatted")
+
+        logger.setLevel(logging.DEBUG)
+        trace_component_msg("RENDER", "comp", "a1b2c3", None, slot_fills=Fills(a=1))
+
+    def test_render_emits_trace_messages(self):
+        class SimpleComponent(Component):
+            template: types.django_html = """
+                {% load component_tags %}
+                <div>{% slot "content" default / %}</div>
+            """
+
+        logger.setLevel(5)
+        with self.assertLogs(logger, level=5) as logs:
+            SimpleComponent.render(slots={"content": "hello"})
+
+        messages = [record.getMessage() for record in logs.records]
+        self.assertTrue(any(msg.startswith("COMP_RENDER_START COMPONENT: 'SimpleComponent'") for msg in messages))
+        self.assertTrue(any(msg.startswith("RENDER_SLOT_START COMPONENT: 'SimpleComponent'") for msg in messages))
+        self.assertTrue(any(msg.startswith("RENDER NODE slot") for msg in messages))
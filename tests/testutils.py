@@ -39,7 +39,12 @@ class BaseTestCase(SimpleTestCase):
         if component_media_cache:
             component_media_cache.clear()
 
+        from django_components.dependencies import content_hashes
+
+        content_hashes.clear()
+
         from django_components.component import component_node_subclasses_by_name
+
         component_node_subclasses_by_name.clear()
 
     # Mock the `generate` function used inside `gen_id` so it returns deterministic IDs
@@ -191,7 +196,12 @@ def parametrize_context_behavior(cases: List[ContextBehParam], settings: Optiona
                 if component_media_cache:
                     component_media_cache.clear()
 
+                from django_components.dependencies import content_hashes
+
+                content_hashes.clear()
+
                 from django_components.component import component_node_subclasses_by_name
+
                 component_node_subclasses_by_name.clear()
 
                 case_has_data = not isinstance(case, str)